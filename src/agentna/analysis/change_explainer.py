@@ -115,6 +115,7 @@ class ChangeExplainer:
                 prompt=prompt,
                 system=SYSTEM_PROMPT,
                 max_tokens=1000,
+                temperature=0,
             )
         except Exception:
             explanation_text = self._generate_fallback_explanation(file_paths, impact)
@@ -175,6 +176,7 @@ class ChangeExplainer:
                 prompt=prompt,
                 system=SYSTEM_PROMPT,
                 max_tokens=1000,
+                temperature=0,
             )
         except Exception:
             explanation_text = self._generate_fallback_explanation(file_paths, impact)
@@ -57,7 +57,7 @@ class ImpactAnalyzer:
 
         # Get all symbols in changed files
         for file_path in file_paths:
-            nodes = self.store.graph.get_nodes_by_file(file_path)
+            nodes = self.store.graph.get_node_views_by_file(file_path)
             for node in nodes:
                 changed_symbols.add(node.id)
 
@@ -70,9 +70,9 @@ class ImpactAnalyzer:
                 transitively_affected.update(set(trans_deps) - set(deps) - {node.id})
 
         # Get affected files
-        for symbol_id in directly_affected | transitively_affected:
-            node = self.store.graph.get_node(symbol_id)
-            if node and node.file_path and node.file_path not in file_paths:
+        affected = self.store.graph.get_node_views(directly_affected | transitively_affected)
+        for node in affected.values():
+            if node.file_path and node.file_path not in file_paths:
                 affected_files.add(node.file_path)
 
         # Calculate impact score
@@ -130,9 +130,8 @@ class ImpactAnalyzer:
         """
         # Get file paths from symbols
         file_paths: set[str] = set()
-        for symbol_id in symbol_ids:
-            node = self.store.graph.get_node(symbol_id)
-            if node and node.file_path:
+        for node in self.store.graph.get_node_views(symbol_ids).values():
+            if node.file_path:
                 file_paths.add(node.file_path)
 
         return self.analyze_files(list(file_paths), max_depth)
@@ -157,17 +156,16 @@ class ImpactAnalyzer:
         chains: list[list[str]] = []
 
         if direction == "dependents":
-            dependents = self.store.graph.get_dependents(symbol_id, max_depth)
-            for dep in dependents:
-                path = self.store.graph.find_path(symbol_id, dep)
-                if path:
-                    chains.append(path)
+            targets = self.store.graph.get_dependents(symbol_id, max_depth)
         else:
-            dependencies = self.store.graph.get_dependencies(symbol_id, max_depth)
-            for dep in dependencies:
-                path = self.store.graph.find_path(symbol_id, dep)
-                if path:
-                    chains.append(path)
+            targets = self.store.graph.get_dependencies(symbol_id, max_depth)
+
+        # One search from the symbol finds the path to every target
+        paths = self.store.graph.find_paths(symbol_id, targets)
+        for dep in targets:
+            path = paths.get(dep)
+            if path:
+                chains.append(path)
 
         return chains
 
@@ -189,13 +187,14 @@ class ImpactAnalyzer:
         critical_paths: list[dict] = []
 
         for file_path in file_paths:
-            nodes = self.store.graph.get_nodes_by_file(file_path)
+            nodes = self.store.graph.get_node_views_by_file(file_path)
             for node in nodes:
-                dependents = self.store.graph.get_dependents(node.id, max_depth=5)
-                for dep in dependents[:max_paths]:
-                    path = self.store.graph.find_path(node.id, dep)
+                dependents = self.store.graph.get_dependents(node.id, max_depth=5)[:max_paths]
+                paths = self.store.graph.find_paths(node.id, dependents)
+                for dep in dependents:
+                    path = paths.get(dep)
                     if path and len(path) > 1:
-                        dep_node = self.store.graph.get_node(dep)
+                        dep_node = self.store.graph.get_node_view(dep)
                         critical_paths.append({
                             "source": node.id,
                             "target": dep,
@@ -11,6 +11,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Callable
 
+from pydantic import TypeAdapter
+
 from agentna.core.config import LLMConfig
 from agentna.llm import LLMRouter
 from agentna.memory.knowledge_graph import KnowledgeGraph
@@ -33,6 +35,10 @@ Respond in this EXACT JSON format (no markdown, just JSON):
   "purpose": "Why this exists / business purpose"
 }}"""
 
+# Decodes and encodes the summaries file in one pydantic-core pass instead of
+# parsing to dicts and validating each summary from Python
+_SUMMARIES_ADAPTER = TypeAdapter(list[SymbolSummary])
+
 
 class SymbolAnalyzer:
     """Analyzes code symbols and generates pre-computed summaries.
@@ -74,18 +80,17 @@ class SymbolAnalyzer:
         """Load existing summaries from disk."""
         if self.summaries_path.exists():
             try:
-                data = json.loads(self.summaries_path.read_text())
-                for item in data:
-                    summary = SymbolSummary(**item)
-                    self._summaries[summary.id] = summary
+                summaries = _SUMMARIES_ADAPTER.validate_json(self.summaries_path.read_bytes())
+                self._summaries = {summary.id: summary for summary in summaries}
             except Exception:
                 self._summaries = {}
 
     def _save_summaries(self) -> None:
         """Save summaries to disk."""
         self.summaries_path.parent.mkdir(parents=True, exist_ok=True)
-        data = [s.model_dump(mode="json") for s in self._summaries.values()]
-        self.summaries_path.write_text(json.dumps(data, indent=2, default=str))
+        self.summaries_path.write_bytes(
+            _SUMMARIES_ADAPTER.dump_json(list(self._summaries.values()), indent=2)
+        )
 
     def analyze_chunk(self, chunk: CodeChunk, force: bool = False) -> SymbolSummary | None:
         """
@@ -158,6 +163,7 @@ class SymbolAnalyzer:
                     prompt,
                     system="You are a code analyzer. Respond only with valid JSON.",
                     max_tokens=200,
+                    temperature=0,
                 )
 
                 # Parse JSON response
@@ -17,6 +17,8 @@ GRAPH_FILE = "graph.json"
 DECISIONS_FILE = "decisions.json"
 CONVENTIONS_FILE = "conventions.json"
 FILE_HASHES_FILE = "file_hashes.json"
+FILE_STATS_FILE = "file_stats.json"
+EMBEDDING_CACHE_FILE = "embeddings_cache.db"
 LAST_SYNC_FILE = "last_sync.json"
 
 # Global config
@@ -99,25 +101,60 @@ MAX_FILE_SIZE_KB = 500
 MAX_CHUNK_SIZE_CHARS = 4000
 MIN_CHUNK_SIZE_CHARS = 100
 
+# Indexing settings
+INDEX_HASH_WORKERS = 8  # Changed files hashed at once during incremental sync
+HASH_CACHE_RACY_WINDOW_S = 2.0  # Files modified this close to being hashed are hashed again
+
 # Embedding settings
 EMBEDDING_DIMENSION = 768  # nomic-embed-text
 EMBEDDING_MODEL = "nomic-embed-text"
+DEFAULT_EMBED_CONCURRENCY = 8  # In-flight embedding requests per provider
+EMBED_MAX_BATCH = 64  # Texts coalesced into one embedding request
+EMBED_MAX_WAIT_MS = 25  # How long a partial embedding batch waits for more texts
 
 # LLM defaults
 DEFAULT_OLLAMA_MODEL = "llama3.2"
 DEFAULT_OLLAMA_HOST = "http://localhost:11434"
+AVAILABILITY_CACHE_TTL_S = 30.0  # How long a provider availability probe is reused
+LLM_RESPONSE_CACHE_SIZE = 256  # Deterministic completions kept in memory
 
 # ChromaDB settings
 CHROMA_COLLECTION_CODE = "code_chunks"
 CHROMA_COLLECTION_DOCS = "documentation"
 CHROMA_COLLECTION_DECISIONS = "decisions"
+QUERY_EMBEDDING_CACHE_SIZE = 512  # Query embeddings kept in memory per store
+DOCUMENT_EMBED_BATCH_SIZE = 128  # Documents per embedding function call
+CHROMA_UPSERT_BATCH_SIZE = 1024  # Rows per Chroma upsert request
+INDEX_BATCH_SIZE = 2000  # Chunks embedded and stored per slice when indexing many at once
+SEARCH_CACHE_SIZE = 256  # Recent searches whose results can be reused
+SEARCH_CACHE_SIMILARITY = 0.97  # Cosine similarity needed to reuse a search
+SEARCH_CACHE_TTL_S = 60.0  # Bounds staleness when another process updates the index
+CHUNK_CACHE_SIZE = 1024  # Recently fetched or searched chunks kept in memory
+CHUNK_CACHE_TTL_S = 60.0  # Bounds staleness when another process updates the index
+COLLECTION_COUNT_TTL_S = 30.0  # How long a collection row count is reused
+EMBEDDING_CACHE_PRECISION = "fp32"  # Storage format of cached vectors: fp32, bf16 or int8
+
+# MCP server settings
+MCP_STATUS_CACHE_TTL_S = 5.0  # How long project status and index statistics are reused
+SYNC_MTIME_MARGIN_S = 2.0  # Allowance for coarse file mtimes when skipping an unchanged sync
 
 # Watcher settings
 DEFAULT_DEBOUNCE_MS = 1000
 DEFAULT_WATCH_RECURSIVE = True
+WATCHER_DECISION_CACHE_SIZE = 8192  # Paths whose ignore/include decision the watcher remembers
+WATCHER_INDEX_WORKERS = 8  # Changed files the watcher indexes at once
+
+# Git settings
+GIT_COMMIT_CACHE_SIZE = 2048  # Converted commits (info plus diff) kept per process
 
 # Graph settings
 GRAPH_MAX_DEPTH = 10
+GRAPH_WAL_SUFFIX = ".wal"  # Appended to the graph file name for its write-ahead log
+GRAPH_WAL_MAX_RECORDS = 50_000  # Log records replayed at most before a snapshot is forced
+GRAPH_TRAVERSAL_CACHE_SIZE = 4096  # Dependent/dependency traversals memoized per graph
+GRAPH_CSR_MIN_EDGES = 50_000  # Edge count above which traversals use array adjacency
+GRAPH_CSR_REBUILD_QUERIES = 8  # Lookups on an unchanged graph before its stale CSR is rebuilt
+GRAPH_GPU_MIN_NODES = 50_000  # Node count above which impact traversals use cuGraph if installed
 
 # Language mappings
 LANGUAGE_EXTENSIONS = {
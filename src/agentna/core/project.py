@@ -18,6 +18,7 @@ from agentna.core.constants import (
     CONVENTIONS_FILE,
     DECISIONS_FILE,
     FILE_HASHES_FILE,
+    FILE_STATS_FILE,
     GRAPH_FILE,
     HISTORY_DIR,
     INDEX_DIR,
@@ -49,6 +50,7 @@ class Project:
 
         self._config: ProjectConfig | None = None
         self._ignore_spec: pathspec.PathSpec | None = None
+        self._include_spec: pathspec.PathSpec | None = None
 
     @property
     def name(self) -> str:
@@ -119,6 +121,11 @@ class Project:
         """Path to file hashes for incremental indexing."""
         return self.index_dir / FILE_HASHES_FILE
 
+    @property
+    def file_stats_path(self) -> Path:
+        """Path to the file stat signatures that let unchanged files skip hashing."""
+        return self.index_dir / FILE_STATS_FILE
+
     @property
     def last_sync_path(self) -> Path:
         """Path to last sync metadata."""
@@ -167,6 +174,9 @@ class Project:
     def reload_config(self) -> None:
         """Reload configuration from disk."""
         self._config = ProjectConfig.load(self.config_path)
+        # The pattern specs are built from the config
+        self._ignore_spec = None
+        self._include_spec = None
 
     def save_config(self) -> None:
         """Save current configuration to disk."""
@@ -212,6 +222,23 @@ class Project:
 
         return self._ignore_spec.match_file(str(rel_path))
 
+    def should_ignore_dir(self, path: Path | str) -> bool:
+        """Check if a directory, and everything under it, should be ignored."""
+        if self._ignore_spec is None:
+            self._ignore_spec = self._build_ignore_spec()
+
+        path = Path(path)
+        if path.is_absolute():
+            try:
+                rel_path = path.relative_to(self.root)
+            except ValueError:
+                return True
+        else:
+            rel_path = path
+
+        # Directory patterns such as "node_modules/" only match with the slash
+        return self._ignore_spec.match_file(f"{rel_path}/")
+
     def should_include(self, path: Path | str) -> bool:
         """Check if a file should be included based on include patterns."""
         path = Path(path)
@@ -223,10 +250,11 @@ class Project:
         else:
             rel_path = path
 
-        include_spec = pathspec.PathSpec.from_lines(
-            "gitwildmatch", self.config.indexing.include_patterns
-        )
-        return include_spec.match_file(str(rel_path))
+        if self._include_spec is None:
+            self._include_spec = pathspec.PathSpec.from_lines(
+                "gitwildmatch", self.config.indexing.include_patterns
+            )
+        return self._include_spec.match_file(str(rel_path))
 
     def iter_files(self) -> Iterator[Path]:
         """Iterate over all files that should be indexed."""
@@ -260,6 +288,46 @@ class Project:
 
                 yield file_path
 
+    def max_source_mtime(self) -> float:
+        """
+        Get the newest modification time among the project's source files.
+
+        Walks the same directories and files as ``iter_files``. Directory
+        mtimes are included so deleted and renamed files are noticed, as are
+        the config and ignore files that decide what gets indexed.
+
+        Returns:
+            Largest st_mtime found, or 0.0 for an empty project
+        """
+        newest = 0.0
+        for path in (self.config_path, self.root / ".gitignore", self.root / ".agentnaignore"):
+            try:
+                newest = max(newest, path.stat().st_mtime)
+            except OSError:
+                pass
+
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                newest = max(newest, directory.stat().st_mtime)
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+
+            for entry in entries:
+                rel_path = Path(entry.path).relative_to(self.root)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and not self.should_ignore(rel_path):
+                            stack.append(Path(entry.path))
+                    elif not self.should_ignore(rel_path) and self.should_include(rel_path):
+                        newest = max(newest, entry.stat().st_mtime)
+                except OSError:
+                    continue
+
+        return newest
+
     def get_file_hashes(self) -> dict[str, str]:
         """Load stored file hashes for incremental indexing."""
         if self.file_hashes_path.exists():
@@ -272,8 +340,26 @@ class Project:
         with open(self.file_hashes_path, "w") as f:
             json.dump(hashes, f, indent=2)
 
-    def update_sync_time(self, full: bool = False) -> None:
-        """Update the last sync timestamp."""
+    def get_file_stats(self) -> dict[str, list[int | str]]:
+        """Load the stat signature and hash recorded for each file."""
+        if self.file_stats_path.exists():
+            with open(self.file_stats_path) as f:
+                return json.load(f)
+        return {}
+
+    def save_file_stats(self, stats: dict[str, list[int | str]]) -> None:
+        """Save the stat signature and hash recorded for each file."""
+        with open(self.file_stats_path, "w") as f:
+            json.dump(stats, f)
+
+    def update_sync_time(self, full: bool = False, scan_started: float | None = None) -> None:
+        """
+        Update the last sync timestamp.
+
+        Args:
+            full: Whether the sync was a full reindex
+            scan_started: Unix time at which the sync began reading files
+        """
         with open(self.last_sync_path) as f:
             data = json.load(f)
 
@@ -281,10 +367,26 @@ class Project:
         if full:
             data["last_full_sync"] = now
         data["last_incremental_sync"] = now
+        if scan_started is not None:
+            data["last_scan_started"] = scan_started
 
         with open(self.last_sync_path, "w") as f:
             json.dump(data, f, indent=2)
 
+    def get_last_scan_started(self) -> float | None:
+        """
+        Get when the last sync began reading files.
+
+        Files modified after this time may have been missed by that sync.
+
+        Returns:
+            Unix timestamp, or None if no sync has recorded one
+        """
+        if not self.last_sync_path.exists():
+            return None
+        with open(self.last_sync_path) as f:
+            return json.load(f).get("last_scan_started")
+
     def get_status(self) -> IndexStatus:
         """Get the current index status."""
         # Load sync times
@@ -303,17 +405,17 @@ class Project:
                 if f.is_file():
                     index_size += f.stat().st_size
 
-        # Load graph stats
-        graph_data = {"nodes": [], "edges": []}
-        if self.graph_path.exists():
-            with open(self.graph_path) as f:
-                graph_data = json.load(f)
+        # Count the graph with its write-ahead log replayed, since recent
+        # changes are only in the log until the next snapshot
+        from agentna.memory.knowledge_graph import KnowledgeGraph
+
+        graph = KnowledgeGraph(self.graph_path, read_only=True)
 
         return IndexStatus(
             total_files=len(file_hashes),
             total_chunks=0,  # Will be populated from ChromaDB
-            total_symbols=len(graph_data.get("nodes", [])),
-            total_relationships=len(graph_data.get("edges", [])),
+            total_symbols=graph.node_count(),
+            total_relationships=graph.edge_count(),
             last_full_sync=(
                 datetime.fromisoformat(sync_data["last_full_sync"])
                 if sync_data.get("last_full_sync")
@@ -1,5 +1,7 @@
 """Main indexer for code parsing and storage."""
 
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Callable
@@ -7,13 +9,14 @@ from typing import Callable
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from agentna.analysis.symbol_analyzer import SymbolAnalyzer
+from agentna.core.constants import INDEX_HASH_WORKERS
 from agentna.core.project import Project
 from agentna.indexing.parsers.base import BaseParser
 from agentna.indexing.parsers.generic_parser import GenericParser, MarkdownParser
 from agentna.indexing.parsers.python_parser import PythonParser
 from agentna.memory.hybrid_store import HybridStore
-from agentna.memory.models import CodeChunk, FileRecord, Relationship
-from agentna.utils.hashing import hash_file
+from agentna.memory.models import CodeChunk, CodeChunkBatch, FileRecord, Relationship
+from agentna.utils.hashing import hash_file, hash_files_cached
 
 
 class Indexer:
@@ -29,6 +32,9 @@ class Indexer:
         """
         self.project = project
         self.store = store
+        # Files may be indexed from several threads; the stored hashes are
+        # read, updated and rewritten as one file
+        self._hashes_lock = threading.Lock()
 
         # Initialize parsers
         self._parsers: list[BaseParser] = [
@@ -48,48 +54,68 @@ class Indexer:
         self,
         file_path: Path,
         force: bool = False,
-    ) -> tuple[list[CodeChunk], list[Relationship]]:
+        content_hash: str | None = None,
+    ) -> tuple[list[CodeChunk] | CodeChunkBatch, list[Relationship]]:
         """
         Index a single file.
 
         Args:
             file_path: Absolute path to the file
             force: Force re-index even if hash hasn't changed
+            content_hash: Hash of the file if the caller already computed it
 
         Returns:
-            Tuple of (chunks, relationships) created
+            Tuple of (chunks, relationships) created. Chunks of files without
+            relationships are returned as the unmaterialized batch.
         """
         # Get relative path
         rel_path = file_path.relative_to(self.project.root)
 
+        # Hash the file once; the same value is stored after indexing
+        try:
+            current_hash = content_hash or hash_file(file_path)
+        except OSError:
+            return [], []
+
         # Check if file needs indexing
         if not force:
-            stored_hashes = self.project.get_file_hashes()
-            current_hash = hash_file(file_path)
+            with self._hashes_lock:
+                stored_hashes = self.project.get_file_hashes()
             if stored_hashes.get(str(rel_path)) == current_hash:
                 return [], []  # File hasn't changed
 
-        # Read file content
+        parser = self.get_parser(file_path)
+
+        # Read and parse file content. Files without a language-specific
+        # parser are chunked straight from disk and have no relationships.
         try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
+            if parser is self._generic_parser:
+                content = None
+                batch = self._generic_parser.parse_path(file_path, rel_path)
+            else:
+                content = file_path.read_text(encoding="utf-8", errors="replace")
+                batch = parser.parse_batch(rel_path, content)
         except Exception:
             return [], []
 
         # Remove old data for this file
         self.store.remove_file(str(rel_path))
 
-        # Get parser and parse
-        parser = self.get_parser(file_path)
-        chunks = parser.parse(rel_path, content)
-        relationships = parser.extract_relationships(rel_path, content, chunks)
+        # Relationship extraction is the only step that needs chunk objects
+        chunks: list[CodeChunk] | CodeChunkBatch = batch
+        relationships: list[Relationship] = []
+        if content is not None:
+            chunks = batch.to_chunks()
+            relationships = parser.extract_relationships(rel_path, content, chunks)
 
         # Store chunks and relationships
-        self.store.index_chunks(chunks, relationships)
+        self.store.index_chunk_batch(batch, relationships)
 
         # Update file hash
-        stored_hashes = self.project.get_file_hashes()
-        stored_hashes[str(rel_path)] = hash_file(file_path)
-        self.project.save_file_hashes(stored_hashes)
+        with self._hashes_lock:
+            stored_hashes = self.project.get_file_hashes()
+            stored_hashes[str(rel_path)] = current_hash
+            self.project.save_file_hashes(stored_hashes)
 
         return chunks, relationships
 
@@ -98,6 +124,7 @@ class Indexer:
         file_paths: list[Path],
         force: bool = False,
         progress_callback: Callable[[str, int, int], None] | None = None,
+        content_hashes: dict[Path, str] | None = None,
     ) -> dict[str, int]:
         """
         Index multiple files.
@@ -106,6 +133,7 @@ class Indexer:
             file_paths: List of absolute file paths
             force: Force re-index
             progress_callback: Optional callback(file_path, current, total)
+            content_hashes: Optional already-computed hashes keyed by file path
 
         Returns:
             Statistics dictionary
@@ -118,7 +146,11 @@ class Indexer:
             if progress_callback:
                 progress_callback(str(file_path), i + 1, len(file_paths))
 
-            chunks, relationships = self.index_file(file_path, force=force)
+            chunks, relationships = self.index_file(
+                file_path,
+                force=force,
+                content_hash=content_hashes.get(file_path) if content_hashes else None,
+            )
             if chunks:
                 files_indexed += 1
                 total_chunks += len(chunks)
@@ -143,6 +175,9 @@ class Indexer:
         Returns:
             Statistics dictionary
         """
+        # Files changed after this point may be missed by this sync
+        scan_started = time.time()
+
         # Clear existing data
         self.store.clear()
         self.project.save_file_hashes({})
@@ -154,7 +189,7 @@ class Indexer:
         stats = self.index_files(files, force=True, progress_callback=progress_callback)
 
         # Update sync time
-        self.project.update_sync_time(full=True)
+        self.project.update_sync_time(full=True, scan_started=scan_started)
 
         # Save graph
         self.store.save()
@@ -174,22 +209,30 @@ class Indexer:
         Returns:
             Statistics dictionary
         """
+        # Files changed after this point may be missed by this sync
+        scan_started = time.time()
+
         stored_hashes = self.project.get_file_hashes()
+        file_stats = self.project.get_file_stats()
         files_to_index: list[Path] = []
+        current_hashes: dict[Path, str] = {}
 
-        # Find changed and new files
-        for file_path in self.project.iter_files():
-            rel_path = str(file_path.relative_to(self.project.root))
-            current_hash = hash_file(file_path)
+        # Find changed and new files; unchanged files reuse their hash
+        files = list(self.project.iter_files())
+        rel_paths = [str(file_path.relative_to(self.project.root)) for file_path in files]
+        current_files = set(rel_paths)
+        hashes = hash_files_cached(files, rel_paths, file_stats, workers=INDEX_HASH_WORKERS)
 
+        for file_path, rel_path, current_hash in zip(files, rel_paths, hashes):
             if rel_path not in stored_hashes or stored_hashes[rel_path] != current_hash:
                 files_to_index.append(file_path)
+                current_hashes[file_path] = current_hash
+
+        self.project.save_file_stats(
+            {rel_path: file_stats[rel_path] for rel_path in current_files}
+        )
 
         # Find deleted files
-        current_files = {
-            str(f.relative_to(self.project.root))
-            for f in self.project.iter_files()
-        }
         deleted_files = set(stored_hashes.keys()) - current_files
 
         # Remove deleted files from index
@@ -200,11 +243,16 @@ class Indexer:
         self.project.save_file_hashes(stored_hashes)
 
         # Index changed files
-        stats = self.index_files(files_to_index, force=True, progress_callback=progress_callback)
+        stats = self.index_files(
+            files_to_index,
+            force=True,
+            progress_callback=progress_callback,
+            content_hashes=current_hashes,
+        )
         stats["deleted_files"] = len(deleted_files)
 
         # Update sync time
-        self.project.update_sync_time(full=False)
+        self.project.update_sync_time(full=False, scan_started=scan_started)
 
         # Save graph
         self.store.save()
@@ -230,16 +278,16 @@ class Indexer:
         else:
             rel_path = str(file_path)
 
-        # Remove from store
+        # Remove from store; the graph change is appended to its log, so no
+        # snapshot is needed here
         self.store.remove_file(rel_path)
 
         # Remove from file hashes
-        stored_hashes = self.project.get_file_hashes()
-        if rel_path in stored_hashes:
-            del stored_hashes[rel_path]
-            self.project.save_file_hashes(stored_hashes)
-
-        self.store.save()
+        with self._hashes_lock:
+            stored_hashes = self.project.get_file_hashes()
+            if rel_path in stored_hashes:
+                del stored_hashes[rel_path]
+                self.project.save_file_hashes(stored_hashes)
 
 
 def run_sync(
@@ -247,6 +295,7 @@ def run_sync(
     full: bool = False,
     quiet: bool = False,
     analyze: bool = True,
+    store: HybridStore | None = None,
 ) -> dict[str, int]:
     """
     Run sync operation with progress display.
@@ -256,11 +305,14 @@ def run_sync(
         full: Whether to do a full reindex
         quiet: Suppress progress output
         analyze: Whether to run symbol analysis (generate summaries)
+        store: Store to index into, so a long-lived caller's caches and graph
+            see the changes. Opens a new one if not given.
 
     Returns:
         Statistics dictionary
     """
-    store = HybridStore(project.chroma_dir, project.graph_path)
+    if store is None:
+        store = HybridStore(project.chroma_dir, project.graph_path)
     indexer = Indexer(project, store)
 
     if not quiet:
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-from agentna.memory.models import CodeChunk, Relationship
+from agentna.memory.models import CodeChunk, CodeChunkBatch, Relationship
 
 
 class BaseParser(ABC):
@@ -35,6 +35,22 @@ class BaseParser(ABC):
         """
         ...
 
+    def parse_batch(self, file_path: Path, content: str) -> CodeChunkBatch:
+        """
+        Parse a file into a column-oriented chunk batch.
+
+        Parsers that can emit rows directly should override this; the default
+        converts the result of ``parse``.
+
+        Args:
+            file_path: Path to the file (relative to project root)
+            content: File content as string
+
+        Returns:
+            Batch of extracted code chunks
+        """
+        return CodeChunkBatch.from_chunks(self.parse(file_path, content))
+
     @abstractmethod
     def extract_relationships(
         self,
@@ -1,20 +1,41 @@
 """Generic parser for files without specialized parsers."""
 
+import sys
 from pathlib import Path
+from typing import IO, Iterable, Iterator
 
 from agentna.core.constants import LANGUAGE_EXTENSIONS, MAX_CHUNK_SIZE_CHARS
 from agentna.indexing.parsers.base import BaseParser
-from agentna.memory.models import CodeChunk, Relationship, SymbolType
+from agentna.memory.models import CodeChunk, CodeChunkBatch, Relationship, SymbolType
 from agentna.utils.hashing import generate_chunk_id, hash_content
 
+# Lowercased, interned suffix -> language lookup built once at import
+_LANGUAGE_BY_SUFFIX = {sys.intern(ext.lower()): lang for ext, lang in LANGUAGE_EXTENSIONS.items()}
+
+# Read buffer for streaming files from disk
+_READ_BUFFER_SIZE = 64 * 1024
+
+
+def _iter_lines(f: IO[str]) -> Iterator[str]:
+    """Yield lines without newlines, matching ``str.split("\\n")`` on the full text."""
+    ends_with_newline = True
+    for line in f:
+        ends_with_newline = line.endswith("\n")
+        yield line[:-1] if ends_with_newline else line
+    if ends_with_newline:
+        yield ""
+
 
 class GenericParser(BaseParser):
     """Generic parser that creates file-level chunks for any text file."""
 
+    def __init__(self) -> None:
+        # Support all known extensions
+        self._supported_extensions = list(LANGUAGE_EXTENSIONS.keys())
+
     @property
     def supported_extensions(self) -> list[str]:
-        # Support all known extensions
-        return list(LANGUAGE_EXTENSIONS.keys())
+        return self._supported_extensions
 
     @property
     def language(self) -> str:
@@ -22,53 +43,66 @@ class GenericParser(BaseParser):
 
     def get_language(self, file_path: Path) -> str:
         """Get language for a specific file."""
-        return LANGUAGE_EXTENSIONS.get(file_path.suffix.lower(), "text")
+        suffix = file_path.suffix
+        return _LANGUAGE_BY_SUFFIX.get(suffix if suffix.islower() else suffix.lower(), "text")
 
     def parse(self, file_path: Path, content: str) -> list[CodeChunk]:
         """Parse file and create chunks based on size."""
-        chunks: list[CodeChunk] = []
-        lines = content.split("\n")
+        return self.parse_batch(file_path, content).to_chunks()
+
+    def parse_batch(self, file_path: Path, content: str) -> CodeChunkBatch:
+        """Parse file into a chunk batch based on size."""
+        return self._chunk_lines(file_path, content.split("\n"))
+
+    def parse_path(self, path: Path, file_path: Path | None = None) -> CodeChunkBatch:
+        """
+        Parse a file straight from disk without loading it as one string.
+
+        The file is read through a 64KB buffer and chunked line by line, so
+        only the chunks are held in memory. Produces the same chunks as
+        ``parse_batch`` on the file's text.
+
+        Args:
+            path: Path of the file to read
+            file_path: Path used for chunk IDs (defaults to ``path``)
+
+        Returns:
+            Batch of extracted code chunks
+        """
+        with open(path, encoding="utf-8", errors="replace", buffering=_READ_BUFFER_SIZE) as f:
+            return self._chunk_lines(file_path or path, _iter_lines(f))
+
+    def _chunk_lines(self, file_path: Path, lines: Iterable[str]) -> CodeChunkBatch:
+        """Group lines into chunks of at most MAX_CHUNK_SIZE_CHARS."""
+        batch = CodeChunkBatch()
         language = self.get_language(file_path)
+        file_path_str = sys.intern(str(file_path))
 
-        # If file is small enough, create single chunk
-        if len(content) <= MAX_CHUNK_SIZE_CHARS:
-            chunks.append(
-                CodeChunk(
-                    id=generate_chunk_id(str(file_path), 1, len(lines)),
-                    file_path=str(file_path),
-                    language=language,
-                    symbol_name=file_path.stem,
-                    symbol_type=SymbolType.FILE,
-                    line_start=1,
-                    line_end=len(lines),
-                    content=content,
-                    content_hash=hash_content(content),
-                )
-            )
-            return chunks
+        # Lines are buffered until the file is known to be too large for one chunk
+        head: list[str] | None = []
+        head_size = 0
 
-        # Split into multiple chunks
         current_chunk_lines: list[str] = []
         current_chunk_start = 1
         current_size = 0
+        line_count = 0
 
-        for i, line in enumerate(lines, 1):
+        def add_line(i: int, line: str) -> None:
+            nonlocal current_chunk_lines, current_chunk_start, current_size
             line_size = len(line) + 1  # +1 for newline
 
             if current_size + line_size > MAX_CHUNK_SIZE_CHARS and current_chunk_lines:
                 # Save current chunk
                 chunk_content = "\n".join(current_chunk_lines)
-                chunks.append(
-                    CodeChunk(
-                        id=generate_chunk_id(str(file_path), current_chunk_start, i - 1),
-                        file_path=str(file_path),
-                        language=language,
-                        symbol_type=SymbolType.FILE,
-                        line_start=current_chunk_start,
-                        line_end=i - 1,
-                        content=chunk_content,
-                        content_hash=hash_content(chunk_content),
-                    )
+                batch.append(
+                    id=generate_chunk_id(file_path_str, current_chunk_start, i - 1),
+                    file_path=file_path_str,
+                    language=language,
+                    symbol_type=SymbolType.FILE,
+                    line_start=current_chunk_start,
+                    line_end=i - 1,
+                    content=chunk_content,
+                    content_hash=hash_content(chunk_content),
                 )
 
                 # Start new chunk
@@ -79,23 +113,50 @@ class GenericParser(BaseParser):
                 current_chunk_lines.append(line)
                 current_size += line_size
 
+        for line_count, line in enumerate(lines, 1):
+            if head is None:
+                add_line(line_count, line)
+                continue
+
+            head.append(line)
+            head_size += len(line) + 1
+            if head_size - 1 > MAX_CHUNK_SIZE_CHARS:
+                # Split into multiple chunks
+                for i, buffered_line in enumerate(head, 1):
+                    add_line(i, buffered_line)
+                head = None
+
+        # If file is small enough, create single chunk
+        if head is not None:
+            content = "\n".join(head)
+            batch.append(
+                id=generate_chunk_id(file_path_str, 1, line_count),
+                file_path=file_path_str,
+                language=language,
+                symbol_name=file_path.stem,
+                symbol_type=SymbolType.FILE,
+                line_start=1,
+                line_end=line_count,
+                content=content,
+                content_hash=hash_content(content),
+            )
+            return batch
+
         # Save last chunk
         if current_chunk_lines:
             chunk_content = "\n".join(current_chunk_lines)
-            chunks.append(
-                CodeChunk(
-                    id=generate_chunk_id(str(file_path), current_chunk_start, len(lines)),
-                    file_path=str(file_path),
-                    language=language,
-                    symbol_type=SymbolType.FILE,
-                    line_start=current_chunk_start,
-                    line_end=len(lines),
-                    content=chunk_content,
-                    content_hash=hash_content(chunk_content),
-                )
+            batch.append(
+                id=generate_chunk_id(file_path_str, current_chunk_start, line_count),
+                file_path=file_path_str,
+                language=language,
+                symbol_type=SymbolType.FILE,
+                line_start=current_chunk_start,
+                line_end=line_count,
+                content=chunk_content,
+                content_hash=hash_content(chunk_content),
             )
 
-        return chunks
+        return batch
 
     def extract_relationships(
         self,
@@ -120,8 +181,13 @@ class MarkdownParser(BaseParser):
 
     def parse(self, file_path: Path, content: str) -> list[CodeChunk]:
         """Parse Markdown file and chunk by sections."""
-        chunks: list[CodeChunk] = []
+        return self.parse_batch(file_path, content).to_chunks()
+
+    def parse_batch(self, file_path: Path, content: str) -> CodeChunkBatch:
+        """Parse Markdown file into a chunk batch of sections."""
+        batch = CodeChunkBatch()
         lines = content.split("\n")
+        file_path_str = sys.intern(str(file_path))
 
         # Track sections by headers
         sections: list[tuple[int, int, str, list[str]]] = []  # (start, end, title, content)
@@ -161,37 +227,33 @@ class MarkdownParser(BaseParser):
         for start, end, title, section_content in sections:
             content_str = "\n".join(section_content)
             if len(content_str.strip()) > 0:  # Skip empty sections
-                chunks.append(
-                    CodeChunk(
-                        id=generate_chunk_id(str(file_path), start + 1, end + 1),
-                        file_path=str(file_path),
-                        language=self.language,
-                        symbol_name=title,
-                        symbol_type=SymbolType.FILE,
-                        line_start=start + 1,
-                        line_end=end + 1,
-                        content=content_str,
-                        content_hash=hash_content(content_str),
-                    )
-                )
-
-        # If no sections found, create single chunk
-        if not chunks:
-            chunks.append(
-                CodeChunk(
-                    id=generate_chunk_id(str(file_path), 1, len(lines)),
-                    file_path=str(file_path),
+                batch.append(
+                    id=generate_chunk_id(file_path_str, start + 1, end + 1),
+                    file_path=file_path_str,
                     language=self.language,
-                    symbol_name=file_path.stem,
+                    symbol_name=title,
                     symbol_type=SymbolType.FILE,
-                    line_start=1,
-                    line_end=len(lines),
-                    content=content,
-                    content_hash=hash_content(content),
+                    line_start=start + 1,
+                    line_end=end + 1,
+                    content=content_str,
+                    content_hash=hash_content(content_str),
                 )
+
+        # If no sections found, create single chunk
+        if not batch:
+            batch.append(
+                id=generate_chunk_id(file_path_str, 1, len(lines)),
+                file_path=file_path_str,
+                language=self.language,
+                symbol_name=file_path.stem,
+                symbol_type=SymbolType.FILE,
+                line_start=1,
+                line_end=len(lines),
+                content=content,
+                content_hash=hash_content(content),
             )
 
-        return chunks
+        return batch
 
     def extract_relationships(
         self,
@@ -1,13 +1,41 @@
 """Python code parser using AST."""
 
 import ast
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
 
 from agentna.indexing.parsers.base import BaseParser
 from agentna.memory.models import CodeChunk, Relationship, RelationType, SymbolType
 from agentna.utils.hashing import generate_chunk_id, generate_symbol_id, hash_content
 
+# Recently parsed module trees keyed by source text. The indexer calls parse()
+# and extract_relationships() back to back on the same content, so a small
+# cache lets the second call reuse the first call's tree.
+_TREE_CACHE_SIZE = 8
+_tree_cache: OrderedDict[str, ast.Module | None] = OrderedDict()
+_tree_cache_lock = threading.Lock()
+
+
+def _parse_cached(content: str) -> ast.Module | None:
+    """Parse Python source, reusing recent results. Returns None on syntax errors."""
+    with _tree_cache_lock:
+        if content in _tree_cache:
+            _tree_cache.move_to_end(content)
+            return _tree_cache[content]
+
+    try:
+        tree: ast.Module | None = ast.parse(content)
+    except SyntaxError:
+        tree = None
+
+    with _tree_cache_lock:
+        _tree_cache[content] = tree
+        if len(_tree_cache) > _TREE_CACHE_SIZE:
+            _tree_cache.popitem(last=False)
+    return tree
+
 
 class PythonParser(BaseParser):
     """Parser for Python code using the ast module."""
@@ -24,30 +52,34 @@ class PythonParser(BaseParser):
         """Parse Python file and extract code chunks."""
         chunks: list[CodeChunk] = []
         lines = content.split("\n")
+        # Every chunk of the file shares one path string
+        file_path_str = sys.intern(str(file_path))
 
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
+        tree = _parse_cached(content)
+        if tree is None:
             # If parsing fails, create a single file-level chunk
             return [self._create_file_chunk(file_path, content, lines)]
 
         # Add file-level chunk
-        chunks.append(self._create_file_chunk(file_path, content, lines))
+        chunks.append(self._create_file_chunk(file_path, content, lines, tree))
 
-        # Extract classes and functions
+        # Extract classes and functions. ast.walk is breadth-first, so a class
+        # is always visited before its methods and can mark them as seen.
+        methods: set[int] = set()
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
-                chunks.append(self._parse_class(file_path, node, lines))
+                chunks.append(self._parse_class(file_path_str, node, lines))
                 # Also extract methods
                 for item in node.body:
                     if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        methods.add(id(item))
                         chunks.append(
-                            self._parse_function(file_path, item, lines, parent=node.name)
+                            self._parse_function(file_path_str, item, lines, parent=node.name)
                         )
             elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 # Top-level functions only (not methods)
-                if not self._is_method(node, tree):
-                    chunks.append(self._parse_function(file_path, node, lines))
+                if id(node) not in methods:
+                    chunks.append(self._parse_function(file_path_str, node, lines))
 
         return chunks
 
@@ -60,71 +92,17 @@ class PythonParser(BaseParser):
         """Extract relationships from Python code."""
         relationships: list[Relationship] = []
 
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
+        tree = _parse_cached(content)
+        if tree is None:
             return relationships
 
-        file_id = f"file:{file_path}"
-
-        # Extract imports
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    relationships.append(
-                        Relationship(
-                            source_id=file_id,
-                            target_id=f"module:{alias.name}",
-                            relation_type=RelationType.IMPORTS,
-                            line_number=node.lineno,
-                        )
-                    )
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    for alias in node.names:
-                        relationships.append(
-                            Relationship(
-                                source_id=file_id,
-                                target_id=f"module:{node.module}.{alias.name}",
-                                relation_type=RelationType.IMPORTS,
-                                line_number=node.lineno,
-                            )
-                        )
-
-        # Extract class inheritance
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                class_id = generate_symbol_id("class", str(file_path), node.name)
-                for base in node.bases:
-                    base_name = self._get_name(base)
-                    if base_name:
-                        relationships.append(
-                            Relationship(
-                                source_id=class_id,
-                                target_id=f"class:{base_name}",
-                                relation_type=RelationType.INHERITS,
-                                line_number=node.lineno,
-                            )
-                        )
+        file_path_str = sys.intern(str(file_path))
+        file_id = sys.intern(f"file:{file_path_str}")
 
-        # Extract function calls (simplified)
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                func_id = generate_symbol_id("function", str(file_path), node.name)
-
-                # Find calls within this function
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Call):
-                        call_name = self._get_call_name(child)
-                        if call_name:
-                            relationships.append(
-                                Relationship(
-                                    source_id=func_id,
-                                    target_id=f"function:{call_name}",
-                                    relation_type=RelationType.CALLS,
-                                    line_number=child.lineno if hasattr(child, "lineno") else None,
-                                )
-                            )
+        # Extract imports, class inheritance and function calls in one traversal
+        visitor = _RelationshipVisitor(self, file_path_str, file_id)
+        visitor.visit(tree)
+        relationships.extend(visitor.relationships)
 
         # Add contains relationships
         for chunk in chunks:
@@ -140,20 +118,19 @@ class PythonParser(BaseParser):
         return relationships
 
     def _create_file_chunk(
-        self, file_path: Path, content: str, lines: list[str]
+        self,
+        file_path: Path,
+        content: str,
+        lines: list[str],
+        tree: ast.Module | None = None,
     ) -> CodeChunk:
-        """Create a file-level chunk."""
-        # Extract module docstring
-        docstring = None
-        try:
-            tree = ast.parse(content)
-            docstring = ast.get_docstring(tree)
-        except SyntaxError:
-            pass
+        """Create a file-level chunk, reading the module docstring from ``tree`` if parsed."""
+        docstring = ast.get_docstring(tree) if tree is not None else None
 
+        file_path_str = sys.intern(str(file_path))
         return CodeChunk(
-            id=generate_chunk_id(str(file_path), 1, len(lines)),
-            file_path=str(file_path),
+            id=generate_chunk_id(file_path_str, 1, len(lines)),
+            file_path=file_path_str,
             language=self.language,
             symbol_name=file_path.stem,
             symbol_type=SymbolType.FILE,
@@ -165,7 +142,7 @@ class PythonParser(BaseParser):
         )
 
     def _parse_class(
-        self, file_path: Path, node: ast.ClassDef, lines: list[str]
+        self, file_path: str, node: ast.ClassDef, lines: list[str]
     ) -> CodeChunk:
         """Parse a class definition."""
         line_start = node.lineno
@@ -184,8 +161,8 @@ class PythonParser(BaseParser):
             signature += f"({', '.join(bases)})"
 
         return CodeChunk(
-            id=generate_symbol_id("class", str(file_path), node.name, line_start),
-            file_path=str(file_path),
+            id=generate_symbol_id("class", file_path, node.name, line_start),
+            file_path=file_path,
             language=self.language,
             symbol_name=node.name,
             symbol_type=SymbolType.CLASS,
@@ -199,7 +176,7 @@ class PythonParser(BaseParser):
 
     def _parse_function(
         self,
-        file_path: Path,
+        file_path: str,
         node: ast.FunctionDef | ast.AsyncFunctionDef,
         lines: list[str],
         parent: str | None = None,
@@ -229,8 +206,8 @@ class PythonParser(BaseParser):
         symbol_full_name = f"{parent}.{node.name}" if parent else node.name
 
         return CodeChunk(
-            id=generate_symbol_id(symbol_type.value, str(file_path), symbol_full_name, line_start),
-            file_path=str(file_path),
+            id=generate_symbol_id(symbol_type.value, file_path, symbol_full_name, line_start),
+            file_path=file_path,
             language=self.language,
             symbol_name=node.name,
             symbol_type=symbol_type,
@@ -308,10 +285,77 @@ class PythonParser(BaseParser):
         """Get the name of a called function."""
         return self._get_name(node.func)
 
-    def _is_method(self, node: ast.FunctionDef | ast.AsyncFunctionDef, tree: ast.Module) -> bool:
-        """Check if a function is a method (inside a class)."""
-        for class_node in ast.walk(tree):
-            if isinstance(class_node, ast.ClassDef):
-                if node in class_node.body:
-                    return True
-        return False
+
+class _RelationshipVisitor(ast.NodeVisitor):
+    """Collects import, inheritance and call relationships in a single pass."""
+
+    def __init__(self, parser: PythonParser, file_path: str, file_id: str) -> None:
+        self.parser = parser
+        self.file_path = file_path
+        self.file_id = file_id
+        self.relationships: list[Relationship] = []
+        # IDs of the functions enclosing the node being visited
+        self.func_stack: list[str] = []
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.relationships.append(
+                Relationship(
+                    source_id=self.file_id,
+                    target_id=f"module:{alias.name}",
+                    relation_type=RelationType.IMPORTS,
+                    line_number=node.lineno,
+                )
+            )
+        self.generic_visit(node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            for alias in node.names:
+                self.relationships.append(
+                    Relationship(
+                        source_id=self.file_id,
+                        target_id=f"module:{node.module}.{alias.name}",
+                        relation_type=RelationType.IMPORTS,
+                        line_number=node.lineno,
+                    )
+                )
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        class_id = generate_symbol_id("class", self.file_path, node.name)
+        for base in node.bases:
+            base_name = self.parser._get_name(base)
+            if base_name:
+                self.relationships.append(
+                    Relationship(
+                        source_id=class_id,
+                        target_id=f"class:{base_name}",
+                        relation_type=RelationType.INHERITS,
+                        line_number=node.lineno,
+                    )
+                )
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self.func_stack.append(generate_symbol_id("function", self.file_path, node.name))
+        self.generic_visit(node)
+        self.func_stack.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # noqa: N815
+
+    def visit_Call(self, node: ast.Call) -> None:
+        # A call counts for every enclosing function, including outer ones
+        if self.func_stack:
+            call_name = self.parser._get_call_name(node)
+            if call_name:
+                for func_id in self.func_stack:
+                    self.relationships.append(
+                        Relationship(
+                            source_id=func_id,
+                            target_id=f"function:{call_name}",
+                            relation_type=RelationType.CALLS,
+                            line_number=node.lineno,
+                        )
+                    )
+        self.generic_visit(node)
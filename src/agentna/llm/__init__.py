@@ -1,13 +1,16 @@
 """LLM module - Ollama and Claude providers."""
 
-from agentna.llm.base import BaseLLMProvider
+from agentna.llm.base import BaseLLMProvider, Embedding
+from agentna.llm.cache import ResponseCache
 from agentna.llm.claude_provider import ClaudeProvider
 from agentna.llm.ollama_provider import OllamaProvider
 from agentna.llm.router import LLMRouter
 
 __all__ = [
     "BaseLLMProvider",
+    "Embedding",
     "OllamaProvider",
     "ClaudeProvider",
     "LLMRouter",
+    "ResponseCache",
 ]
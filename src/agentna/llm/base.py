@@ -3,6 +3,12 @@
 from abc import ABC, abstractmethod
 from typing import AsyncIterator
 
+import numpy as np
+import numpy.typing as npt
+
+# float32 vector of shape (D,), or a matrix of shape (N, D) for batches
+Embedding = npt.NDArray[np.float32]
+
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -58,7 +64,7 @@ class BaseLLMProvider(ABC):
         ...
 
     @abstractmethod
-    async def embed(self, text: str) -> list[float]:
+    async def embed(self, text: str) -> Embedding:
         """
         Generate embeddings for text.
 
@@ -71,7 +77,7 @@ class BaseLLMProvider(ABC):
         ...
 
     @abstractmethod
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    async def embed_batch(self, texts: list[str]) -> Embedding:
         """
         Generate embeddings for multiple texts.
 
@@ -79,7 +85,7 @@ class BaseLLMProvider(ABC):
             texts: Texts to embed
 
         Returns:
-            List of embedding vectors
+            Matrix with one embedding vector per row
         """
         ...
 
@@ -87,3 +93,11 @@ class BaseLLMProvider(ABC):
     def is_available(self) -> bool:
         """Check if the provider is available."""
         ...
+
+    async def is_available_async(self) -> bool:
+        """Check if the provider is available from async code.
+
+        Providers whose check does network I/O should override this so the
+        event loop is not blocked.
+        """
+        return self.is_available()
@@ -0,0 +1,58 @@
+"""In-memory cache for deterministic LLM completions."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from agentna.core.constants import LLM_RESPONSE_CACHE_SIZE
+
+
+class ResponseCache:
+    """LRU cache of completions keyed by model, parameters and prompt."""
+
+    def __init__(self, max_entries: int = LLM_RESPONSE_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses to keep
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str,
+        system: str | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """Build a cache key for a completion request."""
+        raw = f"{model}|{temperature}|{max_tokens}|{system or ''}|{prompt}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response, or None on a miss."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
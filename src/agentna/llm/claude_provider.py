@@ -4,9 +4,14 @@ import os
 from typing import AsyncIterator
 
 import anthropic
+import httpx
 
 from agentna.core.exceptions import LLMConnectionError, LLMError
-from agentna.llm.base import BaseLLMProvider
+from agentna.llm.base import BaseLLMProvider, Embedding
+
+# Shared transport settings so bursts of requests reuse warm connections
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
 
 
 class ClaudeProvider(BaseLLMProvider):
@@ -21,6 +26,8 @@ class ClaudeProvider(BaseLLMProvider):
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self._client: anthropic.AsyncAnthropic | None = None
         self._sync_client: anthropic.Anthropic | None = None
+        self._http: httpx.AsyncClient | None = None
+        self._sync_http: httpx.Client | None = None
 
     @property
     def name(self) -> str:
@@ -31,7 +38,8 @@ class ClaudeProvider(BaseLLMProvider):
         if self._client is None:
             if not self.api_key:
                 raise LLMError("ANTHROPIC_API_KEY not set")
-            self._client = anthropic.AsyncAnthropic(api_key=self.api_key)
+            self._http = httpx.AsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+            self._client = anthropic.AsyncAnthropic(api_key=self.api_key, http_client=self._http)
         return self._client
 
     def _get_sync_client(self) -> anthropic.Anthropic:
@@ -39,9 +47,25 @@ class ClaudeProvider(BaseLLMProvider):
         if self._sync_client is None:
             if not self.api_key:
                 raise LLMError("ANTHROPIC_API_KEY not set")
-            self._sync_client = anthropic.Anthropic(api_key=self.api_key)
+            self._sync_http = httpx.Client(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+            self._sync_client = anthropic.Anthropic(api_key=self.api_key, http_client=self._sync_http)
         return self._sync_client
 
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._client = None
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections used by the sync client."""
+        if self._sync_http is not None:
+            self._sync_http.close()
+            self._sync_http = None
+            self._sync_client = None
+
     def is_available(self) -> bool:
         """Check if Claude API is available."""
         return bool(self.api_key)
@@ -93,7 +117,7 @@ class ClaudeProvider(BaseLLMProvider):
         except anthropic.APIError as e:
             raise LLMError(f"Claude API error: {e}") from e
 
-    async def embed(self, text: str) -> list[float]:
+    async def embed(self, text: str) -> Embedding:
         """
         Generate embeddings.
 
@@ -102,7 +126,7 @@ class ClaudeProvider(BaseLLMProvider):
         """
         raise LLMError("Claude does not support embeddings. Use Ollama for embeddings.")
 
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    async def embed_batch(self, texts: list[str]) -> Embedding:
         """Generate embeddings for multiple texts."""
         raise LLMError("Claude does not support embeddings. Use Ollama for embeddings.")
 
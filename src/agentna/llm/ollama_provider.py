@@ -1,14 +1,156 @@
 """Ollama LLM provider."""
 
 import asyncio
-from typing import AsyncIterator
+import os
+import time
+from typing import Any, AsyncIterator
 
 import httpx
+import numpy as np
 import ollama
 
-from agentna.core.constants import DEFAULT_OLLAMA_HOST, DEFAULT_OLLAMA_MODEL, EMBEDDING_MODEL
+from agentna.core.constants import (
+    AVAILABILITY_CACHE_TTL_S,
+    DEFAULT_EMBED_CONCURRENCY,
+    DEFAULT_OLLAMA_HOST,
+    DEFAULT_OLLAMA_MODEL,
+    EMBED_MAX_BATCH,
+    EMBED_MAX_WAIT_MS,
+    EMBEDDING_MODEL,
+)
 from agentna.core.exceptions import LLMConnectionError, LLMError
-from agentna.llm.base import BaseLLMProvider
+from agentna.llm.base import BaseLLMProvider, Embedding
+from agentna.utils.serialization import dumps, loads
+
+# Shared transport settings so every chat and embedding call reuses warm
+# connections. Reads are unbounded because local generation can be slow.
+_HTTP_TIMEOUT = httpx.Timeout(None, connect=5.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60)
+# Liveness pings should fail fast when the server is down
+_PING_TIMEOUT = httpx.Timeout(2.0)
+
+
+class EmbedBatcher:
+    """
+    Coalesces concurrent embedding requests into batched /api/embed calls.
+
+    Texts are collected until max_batch are pending or max_wait seconds have
+    passed since the first one arrived, then sent as a single request. Up to
+    the provider's embed_concurrency batches are in flight at once.
+    """
+
+    def __init__(
+        self,
+        provider: "OllamaProvider",
+        max_batch: int = EMBED_MAX_BATCH,
+        max_wait: float = EMBED_MAX_WAIT_MS / 1000,
+    ) -> None:
+        self.provider = provider
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        # Bound to the event loop that first submits work
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[Embedding]]] | None = None
+        self._full: asyncio.Event | None = None
+        self._sem: asyncio.Semaphore | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        # Futures not resolved yet, failed by close()
+        self._waiting: set[asyncio.Future[Embedding]] = set()
+
+    async def submit(self, text: str) -> Embedding:
+        """Queue a text and wait for its embedding."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._start(loop)
+        assert self._queue is not None and self._full is not None
+
+        future: asyncio.Future[Embedding] = loop.create_future()
+        self._waiting.add(future)
+        future.add_done_callback(self._waiting.discard)
+        self._queue.put_nowait((text, future))
+        if self._queue.qsize() >= self.max_batch:
+            self._full.set()
+        return await future
+
+    def close(self) -> None:
+        """Stop the background worker and fail the embeddings still waiting on it."""
+        loop, self._loop = self._loop, None
+        tasks = [self._worker, *self._flushes] if self._worker is not None else [*self._flushes]
+        waiting = self._waiting
+        self._worker = None
+        self._flushes = set()
+        self._waiting = set()
+        if loop is None or loop.is_closed():
+            return
+
+        def shutdown() -> None:
+            for task in tasks:
+                task.cancel()
+            error = LLMError("Embedding batcher was closed")
+            for future in waiting:
+                if not future.done():
+                    future.set_exception(error)
+
+        # Tasks and futures may only be touched from their own loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            shutdown()
+        else:
+            loop.call_soon_threadsafe(shutdown)
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is not loop:
+            self._waiting = set()
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._full = asyncio.Event()
+        self._sem = asyncio.Semaphore(self.provider.embed_concurrency)
+        self._flushes = set()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._queue is not None and self._full is not None
+        queue, full = self._queue, self._full
+        while True:
+            items = [await queue.get()]
+
+            # Give other callers a moment to join a partial batch
+            if queue.qsize() < self.max_batch - 1:
+                full.clear()
+                try:
+                    await asyncio.wait_for(full.wait(), self.max_wait)
+                except TimeoutError:
+                    pass
+
+            while len(items) < self.max_batch and not queue.empty():
+                items.append(queue.get_nowait())
+
+            flush = asyncio.create_task(self._flush(items))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, items: list[tuple[str, asyncio.Future[Embedding]]]) -> None:
+        assert self._sem is not None
+        async with self._sem:
+            try:
+                vectors = await self.provider.embed_many([text for text, _ in items])
+                if len(vectors) != len(items):
+                    raise LLMError(
+                        f"Ollama returned {len(vectors)} embeddings for {len(items)} texts"
+                    )
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        for (_, future), vector in zip(items, vectors):
+            if not future.done():
+                future.set_result(vector)
 
 
 class OllamaProvider(BaseLLMProvider):
@@ -19,37 +161,153 @@ class OllamaProvider(BaseLLMProvider):
         model: str = DEFAULT_OLLAMA_MODEL,
         embed_model: str = EMBEDDING_MODEL,
         host: str = DEFAULT_OLLAMA_HOST,
+        embed_concurrency: int | None = None,
     ) -> None:
         self.model = model
         self.embed_model = embed_model
         self.host = host
-        self._client = ollama.AsyncClient(host=host)
-        self._sync_client = ollama.Client(host=host)
+        self.embed_concurrency = max(
+            1,
+            embed_concurrency
+            or int(os.environ.get("AGENTNA_EMBED_CONCURRENCY", DEFAULT_EMBED_CONCURRENCY)),
+        )
+        self._client = ollama.AsyncClient(host=host, timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+        self._sync_client = ollama.Client(host=host, timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+        self._embed_batcher = EmbedBatcher(self)
+        # Raw client for /api/embed so large responses skip the stdlib json parser
+        self._http: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        # (checked_at, available) from the last liveness probe
+        self._avail_cache: tuple[float, bool] | None = None
+        # Set once the model has been seen in /api/tags; pulled models don't vanish
+        self._model_present = False
+        self._ping_client: httpx.Client | None = None
 
     @property
     def name(self) -> str:
         return "ollama"
 
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        self._embed_batcher.close()
+        if self._http is not None:
+            await self._close_stale_http(self._http, self._http_loop)
+            self._http = None
+        await self._client.close()
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections used by the sync client."""
+        self._sync_client.close()
+        if self._ping_client is not None:
+            self._ping_client.close()
+            self._ping_client = None
+
     def is_available(self) -> bool:
-        """Check if Ollama is running and model is available."""
+        """Check if Ollama is running and model is available.
+
+        The result is cached for AVAILABILITY_CACHE_TTL_S seconds.
+        """
+        now = time.monotonic()
+        if self._avail_cache and now - self._avail_cache[0] < AVAILABILITY_CACHE_TTL_S:
+            return self._avail_cache[1]
+
+        available = self._check_available()
+        self._avail_cache = (now, available)
+        return available
+
+    async def is_available_async(self) -> bool:
+        """Check availability without blocking the event loop.
+
+        Shares the TTL cache with is_available.
+        """
+        now = time.monotonic()
+        if self._avail_cache and now - self._avail_cache[0] < AVAILABILITY_CACHE_TTL_S:
+            return self._avail_cache[1]
+
+        available = await self._check_available_async()
+        self._avail_cache = (now, available)
+        return available
+
+    def _check_available(self) -> bool:
+        """Ping the server, listing models only until the configured one is found."""
+        if not self._ping():
+            return False
+        if not self._model_present:
+            self._model_present = self._has_model()
+        return self._model_present
+
+    async def _check_available_async(self) -> bool:
+        """Async variant of _check_available."""
+        if not await self._ping_async():
+            return False
+        if not self._model_present:
+            try:
+                self._model_present = self._lists_model(await self._client.list())
+            except Exception:
+                return False
+        return self._model_present
+
+    @property
+    def _base_url(self) -> str:
+        return self.host if "://" in self.host else f"http://{self.host}"
+
+    def _ping(self) -> bool:
+        """Check that the Ollama server answers on /api/version."""
+        if self._ping_client is None:
+            self._ping_client = httpx.Client(base_url=self._base_url, timeout=_PING_TIMEOUT)
         try:
-            response = self._sync_client.list()
-            # Handle both old dict API and new Pydantic model API
-            if hasattr(response, "models"):
-                # New API: ListResponse with .models list of Model objects
-                model_names = [m.model for m in response.models]
-            else:
-                # Old API: dict with "models" key
-                model_names = [m.get("name", m.get("model", "")) for m in response.get("models", [])]
-
-            # Check for model name with or without tag
-            return any(
-                self.model in name or name.startswith(self.model.split(":")[0])
-                for name in model_names
-            )
+            return self._ping_client.get("/api/version").status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    async def _ping_async(self) -> bool:
+        """Async variant of _ping.
+
+        A short-lived client is used because probes are rare (see the TTL
+        cache) and a pooled one would be tied to a single event loop.
+        """
+        try:
+            async with httpx.AsyncClient(base_url=self._base_url, timeout=_PING_TIMEOUT) as client:
+                response = await client.get("/api/version")
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    def _has_model(self) -> bool:
+        """Check whether the configured model has been pulled."""
+        try:
+            return self._lists_model(self._sync_client.list())
         except Exception:
             return False
 
+    def _lists_model(self, response: Any) -> bool:
+        """Check a /api/tags response for the configured model."""
+        # Handle both old dict API and new Pydantic model API
+        if hasattr(response, "models"):
+            # New API: ListResponse with .models list of Model objects
+            model_names = [m.model for m in response.models]
+        else:
+            # Old API: dict with "models" key
+            model_names = [m.get("name", m.get("model", "")) for m in response.get("models", [])]
+
+        # Exact name or untagged base name is the common case
+        base = self.model.split(":")[0]
+        names = frozenset(model_names)
+        if self.model in names or base in {name.split(":")[0] for name in names}:
+            return True
+
+        # Check for model name with or without tag
+        return any(self.model in name or name.startswith(base) for name in names)
+
+    @staticmethod
+    def _messages(prompt: str, system: str | None) -> tuple[dict[str, str], ...]:
+        """Build the chat messages for a prompt and optional system prompt."""
+        user = {"role": "user", "content": prompt}
+        if system:
+            return ({"role": "system", "content": system}, user)
+        return (user,)
+
     async def complete(
         self,
         prompt: str,
@@ -58,10 +316,7 @@ class OllamaProvider(BaseLLMProvider):
         temperature: float = 0.7,
     ) -> str:
         """Generate a completion using Ollama."""
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._messages(prompt, system)
 
         try:
             response = await self._client.chat(
@@ -75,7 +330,7 @@ class OllamaProvider(BaseLLMProvider):
             return response["message"]["content"]
         except ollama.ResponseError as e:
             raise LLMError(f"Ollama error: {e}") from e
-        except httpx.ConnectError as e:
+        except (httpx.ConnectError, ConnectionError) as e:
             raise LLMConnectionError(f"Cannot connect to Ollama at {self.host}") from e
 
     async def stream(
@@ -86,10 +341,7 @@ class OllamaProvider(BaseLLMProvider):
         temperature: float = 0.7,
     ) -> AsyncIterator[str]:
         """Stream a completion using Ollama."""
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._messages(prompt, system)
 
         try:
             async for chunk in await self._client.chat(
@@ -105,30 +357,91 @@ class OllamaProvider(BaseLLMProvider):
                     yield chunk["message"]["content"]
         except ollama.ResponseError as e:
             raise LLMError(f"Ollama error: {e}") from e
-        except httpx.ConnectError as e:
+        except (httpx.ConnectError, ConnectionError) as e:
             raise LLMConnectionError(f"Cannot connect to Ollama at {self.host}") from e
 
-    async def embed(self, text: str) -> list[float]:
-        """Generate embeddings using Ollama."""
+    async def embed(self, text: str) -> Embedding:
+        """Generate embeddings using Ollama.
+
+        Concurrent calls are coalesced into batched requests.
+        """
+        return await self._embed_batcher.submit(text)
+
+    async def embed_batch(self, texts: list[str]) -> Embedding:
+        """Generate embeddings for multiple texts as an (N, D) matrix.
+
+        Duplicate texts are embedded once, and blank texts get a zero vector
+        without a request.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        # Row of each text in the unique list, or -1 for blank texts
+        unique: dict[str, int] = {}
+        rows = [
+            unique.setdefault(text, len(unique)) if text.strip() else -1
+            for text in texts
+        ]
+
+        if not unique:
+            # The model's dimension is unknown without a request
+            return np.zeros((len(texts), 0), dtype=np.float32)
+
+        vectors = np.stack(await asyncio.gather(*(self.embed(text) for text in unique)))
+
+        # Append a zero row so that -1 selects it
+        table = np.vstack([vectors, np.zeros((1, vectors.shape[1]), dtype=np.float32)])
+        return table[rows]
+
+    async def embed_list(self, text: str) -> list[float]:
+        """Generate embeddings as a plain list, for callers that need JSON-able output."""
+        return (await self.embed(text)).tolist()
+
+    async def embed_many(self, texts: list[str]) -> Embedding:
+        """Embed several texts in a single /api/embed request, as an (N, D) matrix."""
         try:
-            response = await self._client.embeddings(
-                model=self.embed_model,
-                prompt=text,
+            http = await self._get_http()
+            response = await http.post(
+                "/api/embed",
+                content=dumps({"model": self.embed_model, "input": texts}),
+                headers={"Content-Type": "application/json"},
             )
-            return response["embedding"]
-        except ollama.ResponseError as e:
-            raise LLMError(f"Ollama embedding error: {e}") from e
-        except httpx.ConnectError as e:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise LLMError(f"Ollama embedding error: {e.response.text}") from e
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
             raise LLMConnectionError(f"Cannot connect to Ollama at {self.host}") from e
+        return np.asarray(loads(response.content)["embeddings"], dtype=np.float32)
+
+    async def _get_http(self) -> httpx.AsyncClient:
+        """Get the raw HTTP client for the running event loop, closing one left from another."""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop:
+            if self._http is not None:
+                await self._close_stale_http(self._http, self._http_loop)
+            self._http = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=_HTTP_TIMEOUT,
+                limits=_HTTP_LIMITS,
+            )
+            self._http_loop = loop
+        return self._http
 
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for multiple texts."""
-        # Ollama doesn't support batch embeddings, so we do them sequentially
-        embeddings = []
-        for text in texts:
-            embedding = await self.embed(text)
-            embeddings.append(embedding)
-        return embeddings
+    @staticmethod
+    async def _close_stale_http(
+        client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+    ) -> None:
+        """Close a raw HTTP client, which may have been made on another event loop."""
+        if loop is not None and loop.is_running() and loop is not asyncio.get_running_loop():
+            # The loop still runs on another thread; close the client there
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        try:
+            await client.aclose()
+        except RuntimeError:
+            # Its loop is closed: the sockets are shut, but the loop can't be
+            # told the connections were lost
+            pass
 
     def complete_sync(
         self,
@@ -138,10 +451,7 @@ class OllamaProvider(BaseLLMProvider):
         temperature: float = 0.7,
     ) -> str:
         """Synchronous completion for non-async contexts."""
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._messages(prompt, system)
 
         try:
             response = self._sync_client.chat(
@@ -155,18 +465,15 @@ class OllamaProvider(BaseLLMProvider):
             return response["message"]["content"]
         except ollama.ResponseError as e:
             raise LLMError(f"Ollama error: {e}") from e
-        except httpx.ConnectError as e:
+        except (httpx.ConnectError, ConnectionError) as e:
             raise LLMConnectionError(f"Cannot connect to Ollama at {self.host}") from e
 
-    def embed_sync(self, text: str) -> list[float]:
+    def embed_sync(self, text: str) -> Embedding:
         """Synchronous embedding for non-async contexts."""
         try:
-            response = self._sync_client.embeddings(
-                model=self.embed_model,
-                prompt=text,
-            )
-            return response["embedding"]
+            response = self._sync_client.embed(model=self.embed_model, input=text)
+            return np.asarray(response["embeddings"][0], dtype=np.float32)
         except ollama.ResponseError as e:
             raise LLMError(f"Ollama embedding error: {e}") from e
-        except httpx.ConnectError as e:
+        except (httpx.ConnectError, ConnectionError) as e:
             raise LLMConnectionError(f"Cannot connect to Ollama at {self.host}") from e
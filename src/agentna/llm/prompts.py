@@ -1,5 +1,10 @@
 """Prompt templates for LLM interactions."""
 
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from string import Formatter
+
 SYSTEM_PROMPT = """You are an expert code analyst. Your job is to understand codebases deeply and explain them clearly.
 
 Key principles:
@@ -140,16 +145,58 @@ Provide:
 Be constructive and specific in your feedback."""
 
 
+def _compile(template: str) -> Callable[..., str]:
+    """Pre-split a template into literal and field segments for fast formatting."""
+    # Literals are laid out once; rendering only fills the field slots
+    parts: list[str] = []
+    slots: list[tuple[int, str]] = []
+    for literal, field, _, _ in Formatter().parse(template):
+        parts.append(literal)
+        if field is not None:
+            slots.append((len(parts), field))
+            parts.append("")
+
+    def render(**values: str) -> str:
+        filled = parts.copy()
+        for index, field in slots:
+            filled[index] = values[field]
+        return "".join(filled)
+
+    return render
+
+
+_render_explain_changes = _compile(EXPLAIN_CHANGES_PROMPT)
+_render_impact_analysis = _compile(IMPACT_ANALYSIS_PROMPT)
+_render_ask_codebase = _compile(ASK_CODEBASE_PROMPT)
+_render_summarize_file = _compile(SUMMARIZE_FILE_PROMPT)
+
+
+_TRAILING_WS = re.compile(r"[ \t]+\n")
+_BLANK_RUNS = re.compile(r"\n{3,}")
+
+
+def _compact(text: str) -> str:
+    """Drop CRs, trailing whitespace and repeated blank lines to save prompt tokens."""
+    text = _TRAILING_WS.sub("\n", text.replace("\r\n", "\n"))
+    return _BLANK_RUNS.sub("\n\n", text)
+
+
+@lru_cache(maxsize=512)
+def _bullets(items: tuple[str, ...]) -> str:
+    """Format items as a markdown bullet list."""
+    return "\n".join(f"- {item}" for item in items)
+
+
 def format_explain_changes(
     changed_files: list[str],
     change_details: str,
     affected_code: str,
 ) -> str:
     """Format the explain changes prompt."""
-    return EXPLAIN_CHANGES_PROMPT.format(
-        changed_files="\n".join(f"- {f}" for f in changed_files),
+    return _render_explain_changes(
+        changed_files=_bullets(tuple(changed_files)),
         change_details=change_details,
-        affected_code=affected_code,
+        affected_code=_compact(affected_code),
     )
 
 
@@ -159,10 +206,10 @@ def format_impact_analysis(
     related_code: str,
 ) -> str:
     """Format the impact analysis prompt."""
-    return IMPACT_ANALYSIS_PROMPT.format(
-        changed_items="\n".join(f"- {item}" for item in changed_items),
+    return _render_impact_analysis(
+        changed_items=_bullets(tuple(changed_items)),
         dependencies=dependencies,
-        related_code=related_code,
+        related_code=_compact(related_code),
     )
 
 
@@ -173,9 +220,9 @@ def format_ask_codebase(
     relationships: str,
 ) -> str:
     """Format the ask codebase prompt."""
-    return ASK_CODEBASE_PROMPT.format(
+    return _render_ask_codebase(
         question=question,
-        context=context,
+        context=_compact(context),
         symbols=symbols,
         relationships=relationships,
     )
@@ -188,9 +235,9 @@ def format_summarize_file(
     relationships: str,
 ) -> str:
     """Format the summarize file prompt."""
-    return SUMMARIZE_FILE_PROMPT.format(
+    return _render_summarize_file(
         file_path=file_path,
-        content=content[:3000],  # Limit content size
-        symbols="\n".join(f"- {s}" for s in symbols),
+        content=_compact(content)[:3000],  # Limit content size
+        symbols=_bullets(tuple(symbols)),
         relationships=relationships,
     )
@@ -1,13 +1,57 @@
 """LLM router for provider selection and fallback."""
 
-from typing import AsyncIterator
+import asyncio
+from typing import AsyncGenerator, AsyncIterator
 
 from agentna.core.config import LLMConfig
 from agentna.core.exceptions import LLMConnectionError, LLMError
-from agentna.llm.base import BaseLLMProvider
+from agentna.llm.base import BaseLLMProvider, Embedding
+from agentna.llm.cache import ResponseCache
 from agentna.llm.claude_provider import ClaudeProvider
 from agentna.llm.ollama_provider import OllamaProvider
 
+# Chunks read ahead of a slow stream consumer
+STREAM_PREFETCH_SIZE = 32
+
+_STREAM_END = object()
+
+
+async def _prefetch(
+    chunks: AsyncGenerator[str, None],
+    maxsize: int = STREAM_PREFETCH_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Read a stream ahead into a bounded queue.
+
+    A background task keeps pulling chunks from the network while the
+    consumer processes earlier ones. Errors from the source are re-raised
+    to the consumer in order.
+    """
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=maxsize)
+
+    async def fill() -> None:
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+            await queue.put(_STREAM_END)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            await chunks.aclose()
+
+    producer = asyncio.create_task(fill())
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, str):
+                yield item
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                break
+    finally:
+        producer.cancel()
+
 
 class LLMRouter:
     """Routes LLM requests to appropriate provider with fallback support."""
@@ -22,6 +66,33 @@ class LLMRouter:
         self.config = config
         self._ollama: OllamaProvider | None = None
         self._claude: ClaudeProvider | None = None
+        # Resolved on first use, so providers are still created lazily
+        self._primary: BaseLLMProvider | None = None
+        self._fallback: BaseLLMProvider | None = None
+        self.response_cache = ResponseCache()
+
+    async def __aenter__(self) -> "LLMRouter":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections held by the providers."""
+        self._primary = self._fallback = None
+        if self._ollama is not None:
+            await self._ollama.aclose()
+            self._ollama = None
+        if self._claude is not None:
+            await self._claude.aclose()
+            self._claude = None
+
+    def close(self) -> None:
+        """Close pooled HTTP connections held by the providers' sync clients."""
+        if self._ollama is not None:
+            self._ollama.close()
+        if self._claude is not None:
+            self._claude.close()
 
     @property
     def ollama(self) -> OllamaProvider:
@@ -46,18 +117,24 @@ class LLMRouter:
 
     def get_preferred_provider(self) -> BaseLLMProvider:
         """Get the preferred provider based on config."""
-        if self.config.preferred_provider == "claude":
-            return self.claude
-        return self.ollama
+        if self._primary is None:
+            if self.config.preferred_provider == "claude":
+                self._primary = self.claude
+            else:
+                self._primary = self.ollama
+        return self._primary
 
     def get_fallback_provider(self) -> BaseLLMProvider | None:
         """Get the fallback provider if enabled."""
         if not self.config.fallback_enabled:
             return None
 
-        if self.config.preferred_provider == "ollama":
-            return self.claude
-        return self.ollama
+        if self._fallback is None:
+            if self.config.preferred_provider == "ollama":
+                self._fallback = self.claude
+            else:
+                self._fallback = self.ollama
+        return self._fallback
 
     async def complete(
         self,
@@ -79,19 +156,43 @@ class LLMRouter:
             Generated text
         """
         primary = self.get_preferred_provider()
+        cache_key = self._cache_key(primary, prompt, system, max_tokens, temperature)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        provider, response = await self._complete(primary, prompt, system, max_tokens, temperature)
+        self._cache_response(provider, prompt, system, max_tokens, temperature, response)
+        return response
+
+    async def _complete(
+        self,
+        primary: BaseLLMProvider,
+        prompt: str,
+        system: str | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> tuple[BaseLLMProvider, str]:
+        """Run a completion on the primary provider, falling back if needed.
+
+        Returns:
+            The provider that answered and its response
+        """
         fallback = self.get_fallback_provider()
 
-        try:
-            if primary.is_available():
-                return await primary.complete(prompt, system, max_tokens, temperature)
-            elif fallback and fallback.is_available():
-                return await fallback.complete(prompt, system, max_tokens, temperature)
-            else:
-                raise LLMError("No LLM provider available")
-        except LLMConnectionError:
-            if fallback and fallback.is_available():
-                return await fallback.complete(prompt, system, max_tokens, temperature)
-            raise
+        # Each provider's availability is checked at most once per request
+        if await primary.is_available_async():
+            try:
+                return primary, await primary.complete(prompt, system, max_tokens, temperature)
+            except LLMConnectionError:
+                # Go straight to the fallback; probing it first costs a round trip
+                if not fallback:
+                    raise
+        elif not (fallback and await fallback.is_available_async()):
+            raise LLMError("No LLM provider available")
+
+        return fallback, await fallback.complete(prompt, system, max_tokens, temperature)
 
     async def stream(
         self,
@@ -115,23 +216,25 @@ class LLMRouter:
         primary = self.get_preferred_provider()
         fallback = self.get_fallback_provider()
 
-        try:
-            if primary.is_available():
-                async for chunk in primary.stream(prompt, system, max_tokens, temperature):
-                    yield chunk
-            elif fallback and fallback.is_available():
-                async for chunk in fallback.stream(prompt, system, max_tokens, temperature):
-                    yield chunk
-            else:
-                raise LLMError("No LLM provider available")
-        except LLMConnectionError:
-            if fallback and fallback.is_available():
-                async for chunk in fallback.stream(prompt, system, max_tokens, temperature):
+        # Each provider's availability is checked at most once per request
+        if await primary.is_available_async():
+            try:
+                stream = primary.stream(prompt, system, max_tokens, temperature)
+                async for chunk in _prefetch(stream):
                     yield chunk
-            else:
-                raise
+                return
+            except LLMConnectionError:
+                # Go straight to the fallback; probing it first costs a round trip
+                if not fallback:
+                    raise
+        elif not (fallback and await fallback.is_available_async()):
+            raise LLMError("No LLM provider available")
+
+        stream = fallback.stream(prompt, system, max_tokens, temperature)
+        async for chunk in _prefetch(stream):
+            yield chunk
 
-    async def embed(self, text: str) -> list[float]:
+    async def embed(self, text: str) -> Embedding:
         """
         Generate embeddings (uses Ollama).
 
@@ -142,13 +245,13 @@ class LLMRouter:
             Embedding vector
         """
         # Always use Ollama for embeddings since Claude doesn't support them
-        if self.ollama.is_available():
+        if await self.ollama.is_available_async():
             return await self.ollama.embed(text)
         raise LLMError("Ollama not available for embeddings")
 
-    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    async def embed_batch(self, texts: list[str]) -> Embedding:
         """Generate embeddings for multiple texts."""
-        if self.ollama.is_available():
+        if await self.ollama.is_available_async():
             return await self.ollama.embed_batch(texts)
         raise LLMError("Ollama not available for embeddings")
 
@@ -161,20 +264,77 @@ class LLMRouter:
     ) -> str:
         """Synchronous completion with automatic fallback."""
         primary = self.get_preferred_provider()
+        cache_key = self._cache_key(primary, prompt, system, max_tokens, temperature)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        provider, response = self._complete_sync(primary, prompt, system, max_tokens, temperature)
+        self._cache_response(provider, prompt, system, max_tokens, temperature, response)
+        return response
+
+    def _complete_sync(
+        self,
+        primary: BaseLLMProvider,
+        prompt: str,
+        system: str | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> tuple[BaseLLMProvider, str]:
+        """Run a synchronous completion, falling back if needed.
+
+        Returns:
+            The provider that answered and its response
+        """
         fallback = self.get_fallback_provider()
 
-        try:
-            if primary.is_available():
-                if hasattr(primary, "complete_sync"):
-                    return primary.complete_sync(prompt, system, max_tokens, temperature)
-            if fallback and fallback.is_available():
-                if hasattr(fallback, "complete_sync"):
-                    return fallback.complete_sync(prompt, system, max_tokens, temperature)
-            raise LLMError("No LLM provider available")
-        except LLMConnectionError:
-            if fallback and fallback.is_available() and hasattr(fallback, "complete_sync"):
-                return fallback.complete_sync(prompt, system, max_tokens, temperature)
-            raise
+        can_fall_back = fallback is not None and hasattr(fallback, "complete_sync")
+
+        if hasattr(primary, "complete_sync") and primary.is_available():
+            try:
+                return primary, primary.complete_sync(prompt, system, max_tokens, temperature)
+            except LLMConnectionError:
+                # Go straight to the fallback; probing it first costs a round trip
+                if not can_fall_back:
+                    raise
+                return fallback, fallback.complete_sync(prompt, system, max_tokens, temperature)
+
+        if can_fall_back and fallback.is_available():
+            return fallback, fallback.complete_sync(prompt, system, max_tokens, temperature)
+        raise LLMError("No LLM provider available")
+
+    @staticmethod
+    def _cache_key(
+        provider: BaseLLMProvider,
+        prompt: str,
+        system: str | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> str | None:
+        """Get the response cache key, or None if the request is not cacheable.
+
+        Only deterministic (temperature 0) completions are cached, so sampled
+        responses are never replayed.
+        """
+        if temperature != 0:
+            return None
+        model = f"{provider.name}:{getattr(provider, 'model', '')}"
+        return ResponseCache.make_key(model, prompt, system, max_tokens, temperature)
+
+    def _cache_response(
+        self,
+        provider: BaseLLMProvider,
+        prompt: str,
+        system: str | None,
+        max_tokens: int,
+        temperature: float,
+        response: str,
+    ) -> None:
+        """Cache a response under the provider that actually produced it."""
+        cache_key = self._cache_key(provider, prompt, system, max_tokens, temperature)
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response)
 
     def get_status(self) -> dict[str, bool]:
         """Get availability status of all providers."""
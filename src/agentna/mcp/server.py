@@ -1,12 +1,24 @@
 """MCP Server for Claude CLI integration."""
 
+import asyncio
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 from mcp.server.fastmcp import FastMCP
 
-from agentna.core.project import Project
-from agentna.memory.hybrid_store import HybridStore
+from agentna.core.constants import MCP_STATUS_CACHE_TTL_S, SYNC_MTIME_MARGIN_S
+
+# Heavy modules (ChromaDB, NetworkX) are imported on first use so the server
+# can answer the MCP handshake before the index is loaded
+if TYPE_CHECKING:
+    from agentna.core.project import Project
+    from agentna.memory.hybrid_store import HybridStore
+    from agentna.memory.models import SearchResult
 
 # Create the MCP server
 mcp = FastMCP(
@@ -16,29 +28,98 @@ mcp = FastMCP(
 )
 
 # Global state for the current project
-_project: Project | None = None
-_store: HybridStore | None = None
+_project: "Project | None" = None
+_store: "HybridStore | None" = None
+_init_lock = threading.Lock()
+
+# Short-lived cache for status/statistics that clients poll frequently.
+# Entries are stamped with a generation so a sync invalidates them at once.
+_cache: dict[str, tuple[float, int, Any]] = {}
+_cache_generation = 0
+_cache_lock = threading.Lock()
 
+# Tool calls run concurrently, so all store work goes through one thread: a
+# sync mutates the graph and collections that queries read, and a full sync
+# drops the collections altogether
+_store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agentna-store")
+# Set while sync_index runs; only touched on the event loop
+_sync_running = False
 
-def get_project() -> Project:
+
+def get_project() -> "Project":
     """Get the current project."""
     global _project
     if _project is None:
-        _project = Project.find_project()
+        with _init_lock:
+            if _project is None:
+                from agentna.core.project import Project
+
+                _project = Project.find_project()
     return _project
 
 
-def get_store() -> HybridStore:
-    """Get the hybrid store."""
-    global _store, _project
+def get_store() -> "HybridStore":
+    """Get the hybrid store, opening it on the first tool call."""
+    global _store
     if _store is None:
         project = get_project()
-        _store = HybridStore(project.chroma_dir, project.graph_path)
+        with _init_lock:
+            if _store is None:
+                from agentna.memory.hybrid_store import HybridStore
+
+                _store = HybridStore(project.chroma_dir, project.graph_path)
     return _store
 
 
+async def _store_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run ``fn`` on the store thread, after the store work queued before it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_store_executor, partial(fn, *args, **kwargs))
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Cut text to ``limit`` characters plus "...", returning short text as is."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _cached(key: str, fn: Callable[[], Any], ttl: float = MCP_STATUS_CACHE_TTL_S) -> Any:
+    """
+    Return a recent result of ``fn`` or compute and remember a new one.
+
+    Args:
+        key: Cache key
+        fn: Function producing the value
+        ttl: Seconds a value stays fresh
+
+    Returns:
+        Cached or freshly computed value
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[1] == _cache_generation and now - entry[0] < ttl:
+            return entry[2]
+        generation = _cache_generation
+
+    value = fn()
+
+    with _cache_lock:
+        # Don't store a value computed before an invalidation
+        if generation == _cache_generation:
+            _cache[key] = (now, generation, value)
+    return value
+
+
+def _invalidate_cache() -> None:
+    """Drop cached status values after the index changes."""
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _cache.clear()
+
+
 @mcp.tool()
-def search_codebase(
+async def search_codebase(
     query: str,
     file_types: list[str] | None = None,
     limit: int = 10,
@@ -54,8 +135,9 @@ def search_codebase(
     Returns:
         Relevant code chunks with file paths, line numbers, and context
     """
-    store = get_store()
-    results = store.search(
+    store = await _store_call(get_store)
+    results = await _store_call(
+        store.search,
         query=query,
         n_results=limit,
         file_types=file_types,
@@ -65,28 +147,27 @@ def search_codebase(
     if not results:
         return "No matching code found."
 
-    output = []
-    for i, result in enumerate(results, 1):
-        chunk = result.chunk
-        output.append(f"## Result {i} (score: {result.score:.2f})")
-        output.append(f"**File:** `{chunk.file_path}`")
-        output.append(f"**Lines:** {chunk.line_start}-{chunk.line_end}")
-        if chunk.symbol_name:
-            output.append(f"**Symbol:** {chunk.symbol_name} ({chunk.symbol_type.value})")
-        if chunk.docstring:
-            output.append(f"**Documentation:** {chunk.docstring[:200]}...")
-        output.append(f"```{chunk.language}")
-        output.append(chunk.content[:1000] + ("..." if len(chunk.content) > 1000 else ""))
-        output.append("```")
-        if result.related_chunks:
-            output.append(f"**Related:** {', '.join(result.related_chunks[:3])}")
-        output.append("")
+    return "\n".join(_format_search_result(i, result) for i, result in enumerate(results, 1))
 
-    return "\n".join(output)
+
+def _format_search_result(i: int, result: "SearchResult") -> str:
+    """Render one search result as a Markdown block."""
+    chunk = result.chunk
+    content = _trunc(chunk.content, 1000)
+    return "".join((
+        f"## Result {i} (score: {result.score:.2f})\n"
+        f"**File:** `{chunk.file_path}`\n"
+        f"**Lines:** {chunk.line_start}-{chunk.line_end}",
+        f"\n**Symbol:** {chunk.symbol_name} ({chunk.symbol_type.value})" if chunk.symbol_name else "",
+        f"\n**Documentation:** {_trunc(chunk.docstring, 200)}" if chunk.docstring else "",
+        f"\n```{chunk.language}\n{content}\n```",
+        f"\n**Related:** {', '.join(result.related_chunks[:3])}" if result.related_chunks else "",
+        "\n",
+    ))
 
 
 @mcp.tool()
-def get_symbol_info(
+async def get_symbol_info(
     symbol_name: str,
     file_path: str | None = None,
 ) -> str:
@@ -100,51 +181,37 @@ def get_symbol_info(
     Returns:
         Symbol definition, docstring, relationships, and usage locations
     """
-    store = get_store()
-    info = store.get_symbol_info(symbol_name, file_path)
+    store = await _store_call(get_store)
+    info = await _store_call(store.get_symbol_info, symbol_name, file_path)
 
     if not info:
         return f"Symbol '{symbol_name}' not found in the index."
 
-    output = []
     symbol = info["symbol"]
-    output.append(f"# {symbol.name}")
-    output.append(f"**Type:** {symbol.node_type.value}")
-    output.append(f"**File:** `{symbol.file_path}`")
-    if symbol.line_start:
-        output.append(f"**Lines:** {symbol.line_start}-{symbol.line_end}")
-
-    if info.get("signature"):
-        output.append(f"\n**Signature:**\n```\n{info['signature']}\n```")
-
-    if info.get("docstring"):
-        output.append(f"\n**Documentation:**\n{info['docstring']}")
-
-    if info.get("content"):
-        output.append(f"\n**Code:**\n```\n{info['content'][:500]}{'...' if len(info['content']) > 500 else ''}\n```")
-
-    # Relationships
-    if info.get("imports"):
-        imports = [r.target_id for r in info["imports"]]
-        output.append(f"\n**Imports:** {', '.join(imports[:5])}")
-
-    if info.get("calls"):
-        calls = [r.target_id for r in info["calls"]]
-        output.append(f"\n**Calls:** {', '.join(calls[:5])}")
-
-    if info.get("called_by"):
-        callers = [r.source_id for r in info["called_by"]]
-        output.append(f"\n**Called by:** {', '.join(callers[:5])}")
-
-    if info.get("inherits"):
-        bases = [r.target_id for r in info["inherits"]]
-        output.append(f"\n**Inherits from:** {', '.join(bases)}")
-
-    return "\n".join(output)
+    content = info.get("content")
+    imports = info.get("imports")
+    calls = info.get("calls")
+    callers = info.get("called_by")
+    bases = info.get("inherits")
+
+    return "".join((
+        f"# {symbol.name}\n"
+        f"**Type:** {symbol.node_type.value}\n"
+        f"**File:** `{symbol.file_path}`",
+        f"\n**Lines:** {symbol.line_start}-{symbol.line_end}" if symbol.line_start else "",
+        f"\n\n**Signature:**\n```\n{info['signature']}\n```" if info.get("signature") else "",
+        f"\n\n**Documentation:**\n{info['docstring']}" if info.get("docstring") else "",
+        f"\n\n**Code:**\n```\n{_trunc(content, 500)}\n```" if content else "",
+        # Relationships
+        f"\n\n**Imports:** {', '.join(r.target_id for r in imports[:5])}" if imports else "",
+        f"\n\n**Calls:** {', '.join(r.target_id for r in calls[:5])}" if calls else "",
+        f"\n\n**Called by:** {', '.join(r.source_id for r in callers[:5])}" if callers else "",
+        f"\n\n**Inherits from:** {', '.join(r.target_id for r in bases)}" if bases else "",
+    ))
 
 
 @mcp.tool()
-def analyze_impact(
+async def analyze_impact(
     file_paths: list[str],
 ) -> str:
     """
@@ -156,34 +223,43 @@ def analyze_impact(
     Returns:
         List of affected files, functions, and classes with impact severity
     """
-    store = get_store()
-    impact = store.analyze_impact(file_paths)
+    store = await _store_call(get_store)
+    impact = await _store_call(store.analyze_impact, file_paths)
 
-    output = []
-    output.append("# Impact Analysis")
-    output.append(f"**Changed files:** {', '.join(impact['changed_files'])}")
-    output.append(f"**Impact score:** {impact['impact_score']:.2f}")
-    output.append(f"**Severity:** {impact['severity']}")
-
-    if impact["affected_files"]:
-        output.append(f"\n## Affected Files ({len(impact['affected_files'])})")
-        for f in impact["affected_files"][:10]:
-            output.append(f"- `{f}`")
-        if len(impact["affected_files"]) > 10:
-            output.append(f"- ... and {len(impact['affected_files']) - 10} more")
-
-    if impact["affected_symbols"]:
-        output.append(f"\n## Affected Symbols ({len(impact['affected_symbols'])})")
-        for s in impact["affected_symbols"][:10]:
-            output.append(f"- {s}")
-        if len(impact["affected_symbols"]) > 10:
-            output.append(f"- ... and {len(impact['affected_symbols']) - 10} more")
+    files = impact["affected_files"]
+    symbols = impact["affected_symbols"]
 
-    return "\n".join(output)
+    return "".join((
+        "# Impact Analysis\n"
+        f"**Changed files:** {', '.join(impact['changed_files'])}\n"
+        f"**Impact score:** {impact['impact_score']:.2f}\n"
+        f"**Severity:** {impact['severity']}",
+        _bullet_section(f"Affected Files ({len(files)})", [f"`{f}`" for f in files[:10]], len(files)),
+        _bullet_section(f"Affected Symbols ({len(symbols)})", symbols[:10], len(symbols)),
+    ))
+
+
+def _bullet_section(heading: str, items: list[str], total: int | None = None) -> str:
+    """
+    Render a '##' section listing items.
+
+    Args:
+        heading: Section heading
+        items: Items to list, already truncated
+        total: Total number of items; when larger than ``items`` a
+            "... and N more" line is added
+
+    Returns:
+        The section text, or an empty string when there are no items
+    """
+    if not items:
+        return ""
+    more = f"\n- ... and {total - len(items)} more" if total and total > len(items) else ""
+    return f"\n\n## {heading}" + "".join(f"\n- {item}" for item in items) + more
 
 
 @mcp.tool()
-def get_file_context(
+async def get_file_context(
     file_path: str,
     include_related: bool = True,
 ) -> str:
@@ -197,37 +273,30 @@ def get_file_context(
     Returns:
         File content, docstrings, related files, and relevant conventions
     """
-    store = get_store()
-    context = store.get_file_context(file_path, include_related)
-
-    output = []
-    output.append(f"# File: {context['file_path']}")
-
-    if context["symbols"]:
-        output.append(f"\n## Symbols ({len(context['symbols'])})")
-        for symbol in context["symbols"][:20]:
-            output.append(f"- {symbol}")
-
-    if context["chunks"]:
-        output.append(f"\n## Content Preview")
-        for chunk in context["chunks"][:2]:
-            output.append(f"\n### {chunk.symbol_name or 'Main'}")
-            if chunk.docstring:
-                output.append(f"*{chunk.docstring[:200]}*")
-            output.append(f"```{chunk.language}")
-            output.append(chunk.content[:500])
-            output.append("```")
-
-    if context["related_files"]:
-        output.append(f"\n## Related Files ({len(context['related_files'])})")
-        for f in context["related_files"][:10]:
-            output.append(f"- `{f}`")
+    store = await _store_call(get_store)
+    context = await _store_call(store.get_file_context, file_path, include_related)
+
+    symbols = context["symbols"]
+    chunks = context["chunks"]
+    related = context["related_files"]
+
+    preview = "".join(
+        f"\n\n### {chunk.symbol_name or 'Main'}"
+        + (f"\n*{chunk.docstring[:200]}*" if chunk.docstring else "")
+        + f"\n```{chunk.language}\n{chunk.content[:500]}\n```"
+        for chunk in chunks[:2]
+    )
 
-    return "\n".join(output)
+    return "".join((
+        f"# File: {context['file_path']}",
+        _bullet_section(f"Symbols ({len(symbols)})", symbols[:20]),
+        f"\n\n## Content Preview{preview}" if chunks else "",
+        _bullet_section(f"Related Files ({len(related)})", [f"`{f}`" for f in related[:10]]),
+    ))
 
 
 @mcp.tool()
-def get_dependencies(
+async def get_dependencies(
     file_path: str,
     direction: str = "both",
     depth: int = 2,
@@ -243,42 +312,26 @@ def get_dependencies(
     Returns:
         Dependency tree showing relationships
     """
-    store = get_store()
-    project = get_project()
+    store = await _store_call(get_store)
 
-    # Get file node
-    nodes = store.graph.get_nodes_by_file(file_path)
-    if not nodes:
+    summary = await _store_call(store.graph.dependency_summary, file_path, direction, depth)
+    if summary is None:
         return f"File '{file_path}' not found in the index."
 
-    output = []
-    output.append(f"# Dependencies for: {file_path}")
-
-    if direction in ("outgoing", "both"):
-        output.append("\n## Dependencies (what this file uses)")
-        for node in nodes:
-            deps = store.graph.get_dependencies(node.id, max_depth=depth)
-            if deps:
-                for dep in deps[:15]:
-                    dep_node = store.graph.get_node(dep)
-                    if dep_node:
-                        output.append(f"- {dep_node.name} ({dep_node.node_type.value})")
-
-    if direction in ("incoming", "both"):
-        output.append("\n## Dependents (what uses this file)")
-        for node in nodes:
-            dependents = store.graph.get_dependents(node.id, max_depth=depth)
-            if dependents:
-                for dep in dependents[:15]:
-                    dep_node = store.graph.get_node(dep)
-                    if dep_node:
-                        output.append(f"- {dep_node.name} ({dep_node.node_type.value})")
+    def node_lines(key: str) -> str:
+        return "".join(f"\n- {name} ({node_type})" for name, node_type in summary[key])
 
-    return "\n".join(output)
+    return "".join((
+        f"# Dependencies for: {file_path}",
+        f"\n\n## Dependencies (what this file uses){node_lines('outgoing')}"
+        if "outgoing" in summary else "",
+        f"\n\n## Dependents (what uses this file){node_lines('incoming')}"
+        if "incoming" in summary else "",
+    ))
 
 
 @mcp.tool()
-def sync_index(
+async def sync_index(
     full: bool = False,
 ) -> str:
     """
@@ -290,10 +343,39 @@ def sync_index(
     Returns:
         Sync status and summary of changes
     """
+    global _sync_running
+    if _sync_running:
+        return "A sync is already running. Try again once it has finished."
+
+    _sync_running = True
+    try:
+        return await _sync_index(full)
+    finally:
+        _sync_running = False
+
+
+async def _sync_index(full: bool) -> str:
+    """Run a sync for sync_index, which makes sure only one runs at a time."""
     from agentna.indexing import run_sync
 
-    project = get_project()
-    stats = run_sync(project, full=full, quiet=True)
+    project = await asyncio.to_thread(get_project)
+
+    # Skip the tree walk and hashing when nothing changed since the last sync
+    # began reading files. Files saved while it ran are newer than that, so
+    # they are picked up; the margin covers coarse filesystem timestamps.
+    if not full:
+        scan_started = await asyncio.to_thread(project.get_last_scan_started)
+        if scan_started is not None:
+            newest = await asyncio.to_thread(project.max_source_mtime)
+            if newest <= scan_started - SYNC_MTIME_MARGIN_S:
+                return "# Index Sync Complete\n**Mode:** Incremental\nNo changes detected since the last sync."
+
+    # Sync through the shared store so its caches and graph stay current
+    store = await _store_call(get_store)
+    stats = await _store_call(run_sync, project, full=full, quiet=True, store=store)
+    # Nothing cached before the sync may be served after it
+    store.embeddings.invalidate_caches()
+    _invalidate_cache()
 
     output = []
     output.append("# Index Sync Complete")
@@ -308,17 +390,17 @@ def sync_index(
 
 
 @mcp.tool()
-def get_project_status() -> str:
+async def get_project_status() -> str:
     """
     Get the current status of the AgentNA index.
 
     Returns:
         Index statistics, last sync time, and project information
     """
-    project = get_project()
-    store = get_store()
-    status = project.get_status()
-    stats = store.get_statistics()
+    project = await asyncio.to_thread(get_project)
+    store = await _store_call(get_store)
+    status = await asyncio.to_thread(_cached, "status", project.get_status)
+    stats = await _store_call(_cached, "statistics", store.get_statistics)
 
     output = []
     output.append("# AgentNA Project Status")
@@ -341,7 +423,7 @@ def get_project_status() -> str:
 
 
 @mcp.tool()
-def add_decision(
+async def add_decision(
     title: str,
     description: str,
     rationale: str,
@@ -366,7 +448,7 @@ def add_decision(
 
     from agentna.memory.models import Decision
 
-    store = get_store()
+    store = await _store_call(get_store)
 
     decision = Decision(
         id=str(uuid.uuid4()),
@@ -378,7 +460,8 @@ def add_decision(
         tags=tags or [],
     )
 
-    store.add_decision(decision)
+    await _store_call(store.add_decision, decision)
+    _invalidate_cache()
 
     output = []
     output.append("# Decision Recorded")
@@ -395,7 +478,7 @@ def add_decision(
 
 
 @mcp.tool()
-def search_decisions(
+async def search_decisions(
     query: str,
     limit: int = 5,
 ) -> str:
@@ -409,8 +492,8 @@ def search_decisions(
     Returns:
         Matching decisions with relevance scores
     """
-    store = get_store()
-    results = store.search_decisions(query, n_results=limit)
+    store = await _store_call(get_store)
+    results = await _store_call(store.search_decisions, query, n_results=limit)
 
     if not results:
         return "No matching decisions found."
@@ -431,23 +514,23 @@ def search_decisions(
 
 # Resources
 @mcp.resource("agentna://project/info")
-def get_project_info() -> str:
+async def get_project_info() -> str:
     """Get project metadata and configuration."""
-    project = get_project()
+    project = await asyncio.to_thread(get_project)
     return json.dumps({
         "name": project.name,
         "path": str(project.root),
-        "config": project.config.model_dump(),
+        "config": _cached("config", project.config.model_dump),
     }, indent=2)
 
 
 @mcp.resource("agentna://index/stats")
-def get_index_stats() -> str:
+async def get_index_stats() -> str:
     """Get index statistics."""
-    project = get_project()
-    status = project.get_status()
-    store = get_store()
-    stats = store.get_statistics()
+    project = await asyncio.to_thread(get_project)
+    status = await asyncio.to_thread(_cached, "status", project.get_status)
+    store = await _store_call(get_store)
+    stats = await _store_call(_cached, "statistics", store.get_statistics)
 
     return json.dumps({
         "total_files": status.total_files,
@@ -464,13 +547,14 @@ def run_server(project_path: Path | None = None) -> None:
     """Run the MCP server."""
     global _project, _store
 
-    # Initialize project
+    from agentna.core.project import Project
+
+    # Initialize project; the store is opened lazily by the first tool call
     if project_path:
         _project = Project(project_path)
     else:
         _project = Project.find_project()
-
-    _store = HybridStore(_project.chroma_dir, _project.graph_path)
+    _store = None
 
     # Run the server
     mcp.run()
@@ -1,23 +1,46 @@
 """Memory module - embeddings, knowledge graph, hybrid store."""
 
-from agentna.memory.embeddings import EmbeddingStore
-from agentna.memory.hybrid_store import HybridStore
-from agentna.memory.knowledge_graph import KnowledgeGraph
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from agentna.memory.models import (
     ChangeRecord,
     ChangeType,
     CodeChunk,
+    CodeChunkBatch,
     Convention,
     Decision,
     FileRecord,
     GraphNode,
     IndexStatus,
+    NodeView,
     Relationship,
     RelationType,
     SearchResult,
     SymbolType,
 )
 
+if TYPE_CHECKING:
+    from agentna.memory.embeddings import EmbeddingStore
+    from agentna.memory.hybrid_store import HybridStore
+    from agentna.memory.knowledge_graph import KnowledgeGraph
+
+# The stores pull in ChromaDB and NetworkX, so they are imported on first use
+# instead of by everything that only needs the models
+_LAZY_IMPORTS = {
+    "EmbeddingStore": "agentna.memory.embeddings",
+    "HybridStore": "agentna.memory.hybrid_store",
+    "KnowledgeGraph": "agentna.memory.knowledge_graph",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
+
 __all__ = [
     "EmbeddingStore",
     "HybridStore",
@@ -25,11 +48,13 @@ __all__ = [
     "ChangeRecord",
     "ChangeType",
     "CodeChunk",
+    "CodeChunkBatch",
     "Convention",
     "Decision",
     "FileRecord",
     "GraphNode",
     "IndexStatus",
+    "NodeView",
     "Relationship",
     "RelationType",
     "SearchResult",
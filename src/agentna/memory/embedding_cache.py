@@ -0,0 +1,135 @@
+"""Persistent content-addressed cache of document embeddings."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from agentna.core.exceptions import MemoryError
+
+# SQLite limits the number of bound parameters per statement
+_SELECT_BATCH = 500
+
+PRECISIONS = ("fp32", "bf16", "int8")
+
+
+def _encode(vector: np.ndarray, precision: str) -> bytes:
+    """Serialize a vector in the given storage precision."""
+    vector = np.asarray(vector, dtype=np.float32)
+    if precision == "bf16":
+        # Keep the top 16 bits of each float32, rounding to nearest even
+        bits = vector.view(np.uint32)
+        rounded = (bits + 0x7FFF + ((bits >> 16) & 1)) >> 16
+        return rounded.astype(np.uint16).tobytes()
+    if precision == "int8":
+        # Symmetric quantization with one float32 scale per vector
+        scale = np.float32(np.max(np.abs(vector), initial=0.0) / 127) or np.float32(1.0)
+        quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+        return scale.tobytes() + quantized.tobytes()
+    return vector.tobytes()
+
+
+def _decode(blob: bytes, precision: str) -> np.ndarray:
+    """Deserialize a vector stored by ``_encode`` back to float32."""
+    if precision == "bf16":
+        bits = np.frombuffer(blob, dtype=np.uint16).astype(np.uint32) << 16
+        return bits.view(np.float32)
+    if precision == "int8":
+        scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+        return np.frombuffer(blob, dtype=np.int8, offset=4).astype(np.float32) * scale
+    return np.frombuffer(blob, dtype=np.float32)
+
+
+class EmbeddingCache:
+    """SQLite-backed store of embedding vectors keyed by (model, content hash).
+
+    Vectors can be stored as float32, bfloat16 (half the size) or int8 with a
+    per-vector scale (a quarter of the size). Each row records its precision,
+    so changing the setting keeps existing entries readable.
+    """
+
+    def __init__(self, path: Path, precision: str = "fp32") -> None:
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite file
+            precision: Storage format for new vectors: "fp32", "bf16" or "int8"
+        """
+        if precision not in PRECISIONS:
+            raise MemoryError(f"Unknown embedding cache precision: {precision}")
+        self.path = Path(path)
+        self.precision = precision
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " hash TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " PRIMARY KEY (hash, model))"
+            )
+            # Databases created before quantization support hold float32 rows
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(embeddings)")}
+            if "precision" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE embeddings ADD COLUMN precision TEXT NOT NULL DEFAULT 'fp32'"
+                )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            raise MemoryError(f"Failed to open embedding cache: {e}") from e
+
+    def get_many(self, model: str, hashes: list[str]) -> dict[str, np.ndarray]:
+        """
+        Look up cached vectors.
+
+        Args:
+            model: Embedding model identifier
+            hashes: Content hashes to look up
+
+        Returns:
+            Mapping of hash to float32 vector for the hashes that were found
+        """
+        found: dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            for i in range(0, len(unique), _SELECT_BATCH):
+                part = unique[i : i + _SELECT_BATCH]
+                placeholders = ",".join("?" * len(part))
+                rows = self._conn.execute(
+                    f"SELECT hash, vector, precision FROM embeddings"
+                    f" WHERE model = ? AND hash IN ({placeholders})",
+                    [model, *part],
+                )
+                for content_hash, blob, precision in rows:
+                    found[content_hash] = _decode(blob, precision)
+        return found
+
+    def put_many(self, model: str, items: list[tuple[str, np.ndarray]]) -> None:
+        """
+        Store vectors.
+
+        Args:
+            model: Embedding model identifier
+            items: (content hash, vector) pairs
+        """
+        if not items:
+            return
+        rows = [
+            (content_hash, model, _encode(vector, self.precision), self.precision)
+            for content_hash, vector in items
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, model, vector, precision)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
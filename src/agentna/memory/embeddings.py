@@ -1,33 +1,203 @@
 """ChromaDB-based vector store for code embeddings."""
 
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 
 from agentna.core.constants import (
     CHROMA_COLLECTION_CODE,
     CHROMA_COLLECTION_DECISIONS,
     CHROMA_COLLECTION_DOCS,
+    CHROMA_UPSERT_BATCH_SIZE,
+    CHUNK_CACHE_SIZE,
+    CHUNK_CACHE_TTL_S,
+    COLLECTION_COUNT_TTL_S,
+    DOCUMENT_EMBED_BATCH_SIZE,
+    EMBEDDING_CACHE_FILE,
+    EMBEDDING_CACHE_PRECISION,
+    QUERY_EMBEDDING_CACHE_SIZE,
+    SEARCH_CACHE_SIMILARITY,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL_S,
 )
 from agentna.core.exceptions import MemoryError
-from agentna.memory.models import CodeChunk, Decision, SearchResult
+from agentna.memory.embedding_cache import EmbeddingCache
+from agentna.memory.models import CodeChunk, CodeChunkBatch, Decision, SearchResult
+from agentna.utils.hashing import hash_content
+
+# Metadata written for every code chunk, with the values used when missing
+_CHUNK_METADATA_DEFAULTS: dict[str, Any] = {
+    "file_path": "",
+    "language": "",
+    "symbol_name": "",
+    "symbol_type": "file",
+    "line_start": 0,
+    "line_end": 0,
+    "content_hash": "",
+    "parent_symbol": "",
+}
+_CHUNK_METADATA_KEYS = _CHUNK_METADATA_DEFAULTS.keys()
+
+
+def _chunk_from_record(chunk_id: str, metadata: dict[str, Any], document: str) -> CodeChunk:
+    """Rebuild a CodeChunk from a stored Chroma record."""
+    # Records written by this store carry every key; fill gaps only when needed
+    if not metadata.keys() >= _CHUNK_METADATA_KEYS:
+        metadata = {**_CHUNK_METADATA_DEFAULTS, **metadata}
+    return CodeChunk(
+        id=chunk_id,
+        file_path=metadata["file_path"],
+        language=metadata["language"],
+        symbol_name=metadata["symbol_name"] or None,
+        symbol_type=metadata["symbol_type"],
+        line_start=metadata["line_start"],
+        line_end=metadata["line_end"],
+        content=document,
+        content_hash=metadata["content_hash"],
+        parent_symbol=metadata["parent_symbol"] or None,
+    )
+
+
+def _parse_decision_document(document: str) -> tuple[str, str, str]:
+    """Split a decision document into (title, description, rationale)."""
+    parts = document.split("\n\n")
+    title = parts[0] if parts else ""
+    description = parts[1] if len(parts) > 1 else ""
+    rationale = parts[2].replace("Rationale: ", "") if len(parts) > 2 else ""
+    return title, description, rationale
+
+
+def _where_filter(file_types: list[str] | None, file_path: str | None) -> dict[str, Any] | None:
+    """Build the Chroma where clause for a search, one literal per filter shape."""
+    if file_types:
+        if file_path:
+            return {"$and": [{"language": {"$in": file_types}}, {"file_path": file_path}]}
+        return {"language": {"$in": file_types}}
+    if file_path:
+        return {"file_path": file_path}
+    return None
+
+
+def _distance_scores(distances: list[float]) -> list[float]:
+    """Convert L2 distances to similarity scores in one vectorised pass."""
+    return (1.0 / (1.0 + np.asarray(distances, dtype=np.float64))).tolist()
+
+
+class _SearchCache:
+    """
+    Recent search results, matched by query embedding similarity.
+
+    A new query reuses a stored result list when it has the same filters and
+    its embedding is within SEARCH_CACHE_SIMILARITY cosine of a stored query.
+    """
+
+    def __init__(self, max_entries: int = SEARCH_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (filters, unit query vector, results, stored_at), oldest first
+        self._entries: list[tuple[tuple[Any, ...], np.ndarray, list[SearchResult], float]] = []
+        self._matrix: np.ndarray | None = None
+
+    @staticmethod
+    def _unit(embedding: Any) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def get(self, filters: tuple[Any, ...], embedding: Any) -> list[SearchResult] | None:
+        """Get results for a similar earlier query, or None."""
+        query = self._unit(embedding)
+        now = time.monotonic()
+        with self._lock:
+            self._entries = [e for e in self._entries if now - e[3] < SEARCH_CACHE_TTL_S]
+            if not self._entries:
+                self._matrix = None
+                return None
+            if self._matrix is None or len(self._matrix) != len(self._entries):
+                self._matrix = np.stack([e[1] for e in self._entries])
+            if self._matrix.shape[1] != query.shape[0]:
+                return None
+
+            similarities = self._matrix @ query
+            for i in np.argsort(similarities)[::-1]:
+                if similarities[i] < SEARCH_CACHE_SIMILARITY:
+                    break
+                if self._entries[i][0] == filters:
+                    # Callers re-rank in place, so hand out copies
+                    return [result.model_copy() for result in self._entries[i][2]]
+        return None
+
+    def put(self, filters: tuple[Any, ...], embedding: Any, results: list[SearchResult]) -> None:
+        """Store results for a query."""
+        entry = (filters, self._unit(embedding), [r.model_copy() for r in results], time.monotonic())
+        with self._lock:
+            self._entries.append(entry)
+            del self._entries[: -self.max_entries]
+            self._matrix = None
+
+    def clear(self) -> None:
+        """Drop all stored results."""
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
 
 
 class EmbeddingStore:
     """Manages ChromaDB vector storage for code embeddings."""
 
-    def __init__(self, persist_dir: Path) -> None:
+    def __init__(
+        self,
+        persist_dir: Path,
+        query_cache_size: int = QUERY_EMBEDDING_CACHE_SIZE,
+        cache_precision: str | None = None,
+    ) -> None:
         """
         Initialize the embedding store.
 
         Args:
             persist_dir: Directory for ChromaDB persistence
+            query_cache_size: Number of query embeddings to keep in memory
+            cache_precision: Storage format of the persistent embedding cache
+                ("fp32", "bf16" or "int8"); defaults to the
+                AGENTNA_EMBEDDING_CACHE_PRECISION environment variable
         """
         self.persist_dir = Path(persist_dir)
         self.persist_dir.mkdir(parents=True, exist_ok=True)
 
+        # Shared by all collections so queries can be embedded once and reused
+        self._embedding_function = DefaultEmbeddingFunction()
+        self._query_cache_size = query_cache_size
+        self._query_cache: OrderedDict[str, Any] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._search_cache = _SearchCache()
+        # Chunks seen through get_chunk or search as (timestamp, chunk), so
+        # repeat lookups skip Chroma; expired so writes from other processes
+        # are picked up
+        self._chunk_cache: OrderedDict[str, tuple[float, CodeChunk]] = OrderedDict()
+        self._chunk_cache_lock = threading.Lock()
+        # Collection counts as (timestamp, count), dropped when this store
+        # writes and expired so writes from other processes are picked up
+        self._counts: dict[str, tuple[float, int]] = {}
+        self._counts_lock = threading.Lock()
+
+        # Document embeddings by content hash, kept across re-indexes
+        self._embedding_cache = EmbeddingCache(
+            self.persist_dir / EMBEDDING_CACHE_FILE,
+            precision=cache_precision
+            or os.environ.get("AGENTNA_EMBEDDING_CACHE_PRECISION", EMBEDDING_CACHE_PRECISION),
+        )
+        self._embedding_model = type(self._embedding_function).__name__
+
         # Initialize ChromaDB client with persistence
         self._client = chromadb.PersistentClient(
             path=str(self.persist_dir),
@@ -37,18 +207,24 @@ class EmbeddingStore:
             ),
         )
 
-        # Get or create collections
+        self._open_collections()
+
+    def _open_collections(self) -> None:
+        """Get or create the collections."""
         self._code_collection = self._client.get_or_create_collection(
             name=CHROMA_COLLECTION_CODE,
             metadata={"description": "Code chunks from the project"},
+            embedding_function=self._embedding_function,
         )
         self._docs_collection = self._client.get_or_create_collection(
             name=CHROMA_COLLECTION_DOCS,
             metadata={"description": "Documentation and comments"},
+            embedding_function=self._embedding_function,
         )
         self._decisions_collection = self._client.get_or_create_collection(
             name=CHROMA_COLLECTION_DECISIONS,
             metadata={"description": "Architectural decisions"},
+            embedding_function=self._embedding_function,
         )
 
     def add_chunks(
@@ -82,23 +258,99 @@ class EmbeddingStore:
             for chunk in chunks
         ]
 
+        self._upsert_code(ids, documents, metadatas, embeddings)
+
+    def add_chunk_batch(
+        self,
+        batch: CodeChunkBatch,
+        embeddings: list[list[float]] | None = None,
+    ) -> None:
+        """
+        Add a column-oriented chunk batch to the store.
+
+        Args:
+            batch: Batch of code chunks to add
+            embeddings: Optional pre-computed embeddings (if None, ChromaDB will compute)
+        """
+        if not batch:
+            return
+
+        metadatas = [
+            {
+                "file_path": file_path,
+                "language": language,
+                "symbol_name": symbol_name or "",
+                "symbol_type": symbol_type.value,
+                "line_start": line_start,
+                "line_end": line_end,
+                "content_hash": content_hash,
+                "parent_symbol": parent_symbol or "",
+            }
+            for (
+                file_path,
+                language,
+                symbol_name,
+                symbol_type,
+                line_start,
+                line_end,
+                content_hash,
+                parent_symbol,
+            ) in zip(
+                batch.file_paths,
+                batch.languages,
+                batch.symbol_names,
+                batch.symbol_types,
+                batch.line_starts,
+                batch.line_ends,
+                batch.content_hashes,
+                batch.parent_symbols,
+            )
+        ]
+
+        self._upsert_code(batch.ids, batch.embedding_texts(), metadatas, embeddings)
+
+    def _upsert_code(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+        embeddings: list[list[float]] | None,
+    ) -> None:
+        """Upsert prepared rows into the code collection."""
+        self.invalidate_caches()
         try:
-            if embeddings:
-                self._code_collection.upsert(
-                    ids=ids,
-                    documents=documents,
-                    metadatas=metadatas,
-                    embeddings=embeddings,
-                )
-            else:
+            if not embeddings:
+                embeddings = self._embed_documents(documents)
+            # Large re-indexes are split to stay under Chroma's request limits
+            for i in range(0, len(ids), CHROMA_UPSERT_BATCH_SIZE):
+                end = i + CHROMA_UPSERT_BATCH_SIZE
                 self._code_collection.upsert(
-                    ids=ids,
-                    documents=documents,
-                    metadatas=metadatas,
+                    ids=ids[i:end],
+                    documents=documents[i:end],
+                    metadatas=metadatas[i:end],
+                    embeddings=embeddings[i:end],
                 )
         except Exception as e:
             raise MemoryError(f"Failed to add chunks: {e}") from e
 
+    def _embed_documents(self, documents: list[str]) -> list[Any]:
+        """Embed documents, reusing cached vectors for unchanged content."""
+        hashes = [hash_content(document) for document in documents]
+        cached = self._embedding_cache.get_many(self._embedding_model, hashes)
+
+        missing = [i for i, content_hash in enumerate(hashes) if content_hash not in cached]
+        for start in range(0, len(missing), DOCUMENT_EMBED_BATCH_SIZE):
+            part = missing[start : start + DOCUMENT_EMBED_BATCH_SIZE]
+            vectors = self._embedding_function([documents[i] for i in part])
+            new_items = [
+                (hashes[i], np.asarray(vector, dtype=np.float32))
+                for i, vector in zip(part, vectors)
+            ]
+            self._embedding_cache.put_many(self._embedding_model, new_items)
+            cached.update(new_items)
+
+        return [cached[content_hash] for content_hash in hashes]
+
     def delete_chunks(self, chunk_ids: list[str]) -> None:
         """
         Delete chunks by their IDs.
@@ -109,6 +361,7 @@ class EmbeddingStore:
         if not chunk_ids:
             return
 
+        self.invalidate_caches()
         try:
             self._code_collection.delete(ids=chunk_ids)
         except Exception as e:
@@ -121,6 +374,7 @@ class EmbeddingStore:
         Args:
             file_path: Relative path to the file
         """
+        self.invalidate_caches()
         try:
             self._code_collection.delete(where={"file_path": file_path})
         except Exception as e:
@@ -147,63 +401,124 @@ class EmbeddingStore:
         Returns:
             List of search results
         """
-        where_filter: dict[str, Any] | None = None
-        where_conditions = []
+        cache_filters = (n_results, tuple(file_types or ()), file_path)
+        try:
+            embedding = query_embedding or self._embed_query(query)
+            cached = self._search_cache.get(cache_filters, embedding)
+            if cached is not None:
+                self._remember_chunks(result.chunk for result in cached)
+                return cached
+
+            results = self._code_collection.query(
+                query_embeddings=[embedding],
+                n_results=n_results,
+                where=_where_filter(file_types, file_path),
+                include=["documents", "metadatas", "distances"],
+            )
+        except Exception as e:
+            raise MemoryError(f"Failed to search: {e}") from e
+
+        search_results = self._search_results(results, 0)
+        self._search_cache.put(cache_filters, embedding, search_results)
+        self._remember_chunks(result.chunk for result in search_results)
+        return search_results
+
+    def search_batch(
+        self,
+        queries: list[str],
+        query_embeddings: list[list[float]] | None = None,
+        n_results: int = 10,
+        file_types: list[str] | None = None,
+        file_path: str | None = None,
+    ) -> list[list[SearchResult]]:
+        """
+        Search for several queries with one embedding call and one Chroma query.
 
-        if file_types:
-            where_conditions.append({"language": {"$in": file_types}})
-        if file_path:
-            where_conditions.append({"file_path": file_path})
+        Args:
+            queries: Search query texts
+            query_embeddings: Optional pre-computed embeddings, one per query
+            n_results: Maximum number of results per query
+            file_types: Optional list of languages to filter by
+            file_path: Optional specific file to search in
 
-        if len(where_conditions) == 1:
-            where_filter = where_conditions[0]
-        elif len(where_conditions) > 1:
-            where_filter = {"$and": where_conditions}
+        Returns:
+            List of search results for each query, in query order
+        """
+        if not queries:
+            return []
 
+        cache_filters = (n_results, tuple(file_types or ()), file_path)
+        batch_results: list[list[SearchResult] | None] = [None] * len(queries)
         try:
-            if query_embedding:
+            embeddings = query_embeddings or self._embed_queries(queries)
+            misses = []
+            for i, embedding in enumerate(embeddings):
+                batch_results[i] = self._search_cache.get(cache_filters, embedding)
+                if batch_results[i] is None:
+                    misses.append(i)
+
+            if misses:
                 results = self._code_collection.query(
-                    query_embeddings=[query_embedding],
+                    query_embeddings=[embeddings[i] for i in misses],
                     n_results=n_results,
-                    where=where_filter,
-                    include=["documents", "metadatas", "distances"],
-                )
-            else:
-                results = self._code_collection.query(
-                    query_texts=[query],
-                    n_results=n_results,
-                    where=where_filter,
+                    where=_where_filter(file_types, file_path),
                     include=["documents", "metadatas", "distances"],
                 )
         except Exception as e:
             raise MemoryError(f"Failed to search: {e}") from e
 
-        search_results = []
-        if results["ids"] and results["ids"][0]:
-            for i, chunk_id in enumerate(results["ids"][0]):
-                metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                document = results["documents"][0][i] if results["documents"] else ""
-                distance = results["distances"][0][i] if results["distances"] else 0.0
-
-                # Convert distance to similarity score (ChromaDB uses L2 distance)
-                score = 1.0 / (1.0 + distance)
-
-                chunk = CodeChunk(
-                    id=chunk_id,
-                    file_path=metadata.get("file_path", ""),
-                    language=metadata.get("language", ""),
-                    symbol_name=metadata.get("symbol_name") or None,
-                    symbol_type=metadata.get("symbol_type", "file"),
-                    line_start=metadata.get("line_start", 0),
-                    line_end=metadata.get("line_end", 0),
-                    content=document,
-                    content_hash=metadata.get("content_hash", ""),
-                    parent_symbol=metadata.get("parent_symbol") or None,
-                )
-
-                search_results.append(SearchResult(chunk=chunk, score=score))
+        for row, i in enumerate(misses):
+            found = self._search_results(results, row)
+            batch_results[i] = found
+            self._search_cache.put(cache_filters, embeddings[i], found)
+
+        # Queries left without an embedding get no results rather than None
+        filled = [results if results is not None else [] for results in batch_results]
+        self._remember_chunks(result.chunk for results in filled for result in results)
+        return filled
+
+    @staticmethod
+    def _search_results(results: dict[str, Any], row: int) -> list[SearchResult]:
+        """Convert one query's row of a Chroma query response to search results."""
+        if not results["ids"] or not results["ids"][row]:
+            return []
+
+        ids = results["ids"][row]
+        metadatas = results["metadatas"][row] if results["metadatas"] else repeat({})
+        documents = results["documents"][row] if results["documents"] else repeat("")
+        # Convert distances to similarity scores (ChromaDB uses L2 distance)
+        scores = _distance_scores(results["distances"][row]) if results["distances"] else repeat(1.0)
+
+        return [
+            SearchResult(chunk=_chunk_from_record(chunk_id, metadata, document), score=score)
+            for chunk_id, metadata, document, score in zip(ids, metadatas, documents, scores)
+        ]
 
-        return search_results
+    def _embed_query(self, query: str) -> Any:
+        """Embed a query string, reusing recent results."""
+        return self._embed_queries([query])[0]
+
+    def _embed_queries(self, queries: list[str]) -> list[Any]:
+        """Embed query strings in one call, reusing recent results."""
+        embeddings: dict[str, Any] = {}
+        with self._query_cache_lock:
+            for query in queries:
+                embedding = self._query_cache.get(query)
+                if embedding is not None:
+                    self._query_cache.move_to_end(query)
+                    embeddings[query] = embedding
+
+        missing = [query for query in dict.fromkeys(queries) if query not in embeddings]
+        if missing:
+            new_embeddings = self._embedding_function(missing)
+            with self._query_cache_lock:
+                for query, embedding in zip(missing, new_embeddings):
+                    embeddings[query] = embedding
+                    self._query_cache[query] = embedding
+                    if len(self._query_cache) > self._query_cache_size:
+                        self._query_cache.popitem(last=False)
+
+        return [embeddings[query] for query in queries]
 
     def get_chunk(self, chunk_id: str) -> CodeChunk | None:
         """
@@ -215,6 +530,14 @@ class EmbeddingStore:
         Returns:
             CodeChunk if found, None otherwise
         """
+        with self._chunk_cache_lock:
+            cached = self._chunk_cache.get(chunk_id)
+            if cached is not None:
+                if time.monotonic() - cached[0] < CHUNK_CACHE_TTL_S:
+                    self._chunk_cache.move_to_end(chunk_id)
+                    return cached[1]
+                del self._chunk_cache[chunk_id]
+
         try:
             results = self._code_collection.get(
                 ids=[chunk_id],
@@ -229,25 +552,58 @@ class EmbeddingStore:
         metadata = results["metadatas"][0] if results["metadatas"] else {}
         document = results["documents"][0] if results["documents"] else ""
 
-        return CodeChunk(
-            id=chunk_id,
-            file_path=metadata.get("file_path", ""),
-            language=metadata.get("language", ""),
-            symbol_name=metadata.get("symbol_name") or None,
-            symbol_type=metadata.get("symbol_type", "file"),
-            line_start=metadata.get("line_start", 0),
-            line_end=metadata.get("line_end", 0),
-            content=document,
-            content_hash=metadata.get("content_hash", ""),
-            parent_symbol=metadata.get("parent_symbol") or None,
-        )
+        chunk = _chunk_from_record(chunk_id, metadata, document)
+        self._remember_chunks((chunk,))
+        return chunk
+
+    def _remember_chunks(self, chunks: Iterable[CodeChunk]) -> None:
+        """Add chunks to the in-memory chunk cache."""
+        now = time.monotonic()
+        with self._chunk_cache_lock:
+            for chunk in chunks:
+                self._chunk_cache[chunk.id] = (now, chunk)
+                self._chunk_cache.move_to_end(chunk.id)
+            while len(self._chunk_cache) > CHUNK_CACHE_SIZE:
+                self._chunk_cache.popitem(last=False)
+
+    def invalidate_caches(self) -> None:
+        """
+        Drop cached searches, chunks and collection counts.
 
-    def get_chunks_by_file(self, file_path: str) -> list[CodeChunk]:
+        Writes through this store do this themselves. Call it after the
+        index was changed some other way, e.g. by another store instance.
+        """
+        self._search_cache.clear()
+        with self._chunk_cache_lock:
+            self._chunk_cache.clear()
+        with self._counts_lock:
+            self._counts.clear()
+
+    def _count(self, collection: Any) -> int:
+        """Count a collection's rows, reusing a recent count."""
+        now = time.monotonic()
+        with self._counts_lock:
+            cached = self._counts.get(collection.name)
+            if cached is not None and now - cached[0] < COLLECTION_COUNT_TTL_S:
+                return cached[1]
+
+        count = collection.count()
+        with self._counts_lock:
+            self._counts[collection.name] = (now, count)
+        return count
+
+    def get_chunks_by_file(
+        self,
+        file_path: str,
+        include: tuple[str, ...] = ("documents", "metadatas"),
+    ) -> list[CodeChunk]:
         """
         Get all chunks from a specific file.
 
         Args:
             file_path: Relative path to the file
+            include: Fields to fetch from Chroma. Leave out "documents" when
+                the chunk content isn't needed; chunks then have empty content.
 
         Returns:
             List of chunks from the file
@@ -255,33 +611,55 @@ class EmbeddingStore:
         try:
             results = self._code_collection.get(
                 where={"file_path": file_path},
-                include=["documents", "metadatas"],
+                include=list(include),
             )
         except Exception as e:
             raise MemoryError(f"Failed to get chunks: {e}") from e
 
-        chunks = []
-        if results["ids"]:
-            for i, chunk_id in enumerate(results["ids"]):
-                metadata = results["metadatas"][i] if results["metadatas"] else {}
-                document = results["documents"][i] if results["documents"] else ""
-
-                chunks.append(
-                    CodeChunk(
-                        id=chunk_id,
-                        file_path=metadata.get("file_path", ""),
-                        language=metadata.get("language", ""),
-                        symbol_name=metadata.get("symbol_name") or None,
-                        symbol_type=metadata.get("symbol_type", "file"),
-                        line_start=metadata.get("line_start", 0),
-                        line_end=metadata.get("line_end", 0),
-                        content=document,
-                        content_hash=metadata.get("content_hash", ""),
-                        parent_symbol=metadata.get("parent_symbol") or None,
-                    )
-                )
+        return self._chunks_from_records(results)
+
+    def get_chunks_by_files(
+        self,
+        file_paths: list[str],
+        include: tuple[str, ...] = ("documents", "metadatas"),
+    ) -> dict[str, list[CodeChunk]]:
+        """
+        Get the chunks of several files with a single query.
 
-        return chunks
+        Args:
+            file_paths: Relative paths to the files
+            include: Fields to fetch from Chroma, as for ``get_chunks_by_file``
+
+        Returns:
+            Chunks per file path; files without chunks map to an empty list
+        """
+        by_file: dict[str, list[CodeChunk]] = {file_path: [] for file_path in file_paths}
+        if not file_paths:
+            return by_file
+
+        try:
+            results = self._code_collection.get(
+                where={"file_path": {"$in": list(file_paths)}},
+                include=list(include),
+            )
+        except Exception as e:
+            raise MemoryError(f"Failed to get chunks: {e}") from e
+
+        for chunk in self._chunks_from_records(results):
+            by_file.setdefault(chunk.file_path, []).append(chunk)
+        return by_file
+
+    @staticmethod
+    def _chunks_from_records(results: dict[str, Any]) -> list[CodeChunk]:
+        """Rebuild chunks from the result of a Chroma ``get``."""
+        if not results["ids"]:
+            return []
+        metadatas = results["metadatas"] or repeat({})
+        documents = results["documents"] or repeat("")
+        return [
+            _chunk_from_record(chunk_id, metadata, document)
+            for chunk_id, metadata, document in zip(results["ids"], metadatas, documents)
+        ]
 
     def add_decision(self, decision: Decision, embedding: list[float] | None = None) -> None:
         """
@@ -294,11 +672,15 @@ class EmbeddingStore:
         document = f"{decision.title}\n\n{decision.description}\n\nRationale: {decision.rationale}"
         metadata = {
             "title": decision.title,
+            "description": decision.description,
+            "rationale": decision.rationale,
             "timestamp": decision.timestamp.isoformat(),
             "status": decision.status,
             "tags": ",".join(decision.tags),
         }
 
+        with self._counts_lock:
+            self._counts.pop(CHROMA_COLLECTION_DECISIONS, None)
         try:
             if embedding:
                 self._decisions_collection.upsert(
@@ -331,29 +713,31 @@ class EmbeddingStore:
         """
         try:
             results = self._decisions_collection.query(
-                query_texts=[query],
+                query_embeddings=[self._embed_query(query)],
                 n_results=n_results,
-                include=["documents", "metadatas", "distances"],
+                include=["metadatas", "distances"],
             )
         except Exception as e:
             raise MemoryError(f"Failed to search decisions: {e}") from e
 
         decisions = []
         if results["ids"] and results["ids"][0]:
-            for i, decision_id in enumerate(results["ids"][0]):
-                metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                document = results["documents"][0][i] if results["documents"] else ""
-                distance = results["distances"][0][i] if results["distances"] else 0.0
-
-                score = 1.0 / (1.0 + distance)
-
-                # Parse document back to decision
-                parts = document.split("\n\n")
-                title = parts[0] if parts else ""
-                description = parts[1] if len(parts) > 1 else ""
-                rationale = parts[2].replace("Rationale: ", "") if len(parts) > 2 else ""
-
-                from datetime import datetime
+            ids = results["ids"][0]
+            metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(ids)
+            scores = _distance_scores(results["distances"][0]) if results["distances"] else repeat(1.0)
+
+            # Decisions stored before description/rationale were kept in
+            # metadata only have them in the document text
+            legacy_ids = [i for i, m in zip(ids, metadatas) if "description" not in m]
+            documents = self._decision_documents(legacy_ids) if legacy_ids else {}
+
+            for decision_id, metadata, score in zip(ids, metadatas, scores):
+                if decision_id in documents:
+                    title, description, rationale = _parse_decision_document(documents[decision_id])
+                else:
+                    title = metadata.get("title", "")
+                    description = metadata.get("description", "")
+                    rationale = metadata.get("rationale", "")
 
                 decision = Decision(
                     id=decision_id,
@@ -369,9 +753,17 @@ class EmbeddingStore:
 
         return decisions
 
+    def _decision_documents(self, decision_ids: list[str]) -> dict[str, str]:
+        """Fetch the stored document text of the given decisions."""
+        try:
+            results = self._decisions_collection.get(ids=decision_ids, include=["documents"])
+        except Exception as e:
+            raise MemoryError(f"Failed to get decisions: {e}") from e
+        return dict(zip(results["ids"], results["documents"] or repeat("")))
+
     def count_chunks(self) -> int:
         """Get total number of code chunks."""
-        return self._code_collection.count()
+        return self._count(self._code_collection)
 
     def get_all_chunks(self) -> list[CodeChunk]:
         """
@@ -388,52 +780,21 @@ class EmbeddingStore:
         except Exception as e:
             raise MemoryError(f"Failed to get all chunks: {e}") from e
 
-        chunks = []
-        if results["ids"]:
-            for i, chunk_id in enumerate(results["ids"]):
-                metadata = results["metadatas"][i] if results["metadatas"] else {}
-                document = results["documents"][i] if results["documents"] else ""
-
-                chunks.append(
-                    CodeChunk(
-                        id=chunk_id,
-                        file_path=metadata.get("file_path", ""),
-                        language=metadata.get("language", ""),
-                        symbol_name=metadata.get("symbol_name") or None,
-                        symbol_type=metadata.get("symbol_type", "file"),
-                        line_start=metadata.get("line_start", 0),
-                        line_end=metadata.get("line_end", 0),
-                        content=document,
-                        content_hash=metadata.get("content_hash", ""),
-                        parent_symbol=metadata.get("parent_symbol") or None,
-                    )
-                )
-
-        return chunks
+        return self._chunks_from_records(results)
 
     def count_decisions(self) -> int:
         """Get total number of decisions."""
-        return self._decisions_collection.count()
+        return self._count(self._decisions_collection)
 
     def clear_all(self) -> None:
         """Clear all data from all collections."""
+        self.invalidate_caches()
         try:
             self._client.delete_collection(CHROMA_COLLECTION_CODE)
             self._client.delete_collection(CHROMA_COLLECTION_DOCS)
             self._client.delete_collection(CHROMA_COLLECTION_DECISIONS)
 
             # Recreate collections
-            self._code_collection = self._client.create_collection(
-                name=CHROMA_COLLECTION_CODE,
-                metadata={"description": "Code chunks from the project"},
-            )
-            self._docs_collection = self._client.create_collection(
-                name=CHROMA_COLLECTION_DOCS,
-                metadata={"description": "Documentation and comments"},
-            )
-            self._decisions_collection = self._client.create_collection(
-                name=CHROMA_COLLECTION_DECISIONS,
-                metadata={"description": "Architectural decisions"},
-            )
+            self._open_collections()
         except Exception as e:
             raise MemoryError(f"Failed to clear collections: {e}") from e
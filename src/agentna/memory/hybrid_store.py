@@ -3,11 +3,18 @@
 from pathlib import Path
 from typing import Any
 
-from agentna.core.constants import CODE_BOOST_FACTOR, CODE_EXTENSIONS, DOC_EXTENSIONS, DOC_PENALTY_FACTOR
+from agentna.core.constants import (
+    CODE_BOOST_FACTOR,
+    CODE_EXTENSIONS,
+    DOC_EXTENSIONS,
+    DOC_PENALTY_FACTOR,
+    INDEX_BATCH_SIZE,
+)
 from agentna.memory.embeddings import EmbeddingStore
 from agentna.memory.knowledge_graph import KnowledgeGraph
 from agentna.memory.models import (
     CodeChunk,
+    CodeChunkBatch,
     Decision,
     GraphNode,
     Relationship,
@@ -24,16 +31,26 @@ class HybridStore:
     This is the primary interface for all memory operations in AgentNA.
     """
 
-    def __init__(self, chroma_dir: Path, graph_path: Path) -> None:
+    def __init__(
+        self,
+        chroma_dir: Path,
+        graph_path: Path,
+        batch_size: int = INDEX_BATCH_SIZE,
+        cache_precision: str | None = None,
+    ) -> None:
         """
         Initialize the hybrid store.
 
         Args:
             chroma_dir: Directory for ChromaDB storage
             graph_path: Path to knowledge graph JSON file
+            batch_size: Chunks embedded and stored per slice in index_chunks
+            cache_precision: Storage format of cached embeddings ("fp32",
+                "bf16" or "int8"); see EmbeddingStore
         """
-        self.embeddings = EmbeddingStore(chroma_dir)
+        self.embeddings = EmbeddingStore(chroma_dir, cache_precision=cache_precision)
         self.graph = KnowledgeGraph(graph_path)
+        self.batch_size = max(1, batch_size)
 
     def index_chunk(
         self,
@@ -85,28 +102,81 @@ class HybridStore:
         if not chunks:
             return
 
+        # Store in slices so embedding texts and vectors for a large
+        # re-index are never all held in memory at once
+        for start in range(0, len(chunks), self.batch_size):
+            end = start + self.batch_size
+            part = chunks[start:end]
+
+            # Add to vector store
+            self.embeddings.add_chunks(part, embeddings[start:end] if embeddings else None)
+
+            # Add nodes to graph
+            self.graph.add_nodes(
+                GraphNode(
+                    id=chunk.id,
+                    node_type=chunk.symbol_type,
+                    name=chunk.symbol_name or chunk.file_path,
+                    file_path=chunk.file_path,
+                    line_start=chunk.line_start,
+                    line_end=chunk.line_end,
+                )
+                for chunk in part
+            )
+
+        # Add relationships
+        if relationships:
+            self.graph.add_relationships(relationships)
+
+        # Append graph changes to its log
+        self.graph.flush()
+
+    def index_chunk_batch(
+        self,
+        batch: CodeChunkBatch,
+        relationships: list[Relationship] | None = None,
+        embeddings: list[list[float]] | None = None,
+    ) -> None:
+        """
+        Index a column-oriented chunk batch with optional relationships.
+
+        Args:
+            batch: Batch of code chunks to index
+            relationships: Optional relationships to add to the graph
+            embeddings: Optional pre-computed embeddings
+        """
+        if not batch:
+            return
+
         # Add to vector store
-        self.embeddings.add_chunks(chunks, embeddings)
+        self.embeddings.add_chunk_batch(batch, embeddings)
 
         # Add nodes to graph
-        for chunk in chunks:
-            node = GraphNode(
-                id=chunk.id,
-                node_type=chunk.symbol_type,
-                name=chunk.symbol_name or chunk.file_path,
-                file_path=chunk.file_path,
-                line_start=chunk.line_start,
-                line_end=chunk.line_end,
+        self.graph.add_nodes(
+            GraphNode(
+                id=chunk_id,
+                node_type=symbol_type,
+                name=symbol_name or file_path,
+                file_path=file_path,
+                line_start=line_start,
+                line_end=line_end,
+            )
+            for chunk_id, symbol_type, symbol_name, file_path, line_start, line_end in zip(
+                batch.ids,
+                batch.symbol_types,
+                batch.symbol_names,
+                batch.file_paths,
+                batch.line_starts,
+                batch.line_ends,
             )
-            self.graph.add_node(node)
+        )
 
         # Add relationships
         if relationships:
-            for rel in relationships:
-                self.graph.add_relationship(rel)
+            self.graph.add_relationships(relationships)
 
-        # Save graph
-        self.graph.save()
+        # Append graph changes to its log
+        self.graph.flush()
 
     def remove_file(self, file_path: str) -> None:
         """
@@ -117,7 +187,7 @@ class HybridStore:
         """
         self.embeddings.delete_by_file(file_path)
         self.graph.remove_nodes_by_file(file_path)
-        self.graph.save()
+        self.graph.flush()
 
     def search(
         self,
@@ -160,18 +230,66 @@ class HybridStore:
         # Trim to requested count
         results = results[:n_results]
 
-        if include_related:
-            # Enrich results with related chunks
+        if include_related and results:
+            # Enrich results with related chunks, resolved for all results at once
+            related = self.graph.get_related_batch([r.chunk.id for r in results], limit=5)
             for result in results:
-                relationships = self.graph.get_relationships(result.chunk.id)
-                related_ids = [
-                    rel.target_id if rel.source_id == result.chunk.id else rel.source_id
-                    for rel in relationships
-                ]
-                result.related_chunks = related_ids[:5]  # Limit related chunks
+                result.related_chunks = related[result.chunk.id]
 
         return results
 
+    def search_batch(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        include_related: bool = True,
+        file_types: list[str] | None = None,
+        query_embeddings: list[list[float]] | None = None,
+        code_priority: bool = True,
+    ) -> list[list[SearchResult]]:
+        """
+        Search for several queries at once, with optional relationship context.
+
+        The queries share one vector search request and one related-chunk
+        lookup. Each query's results match what ``search`` would return.
+
+        Args:
+            queries: Search queries
+            n_results: Maximum number of results per query
+            include_related: Whether to include related chunks
+            file_types: Optional filter for languages, applied to every query
+            query_embeddings: Optional pre-computed query embeddings, one per query
+            code_priority: Prioritize code files over documentation (default True)
+
+        Returns:
+            List of search results for each query, in query order
+        """
+        # Get more results initially to allow for re-ranking
+        fetch_count = n_results * 2 if code_priority else n_results
+
+        batch_results = self.embeddings.search_batch(
+            queries=queries,
+            query_embeddings=query_embeddings,
+            n_results=fetch_count,
+            file_types=file_types,
+        )
+
+        for i, results in enumerate(batch_results):
+            # Re-rank results: code files first, docs last
+            if code_priority and results:
+                results = self._rerank_by_file_type(results)
+            batch_results[i] = results[:n_results]
+
+        if include_related:
+            related = self.graph.get_related_batch(
+                [r.chunk.id for results in batch_results for r in results], limit=5
+            )
+            for results in batch_results:
+                for result in results:
+                    result.related_chunks = related[result.chunk.id]
+
+        return batch_results
+
     def _rerank_by_file_type(self, results: list[SearchResult]) -> list[SearchResult]:
         """
         Re-rank search results to prioritize code over documentation.
@@ -229,19 +347,18 @@ class HybridStore:
         affected_files: set[str] = set()
         affected_symbols: set[str] = set()
 
+        # Get related nodes from graph, resolving each distinct node once
+        related_ids: set[str] = set()
         for result in results:
             affected_files.add(result.chunk.file_path)
+            related_ids.update(self.graph.get_dependents(result.chunk.id, context_depth))
+            related_ids.update(self.graph.get_dependencies(result.chunk.id, context_depth))
 
-            # Get related nodes from graph
-            dependents = self.graph.get_dependents(result.chunk.id, max_depth=context_depth)
-            dependencies = self.graph.get_dependencies(result.chunk.id, max_depth=context_depth)
-
-            for node_id in dependents + dependencies:
-                node = self.graph.get_node(node_id)
-                if node and node.file_path:
-                    affected_files.add(node.file_path)
-                    if node.name:
-                        affected_symbols.add(node.name)
+        for node in self.graph.get_node_views(related_ids).values():
+            if node.file_path:
+                affected_files.add(node.file_path)
+                if node.name:
+                    affected_symbols.add(node.name)
 
         return {
             "results": results,
@@ -324,7 +441,7 @@ class HybridStore:
         chunks = self.embeddings.get_chunks_by_file(file_path)
 
         # Get all nodes from file
-        nodes = self.graph.get_nodes_by_file(file_path)
+        nodes = self.graph.get_node_views_by_file(file_path)
 
         # Get relationships
         all_relationships: list[Relationship] = []
@@ -337,7 +454,7 @@ class HybridStore:
             if include_related:
                 for rel in relationships:
                     other_id = rel.target_id if rel.source_id == node.id else rel.source_id
-                    other_node = self.graph.get_node(other_id)
+                    other_node = self.graph.get_node_view(other_id)
                     if other_node and other_node.file_path and other_node.file_path != file_path:
                         related_files.add(other_node.file_path)
 
@@ -365,20 +482,20 @@ class HybridStore:
             Impact analysis results
         """
         changed_nodes: set[str] = set()
-        affected_nodes: set[str] = set()
         affected_files: set[str] = set()
+        changed_files = set(file_paths)
 
         for file_path in file_paths:
-            nodes = self.graph.get_nodes_by_file(file_path)
-            for node in nodes:
-                changed_nodes.add(node.id)
-                dependents = self.graph.get_dependents(node.id, max_depth)
-                affected_nodes.update(dependents)
+            changed_nodes.update(node.id for node in self.graph.get_node_views_by_file(file_path))
+
+        # One traversal from every changed node expands each dependent once.
+        # It never reports the changed nodes themselves, which are excluded
+        # from the affected symbols and files below anyway.
+        affected_nodes = self.graph.get_dependents_union(changed_nodes, max_depth)
 
         # Get affected files
-        for node_id in affected_nodes:
-            node = self.graph.get_node(node_id)
-            if node and node.file_path and node.file_path not in file_paths:
+        for node in self.graph.get_node_views(affected_nodes).values():
+            if node.file_path and node.file_path not in changed_files:
                 affected_files.add(node.file_path)
 
         # Calculate impact score (simple heuristic)
@@ -439,6 +556,10 @@ class HybridStore:
         """Save all data to disk."""
         self.graph.save()
 
+    def flush(self) -> None:
+        """Append pending graph changes to its log without a full save."""
+        self.graph.flush()
+
     def clear(self) -> None:
         """Clear all data."""
         self.embeddings.clear_all()
@@ -1,71 +1,461 @@
 """NetworkX-based knowledge graph for code relationships."""
 
-import json
+import os
+import queue
+import threading
+import uuid
+from collections import OrderedDict, deque
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterable, Iterator
 
 import networkx as nx
-
+import numpy as np
+
+from agentna.core.constants import (
+    GRAPH_CSR_MIN_EDGES,
+    GRAPH_CSR_REBUILD_QUERIES,
+    GRAPH_GPU_MIN_NODES,
+    GRAPH_TRAVERSAL_CACHE_SIZE,
+    GRAPH_WAL_MAX_RECORDS,
+    GRAPH_WAL_SUFFIX,
+)
 from agentna.core.exceptions import MemoryError
-from agentna.memory.models import GraphNode, Relationship, RelationType, SymbolType
+from agentna.memory.models import GraphNode, NodeView, Relationship, RelationType, SymbolType
+from agentna.utils.serialization import dumps, loads
+
+# Edge attributes stored directly; anything else lives under "metadata"
+_EDGE_FIELDS = frozenset(("relation_type", "weight", "line_number", "metadata"))
+
+# Write-ahead log record kinds. Each log file starts with a header record
+# holding a random token, which a snapshot names when it already covers it.
+_LOG_HEADER = "h"
+_ADD_NODE = "n"
+_ADD_NODES = "ns"
+_ADD_EDGE = "e"
+_ADD_EDGES = "es"
+_REMOVE_NODE = "rn"
+_REMOVE_FILE = "rf"
+
+# Cleared once cuGraph can't be imported or fails, so traversals stay on the CPU
+_gpu_usable = True
+
+
+def _edge_attrs(attrs: dict[str, Any]) -> dict[str, Any]:
+    """Move metadata stored as top-level edge attributes by older versions under "metadata"."""
+    if _EDGE_FIELDS.issuperset(attrs):
+        return attrs
+    extra = attrs.keys() - _EDGE_FIELDS
+    metadata = {**attrs.get("metadata", {}), **{k: attrs[k] for k in extra}}
+    return {
+        **{k: v for k, v in attrs.items() if k not in extra},
+        "metadata": metadata,
+    }
+
+
+def _trigrams(text: str) -> set[str]:
+    """Get the set of three-character substrings of a string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
 
 
 class KnowledgeGraph:
-    """Manages the code knowledge graph using NetworkX."""
+    """Manages the code knowledge graph using NetworkX.
 
-    def __init__(self, graph_path: Path) -> None:
+    The graph is persisted as a compact JSON snapshot plus a write-ahead log
+    of mutations. ``flush()`` appends pending mutations to the log, and
+    ``save()`` writes a new snapshot and empties the log. Loading reads the
+    snapshot and replays the log.
+    """
+
+    def __init__(self, graph_path: Path | None, read_only: bool = False) -> None:
         """
         Initialize the knowledge graph.
 
         Args:
-            graph_path: Path to the JSON file for persistence
+            graph_path: Path to the JSON snapshot file, or None for a graph
+                that is only kept in memory
+            read_only: Load without changing any files, e.g. to read the
+                graph while another process writes it. Mutations are only
+                kept in memory.
         """
-        self.graph_path = Path(graph_path)
+        self._read_only = read_only
+        self.graph_path = Path(graph_path) if graph_path is not None else None
+        self.wal_path = (
+            self.graph_path.with_name(self.graph_path.name + GRAPH_WAL_SUFFIX)
+            if self.graph_path is not None
+            else None
+        )
+        # Log being folded into a snapshot; replayed first if a compaction
+        # was interrupted
+        self._old_wal_path = (
+            self.wal_path.with_name(self.wal_path.name + ".old")
+            if self.wal_path is not None
+            else None
+        )
         self._graph = nx.DiGraph()
-        self._load()
+        # Secondary indexes from attribute value to node IDs. Dicts are used
+        # as insertion-ordered sets so lookups keep graph order.
+        self._by_file: dict[str | None, dict[str, None]] = {}
+        self._by_type: dict[str | None, dict[str, None]] = {}
+        self._by_name_lower: dict[str, dict[str, None]] = {}
+        # Trigram to the distinct lowercased names containing it
+        self._name_trigrams: dict[str, set[str]] = {}
+        # Mutations not yet appended to the log, and records in the log
+        self._pending: list[list[Any]] = []
+        self._wal_records = 0
+        # Serializes mutations with log writes and snapshot capture
+        self._lock = threading.RLock()
+        # Held while a snapshot is written, by save() or the background compactor
+        self._save_lock = threading.Lock()
+        self._compaction_requests: queue.Queue[None] | None = None
+        self._compaction_error: Exception | None = None
+        # Bumped on every mutation so derived results can be cached
+        self._version = 0
+        self._summary_cache: dict[
+            tuple[str, str, int], dict[str, list[tuple[str, str]]] | None
+        ] = {}
+        self._summary_version = -1
+        self._traversal_cache: OrderedDict[tuple[str, int, bool], tuple[str, ...]] = OrderedDict()
+        self._traversal_version = -1
+        self._traversal_lock = threading.Lock()
+        # Compressed sparse row adjacency per direction, rebuilt lazily after
+        # mutations for traversals of large graphs
+        self._csr: dict[bool, tuple[int, list[str], dict[str, int], np.ndarray, np.ndarray]] = {}
+        # Per direction, the version and number of lookups that found the CSR stale
+        self._csr_misses: dict[bool, tuple[int, int]] = {}
+        # cuGraph copy of the reverse adjacency and the version it was built at
+        self._gpu_graph: tuple[int, Any] | None = None
+        if self.graph_path is not None:
+            self._load()
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> "KnowledgeGraph":
+        """
+        Wrap an existing NetworkX graph in an in-memory KnowledgeGraph.
 
-    def _load(self) -> None:
-        """Load graph from disk."""
-        if not self.graph_path.exists():
-            return
+        Args:
+            graph: Graph to wrap; it is used directly, not copied
 
+        Returns:
+            KnowledgeGraph that is never written to disk
+        """
+        result = cls(None)
+        result._graph = graph
+        result._reindex()
+        result._version += 1
+        return result
+
+    def _load(self) -> None:
+        """Load the snapshot from disk and replay the write-ahead log."""
         try:
-            with open(self.graph_path) as f:
-                data = json.load(f)
-
-            # Load nodes
-            for node_data in data.get("nodes", []):
-                self._graph.add_node(
-                    node_data["id"],
-                    **{k: v for k, v in node_data.items() if k != "id"},
+            covered = None
+            if self.graph_path.exists():
+                data = loads(self.graph_path.read_bytes())
+                covered = data.get("log")
+
+                # Load nodes and edges in bulk, straight from the parsed dicts
+                self._graph.add_nodes_from(
+                    (node_data.pop("id"), node_data) for node_data in data.get("nodes", [])
                 )
-
-            # Load edges
-            for edge_data in data.get("edges", []):
-                self._graph.add_edge(
-                    edge_data["source"],
-                    edge_data["target"],
-                    **{k: v for k, v in edge_data.items() if k not in ("source", "target")},
+                self._graph.add_edges_from(
+                    (edge_data.pop("source"), edge_data.pop("target"), _edge_attrs(edge_data))
+                    for edge_data in data.get("edges", [])
                 )
+                del data
+                self._reindex()
+
+            for path in (self._old_wal_path, self.wal_path):
+                self._wal_records += self._replay(path, covered)
         except Exception as e:
             raise MemoryError(f"Failed to load knowledge graph: {e}") from e
+        self._version += 1
+
+        if not self._read_only and self._old_wal_path.exists():
+            # Finish the compaction that was interrupted
+            self.save()
+
+    def _replay(self, path: Path, covered: str | None) -> int:
+        """
+        Apply the records of one log file.
+
+        Args:
+            path: Log file to replay
+            covered: Token of the log already folded into the snapshot
+
+        Returns:
+            Number of records applied
+        """
+        if not path.exists():
+            return 0
+
+        count = 0
+        complete = 0  # Offset just past the last complete record
+        with open(path, "rb" if self._read_only else "rb+") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partial record from an interrupted write. Cut it off so
+                    # the next append doesn't continue the same line.
+                    if not self._read_only:
+                        f.truncate(complete)
+                    break
+                complete += len(line)
+                record = loads(line)
+                if record[0] == _LOG_HEADER:
+                    if record[1] == covered:
+                        return 0
+                    continue
+                if record[0] == _ADD_EDGE:
+                    record[3] = _edge_attrs(record[3])
+                self._apply(record)
+                count += 1
+        return count
 
     def save(self) -> None:
-        """Save graph to disk."""
+        """Write a full snapshot to disk and empty the write-ahead log."""
+        if self.graph_path is None or self._read_only:
+            return
+        with self._save_lock:
+            self._compaction_error = None
+            try:
+                self._write_snapshot()
+            except Exception as e:
+                raise MemoryError(f"Failed to save knowledge graph: {e}") from e
+
+    def flush(self) -> None:
+        """
+        Append pending mutations to the write-ahead log.
+
+        Once the log grows past GRAPH_WAL_MAX_RECORDS, a snapshot is written
+        on a background thread so the caller doesn't wait for it.
+        """
+        if self._compaction_error is not None:
+            error, self._compaction_error = self._compaction_error, None
+            raise MemoryError(f"Failed to compact knowledge graph log: {error}") from error
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                self._append_pending()
+            except Exception as e:
+                raise MemoryError(f"Failed to write knowledge graph log: {e}") from e
+            if self._wal_records > GRAPH_WAL_MAX_RECORDS:
+                # Replaying a long log costs more than writing a snapshot
+                self._request_compaction()
+
+    def close(self) -> None:
+        """Write pending mutations to the log and wait for any background compaction."""
+        self.flush()
+        if self._compaction_requests is not None:
+            self._compaction_requests.join()
+        if self._compaction_error is not None:
+            error, self._compaction_error = self._compaction_error, None
+            raise MemoryError(f"Failed to compact knowledge graph log: {error}") from error
+
+    def _append_pending(self) -> None:
+        """Append pending records to the log, starting a new file with a header."""
+        self.wal_path.parent.mkdir(parents=True, exist_ok=True)
+        data = b"".join(dumps(record, default=str) + b"\n" for record in self._pending)
+        with open(self.wal_path, "ab") as f:
+            if f.tell() == 0:
+                f.write(dumps([_LOG_HEADER, uuid.uuid4().hex]) + b"\n")
+            f.write(data)
+        self._wal_records += len(self._pending)
+        self._pending.clear()
+
+    def _request_compaction(self) -> None:
+        """Ask the background compactor for a snapshot, starting it if needed."""
+        if self._compaction_requests is None:
+            # A single slot coalesces requests made while a snapshot is written
+            self._compaction_requests = queue.Queue(maxsize=1)
+            threading.Thread(
+                target=self._compact_worker, name="graph-compactor", daemon=True
+            ).start()
         try:
-            nodes = []
-            for node_id, attrs in self._graph.nodes(data=True):
-                nodes.append({"id": node_id, **attrs})
+            self._compaction_requests.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def _compact_worker(self) -> None:
+        """Write snapshots requested by flush() until the process exits."""
+        while True:
+            self._compaction_requests.get()
+            try:
+                with self._save_lock:
+                    self._write_snapshot()
+            except Exception as e:
+                # The log is still intact; report on the next flush or close
+                self._compaction_error = e
+            finally:
+                self._compaction_requests.task_done()
+
+    def _write_snapshot(self) -> None:
+        """
+        Capture the graph and write it as a snapshot. Must hold _save_lock.
 
-            edges = []
-            for source, target, attrs in self._graph.edges(data=True):
-                edges.append({"source": source, "target": target, **attrs})
+        The current log is moved aside while the graph is captured, so later
+        mutations go to a fresh log. The snapshot names the moved log's
+        token, so it is never replayed twice if a crash leaves it behind.
+        """
+        with self._lock:
+            if self._pending:
+                self._append_pending()
+            self._rotate_log()
+            covered = self._log_token(self._old_wal_path)
+            nodes = [{"id": node_id, **attrs} for node_id, attrs in self._graph.nodes(data=True)]
+            edges = [
+                {"source": source, "target": target, **attrs}
+                for source, target, attrs in self._graph.edges(data=True)
+            ]
+            self._wal_records = 0
+
+        self.graph_path.parent.mkdir(parents=True, exist_ok=True)
+        # Replace atomically so a crash never leaves a truncated snapshot
+        tmp_path = self.graph_path.with_name(self.graph_path.name + ".tmp")
+        tmp_path.write_bytes(dumps({"nodes": nodes, "edges": edges, "log": covered}, default=str))
+        os.replace(tmp_path, self.graph_path)
+        self._old_wal_path.unlink(missing_ok=True)
+
+    def _rotate_log(self) -> None:
+        """Move the current log aside, merging it into a leftover one."""
+        if not self.wal_path.exists():
+            return
+        if not self._old_wal_path.exists():
+            os.replace(self.wal_path, self._old_wal_path)
+            return
+        # An earlier snapshot failed; keep one log under the older header
+        with open(self.wal_path, "rb") as src, open(self._old_wal_path, "ab") as dst:
+            for line in src:
+                if line.endswith(b"\n") and loads(line)[0] != _LOG_HEADER:
+                    dst.write(line)
+        self.wal_path.unlink()
+
+    @staticmethod
+    def _log_token(path: Path) -> str | None:
+        """Read the header token of a log file, if it has one."""
+        try:
+            with open(path, "rb") as f:
+                first = f.readline()
+        except FileNotFoundError:
+            return None
+        if not first.endswith(b"\n"):
+            return None
+        record = loads(first)
+        return record[1] if record[0] == _LOG_HEADER else None
+
+    def _record(self, record: list[Any]) -> None:
+        """Apply a mutation and queue it for the write-ahead log."""
+        with self._lock:
+            self._apply(record)
+            if self.graph_path is not None and not self._read_only:
+                self._pending.append(record)
+            self._version += 1
+
+    def _apply(self, record: list[Any]) -> None:
+        """Apply one mutation record to the in-memory graph."""
+        kind = record[0]
+        if kind == _ADD_NODE:
+            self._apply_node(record[1], record[2])
+        elif kind == _ADD_NODES:
+            graph = self._graph
+            new_ids = dict.fromkeys(node_id for node_id, _ in record[1] if node_id not in graph)
+            # Nodes already in the graph may need re-indexing, so take the slow path
+            for node_id, attrs in record[1]:
+                if node_id not in new_ids:
+                    self._apply_node(node_id, attrs)
+            graph.add_nodes_from(
+                (node_id, attrs) for node_id, attrs in record[1] if node_id in new_ids
+            )
+            for node_id in new_ids:
+                self._index(node_id)
+        elif kind == _ADD_EDGE:
+            # add_edge creates missing endpoints without attributes
+            new_ids = [n for n in (record[1], record[2]) if n not in self._graph]
+            self._graph.add_edge(record[1], record[2], **record[3])
+            for node_id in new_ids:
+                self._index(node_id)
+        elif kind == _ADD_EDGES:
+            graph = self._graph
+            new_ids = dict.fromkeys(
+                node_id
+                for source, target, _ in record[1]
+                for node_id in (source, target)
+                if node_id not in graph
+            )
+            graph.add_edges_from(record[1])
+            for node_id in new_ids:
+                self._index(node_id)
+        elif kind == _REMOVE_NODE:
+            if record[1] in self._graph:
+                self._unindex(record[1], self._index_keys(record[1]))
+                self._graph.remove_node(record[1])
+        elif kind == _REMOVE_FILE:
+            # Drop the whole file bucket at once; only the type and name
+            # entries need removing per node
+            node_ids = list(self._by_file.pop(record[1], ()))
+            for node_id in node_ids:
+                self._unindex(node_id, self._index_keys(node_id))
+            self._graph.remove_nodes_from(node_ids)
+
+    def _apply_node(self, node_id: str, attrs: dict[str, Any]) -> None:
+        """Add or update one node, keeping the indexes in step."""
+        old_keys = self._index_keys(node_id) if node_id in self._graph else None
+        self._graph.add_node(node_id, **attrs)
+        if old_keys is None:
+            self._index(node_id)
+        elif old_keys != self._index_keys(node_id):
+            self._unindex(node_id, old_keys)
+            self._index(node_id, keep_order=True)
+
+    def _index_keys(self, node_id: str) -> tuple[str | None, str | None, str]:
+        """Get a node's (file path, node type, lowercased name) index keys."""
+        attrs = self._graph.nodes[node_id]
+        return attrs.get("file_path"), attrs.get("node_type"), attrs.get("name", "").lower()
 
-            self.graph_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.graph_path, "w") as f:
-                json.dump({"nodes": nodes, "edges": edges}, f, indent=2, default=str)
-        except Exception as e:
-            raise MemoryError(f"Failed to save knowledge graph: {e}") from e
+    def _index(self, node_id: str, keep_order: bool = False) -> None:
+        """
+        Add a node to the secondary indexes.
+
+        Args:
+            node_id: ID of a node already in the graph
+            keep_order: Re-sort the node's index entries into graph order,
+                for existing nodes whose attributes changed
+        """
+        for index, key in zip(
+            (self._by_file, self._by_type, self._by_name_lower), self._index_keys(node_id)
+        ):
+            ids = index.get(key)
+            if ids is None:
+                ids = index[key] = {}
+                if index is self._by_name_lower:
+                    for trigram in _trigrams(key):
+                        self._name_trigrams.setdefault(trigram, set()).add(key)
+            ids[node_id] = None
+            if keep_order and len(ids) > 1:
+                index[key] = {n: None for n in self._graph if n in ids}
+
+    def _unindex(self, node_id: str, keys: tuple[str | None, str | None, str]) -> None:
+        """Remove a node from the secondary indexes under the given keys."""
+        for index, key in zip((self._by_file, self._by_type, self._by_name_lower), keys):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(node_id, None)
+                if not ids:
+                    del index[key]
+                    if index is self._by_name_lower:
+                        for trigram in _trigrams(key):
+                            names = self._name_trigrams[trigram]
+                            names.discard(key)
+                            if not names:
+                                del self._name_trigrams[trigram]
+
+    def _reindex(self) -> None:
+        """Rebuild the secondary indexes from the graph."""
+        self._by_file.clear()
+        self._by_type.clear()
+        self._by_name_lower.clear()
+        self._name_trigrams.clear()
+        for node_id in self._graph:
+            self._index(node_id)
 
     def add_node(self, node: GraphNode) -> None:
         """
@@ -74,15 +464,30 @@ class KnowledgeGraph:
         Args:
             node: The node to add
         """
-        self._graph.add_node(
-            node.id,
-            node_type=node.node_type.value,
-            name=node.name,
-            file_path=node.file_path,
-            line_start=node.line_start,
-            line_end=node.line_end,
+        self._record([_ADD_NODE, node.id, self._node_attrs(node)])
+
+    def add_nodes(self, nodes: Iterable[GraphNode]) -> None:
+        """
+        Add several nodes to the graph in one bulk insert.
+
+        Args:
+            nodes: The nodes to add
+        """
+        items = [[node.id, self._node_attrs(node)] for node in nodes]
+        if items:
+            self._record([_ADD_NODES, items])
+
+    @staticmethod
+    def _node_attrs(node: GraphNode) -> dict[str, Any]:
+        """Get the attributes stored for a node."""
+        return {
+            "node_type": node.node_type.value,
+            "name": node.name,
+            "file_path": node.file_path,
+            "line_start": node.line_start,
+            "line_end": node.line_end,
             **node.metadata,
-        )
+        }
 
     def add_relationship(self, relationship: Relationship) -> None:
         """
@@ -91,14 +496,35 @@ class KnowledgeGraph:
         Args:
             relationship: The relationship to add
         """
-        self._graph.add_edge(
+        self._record([
+            _ADD_EDGE,
             relationship.source_id,
             relationship.target_id,
-            relation_type=relationship.relation_type.value,
-            weight=relationship.weight,
-            line_number=relationship.line_number,
-            **relationship.metadata,
-        )
+            self._relationship_attrs(relationship),
+        ])
+
+    def add_relationships(self, relationships: Iterable[Relationship]) -> None:
+        """
+        Add several relationships to the graph in one bulk insert.
+
+        Args:
+            relationships: The relationships to add
+        """
+        items = [
+            [rel.source_id, rel.target_id, self._relationship_attrs(rel)] for rel in relationships
+        ]
+        if items:
+            self._record([_ADD_EDGES, items])
+
+    @staticmethod
+    def _relationship_attrs(relationship: Relationship) -> dict[str, Any]:
+        """Get the attributes stored for a relationship's edge."""
+        return {
+            "relation_type": relationship.relation_type.value,
+            "weight": relationship.weight,
+            "line_number": relationship.line_number,
+            **({"metadata": relationship.metadata} if relationship.metadata else {}),
+        }
 
     def remove_node(self, node_id: str) -> None:
         """
@@ -108,7 +534,7 @@ class KnowledgeGraph:
             node_id: ID of the node to remove
         """
         if node_id in self._graph:
-            self._graph.remove_node(node_id)
+            self._record([_REMOVE_NODE, node_id])
 
     def remove_nodes_by_file(self, file_path: str) -> None:
         """
@@ -117,13 +543,8 @@ class KnowledgeGraph:
         Args:
             file_path: Path to the file
         """
-        nodes_to_remove = [
-            node_id
-            for node_id, attrs in self._graph.nodes(data=True)
-            if attrs.get("file_path") == file_path
-        ]
-        for node_id in nodes_to_remove:
-            self._graph.remove_node(node_id)
+        if file_path in self._by_file:
+            self._record([_REMOVE_FILE, file_path])
 
     def get_node(self, node_id: str) -> GraphNode | None:
         """
@@ -138,10 +559,90 @@ class KnowledgeGraph:
         if node_id not in self._graph:
             return None
 
-        attrs = self._graph.nodes[node_id]
+        return self._make_node(node_id, self._graph.nodes[node_id])
+
+    def get_nodes(self, node_ids: Iterable[str]) -> dict[str, GraphNode]:
+        """
+        Get several nodes by ID in one call.
+
+        Args:
+            node_ids: The node IDs
+
+        Returns:
+            Mapping of node ID to GraphNode for the IDs present in the graph
+        """
+        nodes = self._graph.nodes
+        return {
+            node_id: self._make_node(node_id, nodes[node_id])
+            for node_id in dict.fromkeys(node_ids)
+            if node_id in nodes
+        }
+
+    def get_node_view(self, node_id: str) -> NodeView | None:
+        """
+        Get a lightweight view of a node, without building a GraphNode.
+
+        Args:
+            node_id: The node ID
+
+        Returns:
+            NodeView if found, None otherwise
+        """
+        attrs = self._graph.nodes.get(node_id)
+        if attrs is None:
+            return None
+        return self._make_view(node_id, attrs)
+
+    def get_node_views(self, node_ids: Iterable[str]) -> dict[str, NodeView]:
+        """
+        Get lightweight views of several nodes.
+
+        Args:
+            node_ids: The node IDs
+
+        Returns:
+            Mapping of node ID to NodeView for the IDs present in the graph
+        """
+        nodes = self._graph.nodes
+        return {
+            node_id: self._make_view(node_id, nodes[node_id])
+            for node_id in dict.fromkeys(node_ids)
+            if node_id in nodes
+        }
+
+    def get_node_views_by_file(self, file_path: str) -> list[NodeView]:
+        """
+        Get lightweight views of all nodes from a specific file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            List of node views
+        """
+        nodes = self._graph.nodes
+        return [
+            self._make_view(node_id, nodes[node_id]) for node_id in self._by_file.get(file_path, ())
+        ]
+
+    @staticmethod
+    def _make_view(node_id: str, attrs: dict[str, Any]) -> NodeView:
+        """Build a NodeView from a node's stored attributes."""
+        return NodeView(
+            node_id,
+            attrs.get("node_type", "file"),
+            attrs.get("name", ""),
+            attrs.get("file_path"),
+            attrs.get("line_start"),
+            attrs.get("line_end"),
+        )
+
+    @staticmethod
+    def _make_node(node_id: str, attrs: dict[str, Any]) -> GraphNode:
+        """Build a GraphNode from stored node attributes."""
         return GraphNode(
             id=node_id,
-            node_type=SymbolType(attrs.get("node_type", "file")),
+            node_type=SymbolType.coerce(attrs.get("node_type", "file")),
             name=attrs.get("name", ""),
             file_path=attrs.get("file_path"),
             line_start=attrs.get("line_start"),
@@ -170,55 +671,65 @@ class KnowledgeGraph:
         Returns:
             List of relationships
         """
-        relationships = []
+        if node_id not in self._graph:
+            return []
 
+        # A frozenset makes the type filter a constant-time membership test
+        wanted = frozenset(relation_types) if relation_types else None
+        edges: list[tuple[str, str, dict[str, Any]]] = []
         if direction in ("outgoing", "both"):
-            for target in self._graph.successors(node_id):
-                edge_data = self._graph.edges[node_id, target]
-                rel_type = RelationType(edge_data.get("relation_type", "depends_on"))
+            edges.extend(
+                (node_id, target, data) for target, data in self._graph.succ[node_id].items()
+            )
+        if direction in ("incoming", "both"):
+            edges.extend(
+                (source, node_id, data) for source, data in self._graph.pred[node_id].items()
+            )
 
-                if relation_types and rel_type not in relation_types:
-                    continue
+        relationships = []
+        for source, target, edge_data in edges:
+            rel_type = RelationType.coerce(edge_data.get("relation_type", "depends_on"))
+            if wanted is not None and rel_type not in wanted:
+                continue
 
-                relationships.append(
-                    Relationship(
-                        source_id=node_id,
-                        target_id=target,
-                        relation_type=rel_type,
-                        weight=edge_data.get("weight", 1.0),
-                        line_number=edge_data.get("line_number"),
-                        metadata={
-                            k: v
-                            for k, v in edge_data.items()
-                            if k not in ("relation_type", "weight", "line_number")
-                        },
-                    )
+            relationships.append(
+                Relationship(
+                    source_id=source,
+                    target_id=target,
+                    relation_type=rel_type,
+                    weight=edge_data.get("weight", 1.0),
+                    line_number=edge_data.get("line_number"),
+                    metadata=edge_data.get("metadata", {}),
                 )
+            )
 
-        if direction in ("incoming", "both"):
-            for source in self._graph.predecessors(node_id):
-                edge_data = self._graph.edges[source, node_id]
-                rel_type = RelationType(edge_data.get("relation_type", "depends_on"))
+        return relationships
 
-                if relation_types and rel_type not in relation_types:
-                    continue
+    def get_related_batch(self, node_ids: list[str], limit: int = 5) -> dict[str, list[str]]:
+        """
+        Get directly related nodes for several nodes at once.
 
-                relationships.append(
-                    Relationship(
-                        source_id=source,
-                        target_id=node_id,
-                        relation_type=rel_type,
-                        weight=edge_data.get("weight", 1.0),
-                        line_number=edge_data.get("line_number"),
-                        metadata={
-                            k: v
-                            for k, v in edge_data.items()
-                            if k not in ("relation_type", "weight", "line_number")
-                        },
-                    )
-                )
+        Reads the adjacency maps directly instead of building Relationship
+        objects for every edge.
 
-        return relationships
+        Args:
+            node_ids: The node IDs
+            limit: Maximum related IDs per node
+
+        Returns:
+            Mapping of node ID to neighbor IDs, targets of outgoing edges
+            first, then sources of incoming edges
+        """
+        succ = self._graph.succ
+        pred = self._graph.pred
+        return {
+            node_id: (
+                list(islice(chain(succ[node_id], pred[node_id]), limit))
+                if node_id in succ
+                else []
+            )
+            for node_id in node_ids
+        }
 
     def get_dependents(self, node_id: str, max_depth: int = 10) -> list[str]:
         """
@@ -231,26 +742,7 @@ class KnowledgeGraph:
         Returns:
             List of dependent node IDs
         """
-        if node_id not in self._graph:
-            return []
-
-        dependents = set()
-        visited = set()
-        queue = [(node_id, 0)]
-
-        while queue:
-            current, depth = queue.pop(0)
-            if current in visited or depth > max_depth:
-                continue
-
-            visited.add(current)
-
-            for predecessor in self._graph.predecessors(current):
-                if predecessor not in visited:
-                    dependents.add(predecessor)
-                    queue.append((predecessor, depth + 1))
-
-        return list(dependents)
+        return self._traverse_cached(node_id, max_depth, reverse=True)
 
     def get_dependencies(self, node_id: str, max_depth: int = 10) -> list[str]:
         """
@@ -263,26 +755,336 @@ class KnowledgeGraph:
         Returns:
             List of dependency node IDs
         """
-        if node_id not in self._graph:
+        return self._traverse_cached(node_id, max_depth, reverse=False)
+
+    def _traverse_cached(self, node_id: str, max_depth: int, reverse: bool) -> list[str]:
+        """
+        Traverse from a single node, reusing results until the graph changes.
+
+        Args:
+            node_id: The node ID
+            max_depth: Maximum traversal depth
+            reverse: Follow incoming instead of outgoing relationships
+
+        Returns:
+            List of reached node IDs
+        """
+        key = (node_id, max_depth, reverse)
+        with self._traversal_lock:
+            if self._traversal_version != self._version:
+                self._traversal_cache.clear()
+                self._traversal_version = self._version
+            cached = self._traversal_cache.get(key)
+            if cached is not None:
+                self._traversal_cache.move_to_end(key)
+                return list(cached)
+            version = self._version
+
+        if self._use_csr(reverse):
+            reached = self._traverse_csr(node_id, max_depth, reverse)
+        else:
+            neighbors = self._graph.predecessors if reverse else self._graph.successors
+            reached = self._traverse_batch([node_id], max_depth, neighbors)[node_id]
+
+        with self._traversal_lock:
+            # Skip storing if the graph changed during the traversal
+            if self._traversal_version == version == self._version:
+                self._traversal_cache[key] = tuple(reached)
+                if len(self._traversal_cache) > GRAPH_TRAVERSAL_CACHE_SIZE:
+                    self._traversal_cache.popitem(last=False)
+        return reached
+
+    def _use_csr(self, reverse: bool) -> bool:
+        """
+        Decide whether a single-node traversal should use the CSR adjacency.
+
+        A stale CSR is only rebuilt once several lookups have hit the same
+        graph version, so an edit followed by one query doesn't pay for a
+        full rebuild.
+        """
+        if self._graph.number_of_edges() < GRAPH_CSR_MIN_EDGES:
+            return False
+        version = self._version
+        cached = self._csr.get(reverse)
+        if cached is not None and cached[0] == version:
+            return True
+        with self._traversal_lock:
+            seen_version, misses = self._csr_misses.get(reverse, (version, 0))
+            misses = misses + 1 if seen_version == version else 1
+            self._csr_misses[reverse] = (version, misses)
+        return misses >= GRAPH_CSR_REBUILD_QUERIES
+
+    def _csr_adjacency(
+        self, reverse: bool
+    ) -> tuple[list[str], dict[str, int], np.ndarray, np.ndarray]:
+        """
+        Get the CSR adjacency for one direction, rebuilding it if stale.
+
+        Args:
+            reverse: Index incoming instead of outgoing relationships
+
+        Returns:
+            Tuple of node IDs by position, position by node ID, row offsets
+            and neighbor positions
+        """
+        version = self._version
+        cached = self._csr.get(reverse)
+        if cached is not None and cached[0] == version:
+            return cached[1:]
+
+        adjacency = self._graph.pred if reverse else self._graph.succ
+        ids = list(adjacency)
+        positions = {node_id: i for i, node_id in enumerate(ids)}
+        indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum([len(adjacency[node_id]) for node_id in ids], out=indptr[1:])
+        indices = np.fromiter(
+            (positions[neighbor] for node_id in ids for neighbor in adjacency[node_id]),
+            dtype=np.int64,
+            count=int(indptr[-1]),
+        )
+        self._csr[reverse] = (version, ids, positions, indptr, indices)
+        return ids, positions, indptr, indices
+
+    def _traverse_csr(self, node_id: str, max_depth: int, reverse: bool) -> list[str]:
+        """
+        Breadth-first search from one node over the CSR adjacency.
+
+        Each level is expanded with array operations instead of per-edge
+        Python work. Nodes are reported in the same breadth-first order as
+        ``_traverse_batch``.
+        """
+        ids, positions, indptr, indices = self._csr_adjacency(reverse)
+        start = positions.get(node_id)
+        if start is None:
             return []
 
-        dependencies = set()
-        visited = set()
-        queue = [(node_id, 0)]
+        visited = np.zeros(len(ids), dtype=bool)
+        visited[start] = True
+        frontier = np.array([start], dtype=np.int64)
+        reached: list[np.ndarray] = []
+
+        for _ in range(max_depth + 1):
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if not total:
+                break
+            # Gather every neighbor slice of the frontier in one index array,
+            # in frontier order, and keep the first sighting of each new node
+            row_starts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+            neighbors = indices[row_starts + np.arange(total)]
+            neighbors = neighbors[~visited[neighbors]]
+            if not len(neighbors):
+                break
+            _, first = np.unique(neighbors, return_index=True)
+            frontier = neighbors[np.sort(first)]
+            visited[frontier] = True
+            reached.append(frontier)
+
+        return [ids[i] for level in reached for i in level.tolist()]
+
+    def get_dependents_batch(
+        self,
+        node_ids: list[str],
+        max_depth: int = 10,
+    ) -> dict[str, list[str]]:
+        """
+        Get dependents of several nodes with a single traversal.
+
+        Args:
+            node_ids: The node IDs
+            max_depth: Maximum traversal depth
+
+        Returns:
+            Mapping of each node ID to the dependents first reached from it
+        """
+        return self._traverse_batch(node_ids, max_depth, self._graph.predecessors)
+
+    def get_dependencies_batch(
+        self,
+        node_ids: list[str],
+        max_depth: int = 10,
+    ) -> dict[str, list[str]]:
+        """
+        Get dependencies of several nodes with a single traversal.
+
+        Args:
+            node_ids: The node IDs
+            max_depth: Maximum traversal depth
+
+        Returns:
+            Mapping of each node ID to the dependencies first reached from it
+        """
+        return self._traverse_batch(node_ids, max_depth, self._graph.successors)
+
+    def _traverse_batch(
+        self,
+        node_ids: list[str],
+        max_depth: int,
+        neighbors: Callable[[str], Iterator[str]],
+    ) -> dict[str, list[str]]:
+        """
+        Breadth-first search seeded from all nodes at once.
+
+        The visited set is shared, so each reachable node is expanded once and
+        reported under the first source that reaches it. The union of the
+        lists equals the union of the per-node traversals minus the sources
+        themselves.
+        """
+        result: dict[str, list[str]] = {node_id: [] for node_id in node_ids}
+        sources = [node_id for node_id in result if node_id in self._graph]
+
+        visited = set(sources)
+        queue = deque((node_id, node_id, 0) for node_id in sources)
 
         while queue:
-            current, depth = queue.pop(0)
-            if current in visited or depth > max_depth:
+            current, origin, depth = queue.popleft()
+            if depth > max_depth:
                 continue
 
-            visited.add(current)
+            for neighbor in neighbors(current):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    result[origin].append(neighbor)
+                    queue.append((neighbor, origin, depth + 1))
 
-            for successor in self._graph.successors(current):
-                if successor not in visited:
-                    dependencies.add(successor)
-                    queue.append((successor, depth + 1))
+        return result
 
-        return list(dependencies)
+    def get_dependents_union(self, node_ids: Iterable[str], max_depth: int = 10) -> set[str]:
+        """
+        Get every node that depends on any of the given nodes.
+
+        Large graphs are traversed on the GPU when cuGraph is installed;
+        otherwise this is the union of ``get_dependents_batch``.
+
+        Args:
+            node_ids: The node IDs
+            max_depth: Maximum traversal depth
+
+        Returns:
+            Set of dependent node IDs, excluding the given nodes
+        """
+        node_ids = list(node_ids)
+        if _gpu_usable and self._graph.number_of_nodes() >= GRAPH_GPU_MIN_NODES:
+            reached = self._dependents_gpu(node_ids, max_depth)
+            if reached is not None:
+                return reached
+
+        reached: set[str] = set()
+        for dependents in self.get_dependents_batch(node_ids, max_depth).values():
+            reached.update(dependents)
+        return reached
+
+    def _dependents_gpu(self, node_ids: list[str], max_depth: int) -> set[str] | None:
+        """
+        Multi-source breadth-first search over incoming edges with cuGraph.
+
+        The cuGraph graph is built from the reverse CSR adjacency, with node
+        positions as vertex IDs, and rebuilt after the graph changes.
+
+        Returns:
+            Set of dependent node IDs, or None if the GPU can't be used
+        """
+        global _gpu_usable
+        try:
+            return self._dependents_cugraph(node_ids, max_depth)
+        except Exception:
+            # RAPIDS is missing (it is installed from NVIDIA's index), or CUDA
+            # is unavailable or broken, which raises more than ImportError
+            _gpu_usable = False
+            return None
+
+    def _dependents_cugraph(self, node_ids: list[str], max_depth: int) -> set[str]:
+        """Run the cuGraph search for _dependents_gpu, importing RAPIDS on first use."""
+        import cudf
+        import cugraph
+
+        ids, positions, indptr, indices = self._csr_adjacency(reverse=True)
+        version = self._version
+        if self._gpu_graph is None or self._gpu_graph[0] != version:
+            edges = cudf.DataFrame({
+                "src": np.repeat(np.arange(len(ids), dtype=np.int64), np.diff(indptr)),
+                "dst": indices,
+            })
+            gpu_graph = cugraph.Graph(directed=True)
+            gpu_graph.from_cudf_edgelist(edges, source="src", destination="dst", renumber=False)
+            self._gpu_graph = (version, gpu_graph)
+        gpu_graph = self._gpu_graph[1]
+
+        # Only nodes with dependents are vertices of the edge list
+        sources = [
+            positions[node_id]
+            for node_id in node_ids
+            if node_id in positions and indptr[positions[node_id] + 1] > indptr[positions[node_id]]
+        ]
+        if not sources:
+            return set()
+
+        # The dict-based traversal reports nodes up to max_depth + 1 hops away
+        result = cugraph.bfs(
+            gpu_graph,
+            start=cudf.Series(sources, dtype="int64"),
+            depth_limit=max_depth + 1,
+            return_predecessors=False,
+        )
+        distances = result["distance"]
+        reached = result["vertex"][(distances > 0) & (distances <= max_depth + 1)]
+        return {ids[i] for i in reached.to_numpy().tolist()}
+
+    def dependency_summary(
+        self,
+        file_path: str,
+        direction: str = "both",
+        max_depth: int = 2,
+        limit_per_node: int = 15,
+    ) -> dict[str, list[tuple[str, str]]] | None:
+        """
+        Summarize what a file depends on and what depends on it.
+
+        Runs one batched traversal per direction from all of the file's nodes
+        and resolves the reached nodes to names and types. Results are cached
+        until the graph is next modified.
+
+        Args:
+            file_path: Path to the file
+            direction: "incoming", "outgoing", or "both"
+            max_depth: Maximum traversal depth
+            limit_per_node: Maximum entries reported per file node
+
+        Returns:
+            Mapping of direction to (name, node type) pairs, or None if the
+            file has no nodes
+        """
+        if self._summary_version != self._version:
+            self._summary_cache.clear()
+            self._summary_version = self._version
+
+        key = (file_path, direction, max_depth)
+        if key in self._summary_cache:
+            return self._summary_cache[key]
+
+        node_ids = list(self._by_file.get(file_path, ()))
+        summary: dict[str, list[tuple[str, str]]] | None = None
+        if node_ids:
+            summary = {}
+            nodes = self._graph.nodes
+            if direction in ("outgoing", "both"):
+                reached = self.get_dependencies_batch(node_ids, max_depth)
+                summary["outgoing"] = [
+                    (nodes[dep].get("name", ""), nodes[dep].get("node_type", "file"))
+                    for deps in reached.values()
+                    for dep in deps[:limit_per_node]
+                ]
+            if direction in ("incoming", "both"):
+                reached = self.get_dependents_batch(node_ids, max_depth)
+                summary["incoming"] = [
+                    (nodes[dep].get("name", ""), nodes[dep].get("node_type", "file"))
+                    for deps in reached.values()
+                    for dep in deps[:limit_per_node]
+                ]
+
+        self._summary_cache[key] = summary
+        return summary
 
     def find_path(self, source_id: str, target_id: str) -> list[str] | None:
         """
@@ -296,12 +1098,55 @@ class KnowledgeGraph:
             List of node IDs forming the path, or None if no path exists
         """
         try:
-            return nx.shortest_path(self._graph, source_id, target_id)
+            return nx.bidirectional_shortest_path(self._graph, source_id, target_id)
         except nx.NetworkXNoPath:
             return None
         except nx.NodeNotFound:
             return None
 
+    def find_paths(self, source_id: str, target_ids: Iterable[str]) -> dict[str, list[str]]:
+        """
+        Find shortest paths from one node to several targets.
+
+        Runs a single breadth-first search that stops once every target is
+        reached, instead of one search per target.
+
+        Args:
+            source_id: Source node ID
+            target_ids: Target node IDs
+
+        Returns:
+            Mapping of each reachable target ID to its path of node IDs
+        """
+        if source_id not in self._graph:
+            return {}
+
+        remaining = set(target_ids)
+        paths: dict[str, list[str]] = {}
+        if source_id in remaining:
+            remaining.discard(source_id)
+            paths[source_id] = [source_id]
+
+        succ = self._graph.succ
+        parents: dict[str, str] = {}
+        visited = {source_id}
+        queue = deque([source_id])
+        while queue and remaining:
+            current = queue.popleft()
+            for successor in succ[current]:
+                if successor in visited:
+                    continue
+                visited.add(successor)
+                parents[successor] = current
+                queue.append(successor)
+                if successor in remaining:
+                    remaining.discard(successor)
+                    path = [successor]
+                    while path[-1] != source_id:
+                        path.append(parents[path[-1]])
+                    paths[successor] = path[::-1]
+        return paths
+
     def get_nodes_by_file(self, file_path: str) -> list[GraphNode]:
         """
         Get all nodes from a specific file.
@@ -312,25 +1157,10 @@ class KnowledgeGraph:
         Returns:
             List of nodes
         """
-        nodes = []
-        for node_id, attrs in self._graph.nodes(data=True):
-            if attrs.get("file_path") == file_path:
-                nodes.append(
-                    GraphNode(
-                        id=node_id,
-                        node_type=SymbolType(attrs.get("node_type", "file")),
-                        name=attrs.get("name", ""),
-                        file_path=attrs.get("file_path"),
-                        line_start=attrs.get("line_start"),
-                        line_end=attrs.get("line_end"),
-                        metadata={
-                            k: v
-                            for k, v in attrs.items()
-                            if k not in ("node_type", "name", "file_path", "line_start", "line_end")
-                        },
-                    )
-                )
-        return nodes
+        nodes = self._graph.nodes
+        return [
+            self._make_node(node_id, nodes[node_id]) for node_id in self._by_file.get(file_path, ())
+        ]
 
     def get_nodes_by_type(self, node_type: SymbolType) -> list[GraphNode]:
         """
@@ -342,25 +1172,11 @@ class KnowledgeGraph:
         Returns:
             List of nodes
         """
-        nodes = []
-        for node_id, attrs in self._graph.nodes(data=True):
-            if attrs.get("node_type") == node_type.value:
-                nodes.append(
-                    GraphNode(
-                        id=node_id,
-                        node_type=node_type,
-                        name=attrs.get("name", ""),
-                        file_path=attrs.get("file_path"),
-                        line_start=attrs.get("line_start"),
-                        line_end=attrs.get("line_end"),
-                        metadata={
-                            k: v
-                            for k, v in attrs.items()
-                            if k not in ("node_type", "name", "file_path", "line_start", "line_end")
-                        },
-                    )
-                )
-        return nodes
+        nodes = self._graph.nodes
+        return [
+            self._make_node(node_id, nodes[node_id])
+            for node_id in self._by_type.get(node_type.value, ())
+        ]
 
     def search_nodes(
         self,
@@ -377,37 +1193,48 @@ class KnowledgeGraph:
         Returns:
             List of matching nodes
         """
-        nodes = []
-        for node_id, attrs in self._graph.nodes(data=True):
-            name = attrs.get("name", "")
-            node_type_str = attrs.get("node_type", "file")
-
-            # Check name pattern
-            if name_pattern and name_pattern.lower() not in name.lower():
-                continue
-
-            # Check node type
-            if node_types:
-                if node_type_str not in [t.value for t in node_types]:
-                    continue
-
-            nodes.append(
-                GraphNode(
-                    id=node_id,
-                    node_type=SymbolType(node_type_str),
-                    name=name,
-                    file_path=attrs.get("file_path"),
-                    line_start=attrs.get("line_start"),
-                    line_end=attrs.get("line_end"),
-                    metadata={
-                        k: v
-                        for k, v in attrs.items()
-                        if k not in ("node_type", "name", "file_path", "line_start", "line_end")
-                    },
+        # Index buckets keep graph order, so a single bucket can be walked
+        # directly; anything else is filtered against the graph order
+        ordered: Iterable[str] = self._graph
+        allowed: set[str] | None = None
+
+        if node_types:
+            # Nodes without a stored type are treated as files
+            type_keys = frozenset(t.value for t in node_types)
+            if SymbolType.FILE.value in type_keys:
+                type_keys |= {None}
+            buckets = [self._by_type[key] for key in type_keys if key in self._by_type]
+            if not buckets:
+                return []
+            if len(buckets) == 1:
+                ordered = buckets[0]
+            else:
+                allowed = set().union(*buckets)
+
+        if name_pattern:
+            pattern = name_pattern.lower()
+            names: Iterable[str] = self._by_name_lower
+            if len(pattern) >= 3:
+                # Only names sharing every trigram of the pattern can contain it
+                postings = sorted(
+                    (self._name_trigrams.get(trigram, set()) for trigram in _trigrams(pattern)),
+                    key=len,
                 )
-            )
-
-        return nodes
+                names = postings[0].intersection(*postings[1:])
+            matched = {
+                node_id
+                for name in names
+                if pattern in name
+                for node_id in self._by_name_lower[name]
+            }
+            allowed = matched if allowed is None else allowed & matched
+
+        nodes = self._graph.nodes
+        return [
+            self._make_node(node_id, nodes[node_id])
+            for node_id in ordered
+            if allowed is None or node_id in allowed
+        ]
 
     def get_impact_subgraph(
         self,
@@ -430,17 +1257,7 @@ class KnowledgeGraph:
             dependents = self.get_dependents(node_id, max_depth)
             affected_nodes.update(dependents)
 
-        # Create subgraph
-        subgraph = self._graph.subgraph(affected_nodes).copy()
-
-        # Create new KnowledgeGraph instance with the subgraph
-        # Save to a temp path for now
-        import tempfile
-
-        temp_path = Path(tempfile.mktemp(suffix=".json"))
-        result = KnowledgeGraph(temp_path)
-        result._graph = subgraph
-        return result
+        return KnowledgeGraph.from_graph(self._graph.subgraph(affected_nodes).copy())
 
     def node_count(self) -> int:
         """Get total number of nodes."""
@@ -452,7 +1269,10 @@ class KnowledgeGraph:
 
     def clear(self) -> None:
         """Clear all nodes and edges."""
-        self._graph.clear()
+        with self._lock:
+            self._graph.clear()
+            self._reindex()
+        self._version += 1
         self.save()
 
     def iter_nodes(self) -> Iterator[GraphNode]:
@@ -460,7 +1280,7 @@ class KnowledgeGraph:
         for node_id, attrs in self._graph.nodes(data=True):
             yield GraphNode(
                 id=node_id,
-                node_type=SymbolType(attrs.get("node_type", "file")),
+                node_type=SymbolType.coerce(attrs.get("node_type", "file")),
                 name=attrs.get("name", ""),
                 file_path=attrs.get("file_path"),
                 line_start=attrs.get("line_start"),
@@ -478,12 +1298,8 @@ class KnowledgeGraph:
             yield Relationship(
                 source_id=source,
                 target_id=target,
-                relation_type=RelationType(attrs.get("relation_type", "depends_on")),
+                relation_type=RelationType.coerce(attrs.get("relation_type", "depends_on")),
                 weight=attrs.get("weight", 1.0),
                 line_number=attrs.get("line_number"),
-                metadata={
-                    k: v
-                    for k, v in attrs.items()
-                    if k not in ("relation_type", "weight", "line_number")
-                },
+                metadata=attrs.get("metadata", {}),
             )
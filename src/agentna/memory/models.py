@@ -1,13 +1,37 @@
 """Data models for AgentNA memory and storage."""
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Iterator, NamedTuple, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class SymbolType(str, Enum):
+class _CoercibleEnum(str, Enum):
+    """String enum that converts stored values with a direct member lookup."""
+
+    @classmethod
+    def coerce(cls, value: Any) -> Self:
+        """
+        Get the member for a value, skipping the Enum call machinery.
+
+        Args:
+            value: A member or its value
+
+        Returns:
+            The matching member
+
+        Raises:
+            ValueError: If the value is not a member's value
+        """
+        member = cls._value2member_map_.get(value)
+        return member if member is not None else cls(value)
+
+
+class SymbolType(_CoercibleEnum):
     """Types of code symbols."""
 
     FILE = "file"
@@ -21,7 +45,7 @@ class SymbolType(str, Enum):
     DECORATOR = "decorator"
 
 
-class RelationType(str, Enum):
+class RelationType(_CoercibleEnum):
     """Types of relationships between code elements."""
 
     IMPORTS = "imports"  # A imports B
@@ -35,7 +59,7 @@ class RelationType(str, Enum):
     INSTANTIATES = "instantiates"  # A creates instance of B
 
 
-class ChangeType(str, Enum):
+class ChangeType(_CoercibleEnum):
     """Types of code changes."""
 
     ADDED = "added"
@@ -47,6 +71,8 @@ class ChangeType(str, Enum):
 class CodeChunk(BaseModel):
     """Represents a chunk of code for embedding and retrieval."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique identifier (file_path:line_start:line_end)")
     file_path: str = Field(..., description="Relative path to the file")
     language: str = Field(..., description="Programming language")
@@ -63,15 +89,208 @@ class CodeChunk(BaseModel):
 
     def to_embedding_text(self) -> str:
         """Convert chunk to text for embedding."""
-        parts = []
-        if self.symbol_name:
-            parts.append(f"{self.symbol_type.value}: {self.symbol_name}")
-        if self.signature:
-            parts.append(f"Signature: {self.signature}")
-        if self.docstring:
-            parts.append(f"Documentation: {self.docstring}")
-        parts.append(f"Code:\n{self.content}")
-        return "\n".join(parts)
+        return _embedding_text(
+            self.symbol_type,
+            self.symbol_name,
+            self.signature,
+            self.docstring,
+            self.content,
+            self.content_hash,
+        )
+
+
+# Recently built embedding texts keyed by content hash and the symbol fields
+# that go into the text. Re-indexing unchanged code rebuilds chunks with the
+# same hashes, so the text is reused instead of being concatenated again.
+_EMBEDDING_TEXT_CACHE_SIZE = 4096
+_embedding_text_cache: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+_embedding_text_cache_lock = threading.Lock()
+
+
+def _embedding_text(
+    symbol_type: SymbolType,
+    symbol_name: str | None,
+    signature: str | None,
+    docstring: str | None,
+    content: str,
+    content_hash: str = "",
+) -> str:
+    """Build the text that is embedded for a chunk, reusing recent results."""
+    if not content_hash:
+        return _build_embedding_text(symbol_type, symbol_name, signature, docstring, content)
+
+    key = (content_hash, len(content), symbol_type, symbol_name, signature, docstring)
+    with _embedding_text_cache_lock:
+        text = _embedding_text_cache.get(key)
+        if text is not None:
+            _embedding_text_cache.move_to_end(key)
+            return text
+
+    text = _build_embedding_text(symbol_type, symbol_name, signature, docstring, content)
+
+    with _embedding_text_cache_lock:
+        _embedding_text_cache[key] = text
+        if len(_embedding_text_cache) > _EMBEDDING_TEXT_CACHE_SIZE:
+            _embedding_text_cache.popitem(last=False)
+    return text
+
+
+# Embedding text templates indexed by which of symbol name, signature and
+# docstring are present (bits 2, 1 and 0), so each text is one f-string
+_EMBED_TEMPLATES: tuple[Callable[[SymbolType, Any, Any, Any, str], str], ...] = (
+    lambda t, n, s, d, c: f"Code:\n{c}",
+    lambda t, n, s, d, c: f"Documentation: {d}\nCode:\n{c}",
+    lambda t, n, s, d, c: f"Signature: {s}\nCode:\n{c}",
+    lambda t, n, s, d, c: f"Signature: {s}\nDocumentation: {d}\nCode:\n{c}",
+    lambda t, n, s, d, c: f"{t.value}: {n}\nCode:\n{c}",
+    lambda t, n, s, d, c: f"{t.value}: {n}\nDocumentation: {d}\nCode:\n{c}",
+    lambda t, n, s, d, c: f"{t.value}: {n}\nSignature: {s}\nCode:\n{c}",
+    lambda t, n, s, d, c: f"{t.value}: {n}\nSignature: {s}\nDocumentation: {d}\nCode:\n{c}",
+)
+
+
+def _build_embedding_text(
+    symbol_type: SymbolType,
+    symbol_name: str | None,
+    signature: str | None,
+    docstring: str | None,
+    content: str,
+) -> str:
+    """Build the text that is embedded for a chunk."""
+    template = _EMBED_TEMPLATES[
+        (bool(symbol_name) << 2) | (bool(signature) << 1) | bool(docstring)
+    ]
+    return template(symbol_type, symbol_name, signature, docstring, content)
+
+
+@dataclass(slots=True)
+class CodeChunkBatch:
+    """Column-oriented collection of code chunks.
+
+    Parsers append rows without building a model per chunk, and the store
+    consumes the columns directly. ``CodeChunk`` objects are only
+    materialized when the batch is iterated.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    file_paths: list[str] = field(default_factory=list)
+    languages: list[str] = field(default_factory=list)
+    symbol_names: list[str | None] = field(default_factory=list)
+    symbol_types: list[SymbolType] = field(default_factory=list)
+    line_starts: list[int] = field(default_factory=list)
+    line_ends: list[int] = field(default_factory=list)
+    contents: list[str] = field(default_factory=list)
+    docstrings: list[str | None] = field(default_factory=list)
+    signatures: list[str | None] = field(default_factory=list)
+    parent_symbols: list[str | None] = field(default_factory=list)
+    content_hashes: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[CodeChunk]:
+        """
+        Materialize chunks row by row.
+
+        Rows are trusted, but pydantic-core's compiled validator still builds
+        a model faster than the pure-Python ``model_construct``.
+        """
+        for row in zip(
+            self.ids,
+            self.file_paths,
+            self.languages,
+            self.symbol_names,
+            self.symbol_types,
+            self.line_starts,
+            self.line_ends,
+            self.contents,
+            self.docstrings,
+            self.signatures,
+            self.parent_symbols,
+            self.content_hashes,
+        ):
+            yield CodeChunk(
+                id=row[0],
+                file_path=row[1],
+                language=row[2],
+                symbol_name=row[3],
+                symbol_type=row[4],
+                line_start=row[5],
+                line_end=row[6],
+                content=row[7],
+                docstring=row[8],
+                signature=row[9],
+                parent_symbol=row[10],
+                content_hash=row[11],
+            )
+
+    def append(
+        self,
+        id: str,
+        file_path: str,
+        language: str,
+        symbol_type: SymbolType,
+        line_start: int,
+        line_end: int,
+        content: str,
+        content_hash: str,
+        symbol_name: str | None = None,
+        docstring: str | None = None,
+        signature: str | None = None,
+        parent_symbol: str | None = None,
+    ) -> None:
+        """Append one chunk as a row."""
+        self.ids.append(id)
+        self.file_paths.append(file_path)
+        self.languages.append(language)
+        self.symbol_names.append(symbol_name)
+        self.symbol_types.append(symbol_type)
+        self.line_starts.append(line_start)
+        self.line_ends.append(line_end)
+        self.contents.append(content)
+        self.docstrings.append(docstring)
+        self.signatures.append(signature)
+        self.parent_symbols.append(parent_symbol)
+        self.content_hashes.append(content_hash)
+
+    @classmethod
+    def from_chunks(cls, chunks: list[CodeChunk]) -> "CodeChunkBatch":
+        """Build a batch from already materialized chunks."""
+        batch = cls()
+        for chunk in chunks:
+            batch.append(
+                id=chunk.id,
+                file_path=chunk.file_path,
+                language=chunk.language,
+                symbol_type=chunk.symbol_type,
+                line_start=chunk.line_start,
+                line_end=chunk.line_end,
+                content=chunk.content,
+                content_hash=chunk.content_hash,
+                symbol_name=chunk.symbol_name,
+                docstring=chunk.docstring,
+                signature=chunk.signature,
+                parent_symbol=chunk.parent_symbol,
+            )
+        return batch
+
+    def to_chunks(self) -> list[CodeChunk]:
+        """Materialize all rows as chunks."""
+        return list(self)
+
+    def embedding_texts(self) -> list[str]:
+        """Build the embedding text for every row."""
+        return [
+            _embedding_text(symbol_type, symbol_name, signature, docstring, content, content_hash)
+            for symbol_type, symbol_name, signature, docstring, content, content_hash in zip(
+                self.symbol_types,
+                self.symbol_names,
+                self.signatures,
+                self.docstrings,
+                self.contents,
+                self.content_hashes,
+            )
+        ]
 
 
 class FileRecord(BaseModel):
@@ -92,6 +311,8 @@ class FileRecord(BaseModel):
 class Relationship(BaseModel):
     """An edge in the knowledge graph representing a relationship between code elements."""
 
+    model_config = ConfigDict(frozen=True)
+
     source_id: str = Field(..., description="Source symbol or file ID")
     target_id: str = Field(..., description="Target symbol or file ID")
     relation_type: RelationType = Field(..., description="Type of relationship")
@@ -148,6 +369,8 @@ class Convention(BaseModel):
 class GraphNode(BaseModel):
     """A node in the knowledge graph."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique node ID")
     node_type: SymbolType = Field(..., description="Type of node")
     name: str = Field(..., description="Display name")
@@ -157,6 +380,17 @@ class GraphNode(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+class NodeView(NamedTuple):
+    """Lightweight read-only view of a graph node's standard fields."""
+
+    id: str
+    node_type: str
+    name: str
+    file_path: str | None
+    line_start: int | None
+    line_end: int | None
+
+
 class IndexStatus(BaseModel):
     """Status of the project index."""
 
@@ -186,6 +420,8 @@ class SymbolSummary(BaseModel):
     This is the core of AgentNA's memory - understand once, remember forever.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Symbol ID (matches CodeChunk.id)")
     symbol_name: str = Field(..., description="Name of the function/class/method")
     symbol_type: SymbolType = Field(..., description="Type of symbol")
@@ -1,16 +1,21 @@
 """Git integration for tracking changes."""
 
+import threading
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from git import Repo
-from git.exc import InvalidGitRepositoryError
-
+from agentna.core.constants import GIT_COMMIT_CACHE_SIZE
 from agentna.memory.models import ChangeRecord, ChangeType
 
+if TYPE_CHECKING:
+    from git import Repo
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GitChange:
     """Represents a change from git."""
 
@@ -20,7 +25,7 @@ class GitChange:
     deletions: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommitInfo:
     """Information about a git commit."""
 
@@ -33,6 +38,24 @@ class CommitInfo:
     files_changed: list[GitChange]
 
 
+# Git change status letters; anything else is treated as a modification
+_DIFF_TYPE_MAP = {
+    "A": ChangeType.ADDED,
+    "D": ChangeType.DELETED,
+    "M": ChangeType.MODIFIED,
+    "R": ChangeType.RENAMED,
+}
+
+# git log format for _log_commits: each commit starts with a record separator
+# and its fields, ending with the full message, are split by unit separators
+_LOG_FORMAT = "%x1e%H%x1f%P%x1f%an%x1f%ae%x1f%ct%x1f%B%x1f"
+
+# Commits are immutable, so their info and diff are kept per repository and
+# commit hash for the life of the process instead of re-running git diff
+_commit_cache: OrderedDict[tuple[str, str], CommitInfo] = OrderedDict()
+_commit_cache_lock = threading.Lock()
+
+
 class GitTracker:
     """Track changes using git."""
 
@@ -47,9 +70,13 @@ class GitTracker:
         self._repo: Repo | None = None
 
     @property
-    def repo(self) -> Repo | None:
+    def repo(self) -> "Repo | None":
         """Get the git repository."""
         if self._repo is None:
+            # GitPython is slow to import, so only load it once git is needed
+            from git import Repo
+            from git.exc import InvalidGitRepositoryError
+
             try:
                 self._repo = Repo(self.project_path, search_parent_directories=True)
             except InvalidGitRepositoryError:
@@ -87,14 +114,10 @@ class GitTracker:
         if not self.repo:
             return []
 
-        commits = []
         try:
-            for commit in self.repo.iter_commits(max_count=limit):
-                commits.append(self._commit_to_info(commit))
+            return self._log_commits(limit)
         except Exception:
-            pass
-
-        return commits
+            return []
 
     def get_commit(self, commit_hash: str) -> CommitInfo | None:
         """Get information about a specific commit."""
@@ -115,27 +138,9 @@ class GitTracker:
         changes: list[GitChange] = []
 
         try:
-            # Get staged changes
-            staged = self.repo.index.diff("HEAD")
-            for diff in staged:
-                change_type = self._diff_type_to_change_type(diff.change_type)
-                changes.append(
-                    GitChange(
-                        file_path=diff.a_path or diff.b_path or "",
-                        change_type=change_type,
-                    )
-                )
-
-            # Get unstaged changes
-            unstaged = self.repo.index.diff(None)
-            for diff in unstaged:
-                change_type = self._diff_type_to_change_type(diff.change_type)
-                changes.append(
-                    GitChange(
-                        file_path=diff.a_path or diff.b_path or "",
-                        change_type=change_type,
-                    )
-                )
+            # Staged changes, then unstaged ones
+            changes.extend(self._diff_name_status("--cached", "HEAD"))
+            changes.extend(self._diff_name_status())
 
             # Get untracked files
             for file_path in self.repo.untracked_files:
@@ -161,15 +166,7 @@ class GitTracker:
         changes: list[GitChange] = []
 
         try:
-            diff = self.repo.commit(from_commit).diff(self.repo.commit(to_commit))
-            for d in diff:
-                change_type = self._diff_type_to_change_type(d.change_type)
-                changes.append(
-                    GitChange(
-                        file_path=d.a_path or d.b_path or "",
-                        change_type=change_type,
-                    )
-                )
+            changes = self._diff_name_status(from_commit, to_commit)
         except Exception:
             pass
 
@@ -180,14 +177,10 @@ class GitTracker:
         if not self.repo:
             return []
 
-        commits = []
         try:
-            for commit in self.repo.iter_commits(paths=file_path, max_count=limit):
-                commits.append(self._commit_to_info(commit))
+            return self._log_commits(limit, file_path)
         except Exception:
-            pass
-
-        return commits
+            return []
 
     def get_blame(self, file_path: str) -> list[tuple[CommitInfo, int, int, str]]:
         """
@@ -199,45 +192,90 @@ class GitTracker:
         if not self.repo:
             return []
 
-        blame_info = []
         try:
-            blame = self.repo.blame("HEAD", file_path)
-            for commit, lines in blame:
-                info = CommitInfo(
-                    hash=commit.hexsha,
-                    short_hash=commit.hexsha[:7],
-                    author=commit.author.name,
-                    email=commit.author.email,
-                    message=commit.message.strip(),
-                    timestamp=datetime.fromtimestamp(commit.committed_date),
-                    files_changed=[],
-                )
-                blame_info.append((info, 0, 0, "\n".join(lines)))
+            return self._parse_blame(self.repo.git.blame("--porcelain", "HEAD", "--", file_path))
         except Exception:
-            pass
+            return []
+
+    def _parse_blame(self, output: str) -> list[tuple[CommitInfo, int, int, str]]:
+        """
+        Parse ``git blame --porcelain`` output into line ranges.
 
-        return blame_info
+        Git starts a new range with a header carrying a line count, and only
+        lists a commit's author and time the first time the commit appears.
+        Full messages for all commits are then read with one ``git show``.
+        """
+        # Per range: hash, first and last final line, content lines
+        ranges: list[tuple[str, int, int, list[str]]] = []
+        headers: dict[str, dict[str, str]] = {}
+        current: dict[str, str] = {}
+        for line in output.split("\n"):
+            if line.startswith("\t"):
+                sha, start, _, lines = ranges[-1]
+                lines.append(line[1:])
+                ranges[-1] = (sha, start, start + len(lines) - 1, lines)
+                continue
+            fields = line.split(" ")
+            if len(fields) >= 3 and len(fields[0]) in (40, 64) and fields[1].isdigit():
+                current = headers.setdefault(fields[0], {})
+                if len(fields) == 4:
+                    ranges.append((fields[0], int(fields[2]), int(fields[2]), []))
+            elif fields[0]:
+                current[fields[0]] = line[len(fields[0]) + 1 :]
+
+        messages: dict[str, str] = {}
+        if headers:
+            shown = self.repo.git.show("-s", "--format=%H%x1f%B%x1e", *headers)
+            for record in shown.split("\x1e"):
+                sha, _, message = record.strip("\n").partition("\x1f")
+                messages[sha] = message.strip()
+
+        infos = {
+            sha: CommitInfo(
+                hash=sha,
+                short_hash=sha[:7],
+                author=header.get("author", ""),
+                email=header.get("author-mail", "").strip("<>"),
+                message=messages.get(sha, header.get("summary", "")),
+                timestamp=datetime.fromtimestamp(int(header.get("committer-time", 0))),
+                files_changed=[],
+            )
+            for sha, header in headers.items()
+        }
+        return [(infos[sha], start, end, "\n".join(lines)) for sha, start, end, lines in ranges]
 
     def _commit_to_info(self, commit) -> CommitInfo:
-        """Convert a git commit to CommitInfo."""
+        """Convert a git commit to CommitInfo, reusing earlier conversions."""
+        key = (str(commit.repo.git_dir), commit.hexsha)
+        with _commit_cache_lock:
+            info = _commit_cache.get(key)
+            if info is not None:
+                _commit_cache.move_to_end(key)
+                return info
+
+        info, complete = self._build_commit_info(commit)
+
+        # A failed diff is retried next time rather than cached as empty
+        if complete:
+            with _commit_cache_lock:
+                _commit_cache[key] = info
+                if len(_commit_cache) > GIT_COMMIT_CACHE_SIZE:
+                    _commit_cache.popitem(last=False)
+        return info
+
+    def _build_commit_info(self, commit) -> tuple[CommitInfo, bool]:
+        """Convert a git commit to CommitInfo and report whether its diff succeeded."""
         files_changed: list[GitChange] = []
+        complete = True
 
         try:
             # Get diff with parent
             if commit.parents:
-                diff = commit.parents[0].diff(commit)
-                for d in diff:
-                    change_type = self._diff_type_to_change_type(d.change_type)
-                    files_changed.append(
-                        GitChange(
-                            file_path=d.a_path or d.b_path or "",
-                            change_type=change_type,
-                        )
-                    )
+                files_changed = self._diff_name_status(commit.parents[0].hexsha, commit.hexsha)
         except Exception:
-            pass
+            complete = False
 
-        return CommitInfo(
+        info = CommitInfo(
             hash=commit.hexsha,
             short_hash=commit.hexsha[:7],
             author=commit.author.name,
@@ -246,34 +284,116 @@ class GitTracker:
             timestamp=datetime.fromtimestamp(commit.committed_date),
             files_changed=files_changed,
         )
+        return info, complete
+
+    def _diff_name_status(self, *args: str) -> list[GitChange]:
+        """
+        Run ``git diff --name-status -z`` and parse its output.
+
+        Parsing git's flat output directly avoids building a GitPython
+        ``Diff`` object per changed file.
+
+        Args:
+            *args: Revisions and options selecting what to compare
+
+        Returns:
+            Changed files, renames and copies reported under their old path
+        """
+        output = self.repo.git.diff("-M", "--name-status", "-z", "--no-color", *args)
+        return self._parse_name_status(output)
+
+    def _log_commits(self, limit: int, file_path: str | None = None) -> list[CommitInfo]:
+        """
+        Read commits and their changed files with a single ``git log``.
+
+        Each commit is diffed against its first parent, and root commits
+        report no files, matching ``_commit_to_info``. The results also
+        fill the commit cache.
+
+        Args:
+            limit: Maximum number of commits
+            file_path: Only read commits that touched this file
+
+        Returns:
+            Commits, newest first
+        """
+        # git log shows no files for merges by default, so merges are diffed
+        # against their first parent separately. Asking log for a merge diff
+        # format would need a newer git and, with a path filter, would list
+        # merges that left the file alone.
+        args = [f"--max-count={limit}", "-M", "--name-status", "-z", "--no-color"]
+        if file_path is not None:
+            # --full-diff reports every file of each commit
+            args += ["--full-diff", "--", file_path]
+        output = self.repo.git.log(f"--pretty=format:{_LOG_FORMAT}", *args)
+
+        git_dir = str(self.repo.git_dir)
+        commits: list[CommitInfo] = []
+        for record in output.split("\x1e")[1:]:
+            hexsha, parents, author, email, committed, message, files = record.split("\x1f", 6)
+            if not parents:
+                files_changed = []
+            elif " " in parents:
+                files_changed = self._diff_name_status(parents.split(" ", 1)[0], hexsha)
+            else:
+                files_changed = self._parse_name_status(files.lstrip("\n"))
+            info = CommitInfo(
+                hash=hexsha,
+                short_hash=hexsha[:7],
+                author=author,
+                email=email,
+                message=message.strip(),
+                timestamp=datetime.fromtimestamp(int(committed)),
+                files_changed=files_changed,
+            )
+            commits.append(info)
+
+        with _commit_cache_lock:
+            for info in commits:
+                _commit_cache[(git_dir, info.hash)] = info
+                _commit_cache.move_to_end((git_dir, info.hash))
+            while len(_commit_cache) > GIT_COMMIT_CACHE_SIZE:
+                _commit_cache.popitem(last=False)
+        return commits
+
+    def _parse_name_status(self, output: str) -> list[GitChange]:
+        """Parse NUL-separated ``--name-status`` output into changes."""
+        fields = output.split("\0")
+        changes: list[GitChange] = []
+        i = 0
+        while i + 1 < len(fields) and fields[i]:
+            status = fields[i]
+            changes.append(
+                GitChange(
+                    file_path=fields[i + 1],
+                    change_type=self._diff_type_to_change_type(status[0]),
+                )
+            )
+            # Renames and copies are followed by the new path
+            i += 3 if status[0] in "RC" else 2
+        return changes
 
     def _diff_type_to_change_type(self, diff_type: str) -> ChangeType:
         """Convert git diff type to ChangeType."""
-        mapping = {
-            "A": ChangeType.ADDED,
-            "D": ChangeType.DELETED,
-            "M": ChangeType.MODIFIED,
-            "R": ChangeType.RENAMED,
-        }
-        return mapping.get(diff_type, ChangeType.MODIFIED)
+        return _DIFF_TYPE_MAP.get(diff_type, ChangeType.MODIFIED)
 
     def create_change_record(self, commit_info: CommitInfo) -> ChangeRecord:
         """Create a ChangeRecord from a CommitInfo."""
-        import uuid
-
-        files_changed = [c.file_path for c in commit_info.files_changed]
-        symbols_added = [
-            c.file_path for c in commit_info.files_changed if c.change_type == ChangeType.ADDED
-        ]
-        symbols_removed = [
-            c.file_path for c in commit_info.files_changed if c.change_type == ChangeType.DELETED
-        ]
-        symbols_modified = [
-            c.file_path for c in commit_info.files_changed if c.change_type == ChangeType.MODIFIED
-        ]
+        files_changed: list[str] = []
+        symbols_added: list[str] = []
+        symbols_removed: list[str] = []
+        symbols_modified: list[str] = []
+        for change in commit_info.files_changed:
+            files_changed.append(change.file_path)
+            if change.change_type == ChangeType.ADDED:
+                symbols_added.append(change.file_path)
+            elif change.change_type == ChangeType.DELETED:
+                symbols_removed.append(change.file_path)
+            elif change.change_type == ChangeType.MODIFIED:
+                symbols_modified.append(change.file_path)
 
         return ChangeRecord(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             timestamp=commit_info.timestamp,
             commit_hash=commit_info.hash,
             author=commit_info.author,
@@ -1,5 +1,10 @@
 """Git hooks management for AgentNA."""
 
+import functools
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 POST_COMMIT_HOOK = '''#!/bin/sh
@@ -34,13 +39,32 @@ fi
 
 HOOK_MARKER = "# AgentNA"
 
+# An installed AgentNA hook: its shebang, the marker comment and everything up
+# to the closing top-level "fi"
+_AGENTNA_BLOCK = re.compile(r"(?:^#!/bin/sh\n)?^# AgentNA.*?^fi$\n?", re.DOTALL | re.MULTILINE)
+
+
+# (path, mtime_ns, size) of a hook file to whether it holds the AgentNA marker
+_HOOK_STATE_CACHE_SIZE = 128
+_hook_state_cache: dict[tuple[str, int, int], bool] = {}
+_hook_state_cache_lock = threading.Lock()
+
 
 def get_git_hooks_dir(project_path: Path) -> Path | None:
     """Get the git hooks directory for a project."""
-    git_dir = project_path / ".git"
+    hooks_dir = _find_hooks_dir(str(Path(project_path).resolve()))
+    if hooks_dir is not None:
+        hooks_dir.mkdir(exist_ok=True)
+    return hooks_dir
+
+
+@functools.lru_cache(maxsize=64)
+def _find_hooks_dir(project_path: str) -> Path | None:
+    """Locate the hooks directory for a resolved project path."""
+    git_dir = Path(project_path) / ".git"
     if not git_dir.exists():
         # Check if it's inside a git repo
-        current = project_path.parent
+        current = Path(project_path).parent
         while current != current.parent:
             if (current / ".git").exists():
                 git_dir = current / ".git"
@@ -57,18 +81,34 @@ def get_git_hooks_dir(project_path: Path) -> Path | None:
             if content.startswith("gitdir:"):
                 git_dir = Path(content.split(":", 1)[1].strip())
 
-    hooks_dir = git_dir / "hooks"
-    hooks_dir.mkdir(exist_ok=True)
-    return hooks_dir
+    return git_dir / "hooks"
 
 
 def is_hook_installed(hook_path: Path) -> bool:
     """Check if AgentNA hook is already installed."""
-    if not hook_path.exists():
+    try:
+        stat = os.stat(hook_path)
+    except FileNotFoundError:
         return False
 
-    content = hook_path.read_text()
-    return HOOK_MARKER in content
+    key = (str(hook_path), stat.st_mtime_ns, stat.st_size)
+    with _hook_state_cache_lock:
+        installed = _hook_state_cache.get(key)
+    if installed is None:
+        installed = HOOK_MARKER in hook_path.read_text()
+        with _hook_state_cache_lock:
+            if len(_hook_state_cache) >= _HOOK_STATE_CACHE_SIZE:
+                _hook_state_cache.pop(next(iter(_hook_state_cache)))
+            _hook_state_cache[key] = installed
+    return installed
+
+
+def _forget_hook_state(hook_path: Path) -> None:
+    """Drop cached marker checks for a hook file that is about to change."""
+    path = str(hook_path)
+    with _hook_state_cache_lock:
+        for key in [key for key in _hook_state_cache if key[0] == path]:
+            del _hook_state_cache[key]
 
 
 def install_hook(hooks_dir: Path, hook_name: str, hook_content: str) -> str:
@@ -83,6 +123,8 @@ def install_hook(hooks_dir: Path, hook_name: str, hook_content: str) -> str:
     if is_hook_installed(hook_path):
         return "already_installed"
 
+    _forget_hook_state(hook_path)
+
     if hook_path.exists():
         # Append to existing hook
         existing = hook_path.read_text()
@@ -92,9 +134,12 @@ def install_hook(hooks_dir: Path, hook_name: str, hook_content: str) -> str:
         hook_path.chmod(0o755)
         return "appended"
     else:
-        # Create new hook
-        hook_path.write_text(hook_content)
-        hook_path.chmod(0o755)
+        # Create new hook, executable from the start
+        fd = os.open(hook_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            os.write(fd, hook_content.encode("utf-8"))
+        finally:
+            os.close(fd)
         return "installed"
 
 
@@ -114,25 +159,10 @@ def uninstall_hook(hooks_dir: Path, hook_name: str) -> bool:
     if HOOK_MARKER not in content:
         return False
 
+    _forget_hook_state(hook_path)
+
     # Remove AgentNA section
-    lines = content.split("\n")
-    new_lines = []
-    skip_until_empty = False
-
-    for line in lines:
-        if HOOK_MARKER in line:
-            skip_until_empty = True
-            continue
-        if skip_until_empty:
-            if line.strip() == "" or line.startswith("fi"):
-                skip_until_empty = False
-                if line.startswith("fi"):
-                    continue
-            else:
-                continue
-        new_lines.append(line)
-
-    new_content = "\n".join(new_lines).strip()
+    new_content = _AGENTNA_BLOCK.sub("", content).strip()
 
     if new_content.strip() in ("#!/bin/sh", "#!/bin/bash", ""):
         # Hook is now empty, remove it
@@ -154,18 +184,19 @@ def install_all_hooks(project_path: Path) -> dict[str, str]:
     if not hooks_dir:
         return {"error": "Not a git repository"}
 
-    results = {}
-
     hooks = {
         "post-commit": POST_COMMIT_HOOK,
         "post-merge": POST_MERGE_HOOK,
         "post-checkout": POST_CHECKOUT_HOOK,
     }
 
-    for hook_name, hook_content in hooks.items():
-        results[hook_name] = install_hook(hooks_dir, hook_name, hook_content)
-
-    return results
+    # Each hook file is independent, so slow filesystems are hit in parallel
+    with ThreadPoolExecutor(max_workers=len(hooks)) as executor:
+        futures = {
+            hook_name: executor.submit(install_hook, hooks_dir, hook_name, hook_content)
+            for hook_name, hook_content in hooks.items()
+        }
+        return {hook_name: future.result() for hook_name, future in futures.items()}
 
 
 def uninstall_all_hooks(project_path: Path) -> dict[str, bool]:
@@ -179,12 +210,10 @@ def uninstall_all_hooks(project_path: Path) -> dict[str, bool]:
     if not hooks_dir:
         return {"error": False}
 
-    results = {}
-
-    for hook_name in ["post-commit", "post-merge", "post-checkout"]:
-        results[hook_name] = uninstall_hook(hooks_dir, hook_name)
-
-    return results
+    hook_names = ["post-commit", "post-merge", "post-checkout"]
+    with ThreadPoolExecutor(max_workers=len(hook_names)) as executor:
+        removed = executor.map(lambda hook_name: uninstall_hook(hooks_dir, hook_name), hook_names)
+        return dict(zip(hook_names, removed))
 
 
 def get_hooks_status(project_path: Path) -> dict[str, bool]:
@@ -198,10 +227,9 @@ def get_hooks_status(project_path: Path) -> dict[str, bool]:
     if not hooks_dir:
         return {}
 
-    results = {}
-
-    for hook_name in ["post-commit", "post-merge", "post-checkout"]:
-        hook_path = hooks_dir / hook_name
-        results[hook_name] = is_hook_installed(hook_path)
-
-    return results
+    hook_names = ["post-commit", "post-merge", "post-checkout"]
+    with ThreadPoolExecutor(max_workers=len(hook_names)) as executor:
+        installed = executor.map(
+            lambda hook_name: is_hook_installed(hooks_dir / hook_name), hook_names
+        )
+        return dict(zip(hook_names, installed))
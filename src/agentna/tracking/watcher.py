@@ -1,90 +1,38 @@
 """File watcher for automatic change detection."""
 
-import asyncio
+import os
+import threading
 import time
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
-from watchdog.observers import Observer
+from watchfiles import Change, awatch, watch
 
+from agentna.core.constants import (
+    SYNC_MTIME_MARGIN_S,
+    WATCHER_DECISION_CACHE_SIZE,
+    WATCHER_INDEX_WORKERS,
+)
 from agentna.core.project import Project
 
+# Longest a burst of changes is grouped before it is handed to the callback
+MAX_BATCH_WAIT_MS = 1600
 
-class ChangeHandler(FileSystemEventHandler):
-    """Handle file system events with debouncing."""
 
-    def __init__(
-        self,
-        project: Project,
-        debounce_ms: int = 1000,
-        on_change: Callable[[list[Path]], None] | None = None,
-    ) -> None:
-        self.project = project
-        self.debounce_ms = debounce_ms
-        self.on_change = on_change
-        self.pending_changes: dict[str, float] = defaultdict(float)
-        self._last_process_time = 0.0
-
-    def _should_process(self, path: Path) -> bool:
-        """Check if a file should be processed."""
-        # Skip if file should be ignored
-        if self.project.should_ignore(path):
-            return False
-
-        # Skip if not in include patterns
-        if not self.project.should_include(path):
-            return False
-
-        return True
-
-    def on_modified(self, event: FileSystemEvent) -> None:
-        """Handle file modification."""
-        if event.is_directory:
-            return
-
-        path = Path(event.src_path)
-        if self._should_process(path):
-            self.pending_changes[str(path)] = time.time()
-
-    def on_created(self, event: FileSystemEvent) -> None:
-        """Handle file creation."""
-        if event.is_directory:
-            return
-
-        path = Path(event.src_path)
-        if self._should_process(path):
-            self.pending_changes[str(path)] = time.time()
-
-    def on_deleted(self, event: FileSystemEvent) -> None:
-        """Handle file deletion."""
-        if event.is_directory:
-            return
-
-        path = Path(event.src_path)
-        # Don't check should_include for deleted files
-        if not self.project.should_ignore(path):
-            self.pending_changes[str(path)] = time.time()
-
-    def process_pending(self) -> list[Path]:
-        """Process pending changes after debounce period."""
-        now = time.time()
-        to_process: list[Path] = []
-
-        for path_str, change_time in list(self.pending_changes.items()):
-            if now - change_time >= self.debounce_ms / 1000:
-                to_process.append(Path(path_str))
-                del self.pending_changes[path_str]
-
-        if to_process and self.on_change:
-            self.on_change(to_process)
-
-        return to_process
+class FileWatcher:
+    """Watch project directory for file changes.
 
+    Filesystem events are collected and batched by watchfiles' native
+    watcher. A batch is delivered once no new change has arrived for the
+    debounce period.
 
-class FileWatcher:
-    """Watch project directory for file changes."""
+    Directories are watched one by one, skipping hidden and ignored
+    subtrees such as node_modules, so their events never reach Python.
+    The watch is rebuilt when a new directory appears, and the new
+    directory is scanned again once the rebuilt watch is running to catch
+    files written in between.
+    """
 
     def __init__(
         self,
@@ -101,55 +49,190 @@ class FileWatcher:
             debounce_ms: Debounce period in milliseconds
         """
         self.project = project
+        self.on_change = on_change
         self.debounce_ms = debounce_ms or project.config.watcher.debounce_ms
-        self.handler = ChangeHandler(
-            project=project,
-            debounce_ms=self.debounce_ms,
-            on_change=on_change,
-        )
-        self.observer = Observer()
+        self._stop_event = threading.Event()
         self._running = False
-        self._task: asyncio.Task | None = None
+        # Path to (ignored, included); editors touch the same files repeatedly
+        self._decisions: dict[str, tuple[bool, bool]] = {}
+        # Directories being watched, and new ones listed before the watch
+        # covering them was running, with the time that listing began
+        self._watched: set[Path] = set()
+        self._new_dirs: list[Path] = []
+        self._rebuild_started = 0.0
+        # Files reported just before a rebuild and their mtimes then, which the
+        # rescan skips unless they changed again
+        self._dispatched: dict[Path, float] = {}
+
+    def _should_process(self, change: Change, path: str) -> bool:
+        """Check if a changed path should be reported."""
+        ignored, included = self._decide(path)
+        if ignored:
+            return False
+
+        # Don't check should_include for deleted files
+        if change == Change.deleted:
+            return True
+
+        if Path(path).is_dir():
+            # A new directory is passed on so its subtree gets watched too
+            return change == Change.added and self.project.config.watcher.recursive
+        return included
+
+    def _decide(self, path: str) -> tuple[bool, bool]:
+        """Get whether a path is ignored and included, memoizing the pattern checks."""
+        decision = self._decisions.get(path)
+        if decision is None:
+            file_path = Path(path)
+            ignored = self.project.should_ignore(file_path)
+            decision = (ignored, not ignored and self.project.should_include(file_path))
+            if len(self._decisions) >= WATCHER_DECISION_CACHE_SIZE:
+                del self._decisions[next(iter(self._decisions))]
+            self._decisions[path] = decision
+        return decision
+
+    def _walk(self, top: Path) -> Iterator[tuple[Path, list[str]]]:
+        """Yield each directory under top and its file names, pruning ignored subtrees."""
+        for root, dirs, files in os.walk(top):
+            root_path = Path(root)
+            dirs[:] = [
+                d
+                for d in dirs
+                if not d.startswith(".") and not self.project.should_ignore_dir(root_path / d)
+            ]
+            yield root_path, files
+
+    def _watch_paths(self) -> list[Path]:
+        """Get the directories to watch."""
+        if not self.project.config.watcher.recursive:
+            paths = [self.project.root]
+        else:
+            paths = [root for root, _ in self._walk(self.project.root)]
+        self._watched = set(paths)
+        return paths
+
+    def _watch_options(self) -> dict:
+        """Get the options shared by the blocking and async watchers."""
+        return {
+            "watch_filter": self._should_process,
+            "step": self.debounce_ms,
+            "debounce": max(self.debounce_ms, MAX_BATCH_WAIT_MS),
+            "stop_event": self._stop_event,
+            # Subdirectories are listed by _watch_paths
+            "recursive": False,
+            # Lets _handle rescan new directories once the watch is up even
+            # when nothing else changes
+            "yield_on_timeout": True,
+        }
+
+    def _handle(self, changes: set[tuple[Change, str]]) -> bool:
+        """
+        Pass a batch of changes to the callback.
+
+        Files already inside a new directory are reported with the batch,
+        since the directory was not watched when they were written. The
+        first batch from the rebuilt watch, which may be empty, also reports
+        files written to those directories while the watch was rebuilt.
+
+        Returns:
+            True if new directories have to be watched
+        """
+        started = time.time()
+        to_process: list[Path] = []
+        new_dirs = False
+
+        pending, self._new_dirs = self._new_dirs, []
+        dispatched, self._dispatched = self._dispatched, {}
+        since = self._rebuild_started - SYNC_MTIME_MARGIN_S
+        for top in pending:
+            for root, files in self._walk(top):
+                if root not in self._watched and top not in self._new_dirs:
+                    # Created after the watch list was taken
+                    new_dirs = True
+                    self._new_dirs.append(top)
+                for name in files:
+                    path = root / name
+                    try:
+                        mtime = path.stat().st_mtime
+                    except OSError:
+                        continue
+                    if mtime < since or dispatched.get(path) == mtime:
+                        continue
+                    if self._should_process(Change.added, str(path)):
+                        to_process.append(path)
+
+        for path in dict.fromkeys(path for _, path in changes):
+            path = Path(path)
+            if not path.is_dir():
+                to_process.append(path)
+            elif not path.name.startswith(".") and not self.project.should_ignore_dir(path):
+                new_dirs = True
+                self._new_dirs.append(path)
+                for root, files in self._walk(path):
+                    to_process.extend(
+                        root / name
+                        for name in files
+                        if self._should_process(Change.added, str(root / name))
+                    )
+
+        to_process = list(dict.fromkeys(to_process))
+        if new_dirs:
+            self._rebuild_started = started
+            for path in to_process:
+                try:
+                    self._dispatched[path] = path.stat().st_mtime
+                except OSError:
+                    pass
+        if to_process and self.on_change:
+            self.on_change(to_process)
+        return new_dirs
 
     def start(self) -> None:
         """Start watching for file changes (blocking)."""
-        self.observer.schedule(
-            self.handler,
-            str(self.project.root),
-            recursive=self.project.config.watcher.recursive,
-        )
-        self.observer.start()
+        self._stop_event.clear()
         self._running = True
 
         try:
-            while self._running:
-                self.handler.process_pending()
-                time.sleep(0.5)  # Check for pending changes every 500ms
+            while True:
+                try:
+                    for changes in watch(*self._watch_paths(), **self._watch_options()):
+                        if self._handle(changes):
+                            break
+                    else:
+                        break
+                except FileNotFoundError:
+                    # A directory was removed between listing and watching it
+                    if not self.project.root.exists():
+                        raise
         except KeyboardInterrupt:
-            self.stop()
+            pass
+        finally:
+            self._running = False
 
     async def start_async(self) -> None:
         """Start watching for file changes (async)."""
-        self.observer.schedule(
-            self.handler,
-            str(self.project.root),
-            recursive=self.project.config.watcher.recursive,
-        )
-        self.observer.start()
+        self._stop_event.clear()
         self._running = True
 
         try:
-            while self._running:
-                self.handler.process_pending()
-                await asyncio.sleep(0.5)
-        except asyncio.CancelledError:
-            self.stop()
+            while True:
+                try:
+                    async for changes in awatch(*self._watch_paths(), **self._watch_options()):
+                        if self._handle(changes):
+                            break
+                    else:
+                        break
+                except FileNotFoundError:
+                    # A directory was removed between listing and watching it
+                    if not self.project.root.exists():
+                        raise
+        finally:
+            self._running = False
 
     def stop(self) -> None:
         """Stop watching."""
         self._running = False
-        self.observer.stop()
-        self.observer.join(timeout=5)
+        self._stop_event.set()
 
     @property
     def is_running(self) -> bool:
@@ -164,6 +247,9 @@ def create_watcher_callback(project: Project) -> Callable[[list[Path]], None]:
 
     store = HybridStore(project.chroma_dir, project.graph_path)
     indexer = Indexer(project, store)
+    # Files saved together, e.g. by a formatter or a checkout, are parsed and
+    # embedded in parallel; the store serializes its own writes
+    executor = ThreadPoolExecutor(max_workers=min(WATCHER_INDEX_WORKERS, os.cpu_count() or 1))
 
     def callback(changed_files: list[Path]) -> None:
         """Index changed files."""
@@ -171,14 +257,18 @@ def create_watcher_callback(project: Project) -> Callable[[list[Path]], None]:
 
         console = Console()
 
+        existing: list[Path] = []
         for file_path in changed_files:
             if file_path.exists():
                 console.print(f"[cyan]Indexing:[/cyan] {file_path.name}")
-                indexer.index_file(file_path, force=True)
+                existing.append(file_path)
             else:
                 console.print(f"[yellow]Removing:[/yellow] {file_path.name}")
                 indexer.remove_file(file_path)
 
-        store.save()
+        # Consuming the results passes indexing errors on to the watcher
+        list(executor.map(lambda file_path: indexer.index_file(file_path, force=True), existing))
+
+        store.flush()
 
     return callback
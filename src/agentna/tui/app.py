@@ -1,6 +1,8 @@
 """Main TUI application for AgentNA."""
 
+import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -8,11 +10,13 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Footer, Header, Static, TabbedContent, TabPane, Input, Button
 
 from agentna.core.project import Project
-from agentna.memory.hybrid_store import HybridStore
 from agentna.tui.screens.chat import ChatScreen
 from agentna.tui.screens.dashboard import DashboardScreen
 from agentna.tui.screens.changes import ChangesScreen
 
+if TYPE_CHECKING:
+    from agentna.memory.hybrid_store import HybridStore
+
 
 class AgentNAApp(App):
     """Main TUI application."""
@@ -86,9 +90,12 @@ class AgentNAApp(App):
         return self._project
 
     @property
-    def store(self) -> HybridStore:
+    def store(self) -> "HybridStore":
         """Get the hybrid store."""
         if self._store is None:
+            # Loading the store pulls in ChromaDB, so it's imported on first use
+            from agentna.memory.hybrid_store import HybridStore
+
             self._store = HybridStore(self.project.chroma_dir, self.project.graph_path)
         return self._store
 
@@ -161,7 +168,17 @@ class AgentNAApp(App):
             chat_screen.add_message("USER", query)
 
             self.notify("Searching...")
-            results = self.store.search(query, n_results=5)
+            # A newer query cancels the one still in flight
+            self.run_worker(self._search(query), exclusive=True, group="search")
+
+        except Exception as e:
+            self.notify(f"Error: {e}", severity="error")
+
+    async def _search(self, query: str) -> None:
+        """Search the store in a thread so the UI keeps responding."""
+        try:
+            results = await asyncio.to_thread(self.store.search, query, n_results=5)
+            chat_screen = self.query_one(ChatScreen)
 
             if not results:
                 chat_screen.add_message("ASSISTANT", "No results found. Try a different query.")
@@ -186,17 +203,32 @@ class AgentNAApp(App):
         except Exception as e:
             self.notify(f"Error: {e}", severity="error")
 
-    def action_sync(self) -> None:
+    def action_sync(self, full: bool = False) -> None:
         """Trigger a sync operation."""
+        # A running sync can't be cancelled, so a second one would race it
+        if any(worker.group == "sync" and worker.is_running for worker in self.workers):
+            self.notify("A sync is already running", severity="warning")
+            return
+
+        self.notify("Starting full reindex..." if full else "Starting sync...")
+        self.run_worker(self._sync(full), group="sync")
+
+    async def _sync(self, full: bool) -> None:
+        """Run a sync in a thread so the UI keeps responding."""
         from agentna.indexing import run_sync
 
-        self.notify("Starting sync...")
         try:
-            stats = run_sync(self.project, full=False, quiet=True)
-            self.notify(
-                f"Synced: {stats.get('files_indexed', 0)} files, "
-                f"{stats.get('total_chunks', 0)} chunks"
+            # Sync through the store the screens hold so they see the changes
+            stats = await asyncio.to_thread(
+                run_sync, self.project, full=full, quiet=True, store=self.store
             )
+            if full:
+                self.notify(f"Full sync complete: {stats.get('files_indexed', 0)} files")
+            else:
+                self.notify(
+                    f"Synced: {stats.get('files_indexed', 0)} files, "
+                    f"{stats.get('total_chunks', 0)} chunks"
+                )
             # Refresh dashboard
             self.refresh_all()
         except Exception as e:
@@ -208,8 +240,9 @@ class AgentNAApp(App):
 
     def refresh_all(self) -> None:
         """Refresh all screen data."""
-        # Refresh store
-        self._store = None
+        # Drop cached counts and searches so the screens show current data
+        if self._store is not None:
+            self._store.embeddings.invalidate_caches()
 
         # Notify screens to refresh
         for screen in self.query(DashboardScreen):
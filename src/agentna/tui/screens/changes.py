@@ -1,15 +1,19 @@
 """Changes screen for AgentNA TUI."""
 
+from typing import TYPE_CHECKING
+
 from textual.widgets import Static
 
 from agentna.core.project import Project
-from agentna.memory.hybrid_store import HybridStore
+
+if TYPE_CHECKING:
+    from agentna.memory.hybrid_store import HybridStore
 
 
 class ChangesScreen(Static):
     """Changes screen - shows recent changes."""
 
-    def __init__(self, project: Project, store: HybridStore) -> None:
+    def __init__(self, project: Project, store: "HybridStore") -> None:
         super().__init__()
         self.project = project
         self.store = store
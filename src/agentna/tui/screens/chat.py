@@ -1,12 +1,16 @@
 """Chat screen for AgentNA TUI."""
 
-from textual.widgets import Static
+from typing import TYPE_CHECKING
+
+from textual.widgets import RichLog
 
 from agentna.core.project import Project
-from agentna.memory.hybrid_store import HybridStore
+
+if TYPE_CHECKING:
+    from agentna.memory.hybrid_store import HybridStore
 
 
-class ChatScreen(Static):
+class ChatScreen(RichLog):
     """Chat screen - displays chat history and results."""
 
     DEFAULT_CSS = """
@@ -19,11 +23,11 @@ class ChatScreen(Static):
     }
     """
 
-    def __init__(self, project: Project, store: HybridStore) -> None:
-        super().__init__()
+    def __init__(self, project: Project, store: "HybridStore") -> None:
+        # Messages are appended as lines instead of re-rendering the whole history
+        super().__init__(wrap=True, markup=True)
         self.project = project
         self.store = store
-        self.messages: list[str] = []
 
     def on_mount(self) -> None:
         self.add_message("ASSISTANT", f"Welcome! Ask questions about [bold]{self.project.name}[/]")
@@ -32,22 +36,19 @@ class ChatScreen(Static):
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the chat."""
         if role == "USER":
-            self.messages.append(f"[bold cyan]> {content}[/]")
+            self.write(f"[bold cyan]> {content}[/]")
         elif role == "ASSISTANT":
-            self.messages.append(f"[green]{content}[/]")
+            self.write(f"[green]{content}[/]")
         elif role == "RESULT":
-            self.messages.append(f"  {content}")
+            self.write(f"  {content}")
         elif role == "CODE":
-            self.messages.append(f"[dim]{content}[/]")
+            self.write(f"[dim]{content}[/]")
         else:
-            self.messages.append(content)
-
-        self.update("\n".join(self.messages))
+            self.write(content)
 
     def clear_messages(self) -> None:
         """Clear all messages."""
-        self.messages = []
-        self.update("")
+        self.clear()
 
     def refresh_data(self) -> None:
         pass
@@ -1,11 +1,15 @@
 """Dashboard screen for AgentNA TUI."""
 
+from typing import TYPE_CHECKING
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, Static, DataTable
 
 from agentna.core.project import Project
-from agentna.memory.hybrid_store import HybridStore
+
+if TYPE_CHECKING:
+    from agentna.memory.hybrid_store import HybridStore
 
 
 class StatusPanel(Static):
@@ -29,7 +33,7 @@ class StatusPanel(Static):
     }
     """
 
-    def __init__(self, project: Project, store: HybridStore) -> None:
+    def __init__(self, project: Project, store: "HybridStore") -> None:
         super().__init__()
         self.project = project
         self.store = store
@@ -94,19 +98,7 @@ class QuickActionsPanel(Static):
         if event.button.id == "btn-sync":
             self.app.action_sync()
         elif event.button.id == "btn-full-sync":
-            self._full_sync()
-
-    def _full_sync(self) -> None:
-        """Perform full sync."""
-        from agentna.indexing import run_sync
-
-        self.app.notify("Starting full reindex...")
-        try:
-            stats = run_sync(self.app.project, full=True, quiet=True)
-            self.app.notify(f"Full sync complete: {stats.get('files_indexed', 0)} files")
-            self.app.refresh_all()
-        except Exception as e:
-            self.app.notify(f"Sync failed: {e}", severity="error")
+            self.app.action_sync(full=True)
 
 
 class RecentFilesPanel(Static):
@@ -131,7 +123,7 @@ class RecentFilesPanel(Static):
     }
     """
 
-    def __init__(self, project: Project, store: HybridStore) -> None:
+    def __init__(self, project: Project, store: "HybridStore") -> None:
         super().__init__()
         self.project = project
         self.store = store
@@ -155,15 +147,21 @@ class RecentFilesPanel(Static):
         file_hashes = self.project.get_file_hashes()
         files = list(file_hashes.keys())[:20]  # Show up to 20 files
 
+        # Only symbol names and languages are shown, so skip the content
+        by_file = self.store.embeddings.get_chunks_by_files(files, include=("metadatas",))
+        rows = []
         for file_path in files:
-            chunks = self.store.embeddings.get_chunks_by_file(file_path)
+            chunks = by_file[file_path]
             symbols = [c.symbol_name for c in chunks if c.symbol_name]
             language = chunks[0].language if chunks else "unknown"
-            table.add_row(
-                file_path[:40] + "..." if len(file_path) > 40 else file_path,
-                str(len(symbols)),
-                language,
+            rows.append(
+                (
+                    file_path[:40] + "..." if len(file_path) > 40 else file_path,
+                    str(len(symbols)),
+                    language,
+                )
             )
+        table.add_rows(rows)
 
 
 class DashboardScreen(Container):
@@ -190,7 +188,7 @@ class DashboardScreen(Container):
     }
     """
 
-    def __init__(self, project: Project, store: HybridStore) -> None:
+    def __init__(self, project: Project, store: "HybridStore") -> None:
         super().__init__()
         self.project = project
         self.store = store
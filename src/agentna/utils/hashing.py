@@ -1,8 +1,13 @@
 """Hashing utilities for AgentNA."""
 
 import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from agentna.core.constants import HASH_CACHE_RACY_WINDOW_S
+
 
 def hash_content(content: str | bytes) -> str:
     """
@@ -29,14 +34,64 @@ def hash_file(path: Path | str) -> str:
     Returns:
         Hex digest of the hash
     """
-    path = Path(path)
-    hasher = hashlib.sha256()
+    # file_digest runs the read/update loop in C and releases the GIL
+    with open(Path(path), "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def hash_files_cached(
+    paths: list[Path],
+    keys: list[str],
+    cache: dict[str, list[int | str]],
+    workers: int = 1,
+) -> list[str]:
+    """
+    Hash files, reusing cached hashes while a file's inode, mtime and size match.
 
-    with open(path, "rb") as f:
-        while chunk := f.read(8192):
-            hasher.update(chunk)
+    As in git's racy-clean check, an entry whose mtime is within
+    HASH_CACHE_RACY_WINDOW_S of when it was hashed is not trusted: with
+    coarse timestamps, a same-size rewrite in the same tick keeps the
+    signature. Such files are hashed again until the entry is old enough.
 
-    return hasher.hexdigest()
+    Args:
+        paths: Paths to the files
+        keys: Cache key for each file, usually its project-relative path
+        cache: Map of key to [st_ino, st_mtime_ns, st_size, digest, hashed_at_ns],
+            updated in place
+        workers: Threads hashing the files that missed the cache
+
+    Returns:
+        Hex digest of each file, in the order of paths
+    """
+    # Taken before any file is read, so later writes count as racy
+    hashed_at = time.time_ns()
+    window = int(HASH_CACHE_RACY_WINDOW_S * 1e9)
+    digests: list[str] = []
+    misses: list[tuple[int, list[int]]] = []
+    for i, (path, key) in enumerate(zip(paths, keys)):
+        # Stat before hashing: if the file changes meanwhile, the next run sees a new signature
+        st = os.stat(path)
+        signature = [st.st_ino, st.st_mtime_ns, st.st_size]
+        entry = cache.get(key)
+        if (
+            entry is not None
+            and entry[:3] == signature
+            and len(entry) > 4
+            and st.st_mtime_ns < entry[4] - window
+        ):
+            digests.append(entry[3])
+        else:
+            digests.append("")
+            misses.append((i, signature))
+
+    if misses:
+        # file_digest releases the GIL, so changed files are hashed in parallel
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(misses)))) as executor:
+            hashed = executor.map(hash_file, [paths[i] for i, _ in misses])
+            for (i, signature), digest in zip(misses, hashed):
+                cache[keys[i]] = [*signature, digest, hashed_at]
+                digests[i] = digest
+    return digests
 
 
 def generate_chunk_id(file_path: str, line_start: int, line_end: int) -> str:
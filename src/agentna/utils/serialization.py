@@ -0,0 +1,42 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as bytes or str
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON.
+
+    Args:
+        obj: Object to serialize
+        default: Optional converter for objects JSON can't represent
+
+    Returns:
+        The encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=default
+    ).encode("utf-8")
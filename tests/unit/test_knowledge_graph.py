@@ -0,0 +1,140 @@
+"""Tests for the knowledge graph's snapshot and write-ahead log."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from agentna.memory import knowledge_graph
+from agentna.memory.knowledge_graph import KnowledgeGraph
+from agentna.memory.models import GraphNode, Relationship, RelationType, SymbolType
+
+
+def _node(name: str, file_path: str = "a.py") -> GraphNode:
+    return GraphNode(
+        id=f"{file_path}:{name}",
+        node_type=SymbolType.FUNCTION,
+        name=name,
+        file_path=file_path,
+    )
+
+
+def _edge(source: str, target: str) -> Relationship:
+    return Relationship(source_id=source, target_id=target, relation_type=RelationType.CALLS)
+
+
+def test_torn_tail_is_cut_before_next_append(tmp_path: Path) -> None:
+    graph_path = tmp_path / "graph.json"
+    graph = KnowledgeGraph(graph_path)
+    graph.add_node(_node("f"))
+    graph.flush()
+
+    # Simulate a crash in the middle of appending a record
+    with open(graph.wal_path, "ab") as f:
+        f.write(b'["n","a.py:g",{"node_ty')
+
+    graph = KnowledgeGraph(graph_path)
+    assert graph.node_count() == 1
+    graph.add_node(_node("h"))
+    graph.flush()
+
+    reloaded = KnowledgeGraph(graph_path)
+    assert {node.name for node in reloaded.iter_nodes()} == {"f", "h"}
+
+
+def test_read_only_load_leaves_files_alone(tmp_path: Path) -> None:
+    graph_path = tmp_path / "graph.json"
+    graph = KnowledgeGraph(graph_path)
+    graph.add_node(_node("f"))
+    graph.flush()
+    with open(graph.wal_path, "ab") as f:
+        f.write(b'["n"')
+    size = graph.wal_path.stat().st_size
+
+    reader = KnowledgeGraph(graph_path, read_only=True)
+    reader.add_node(_node("g"))
+    reader.save()
+
+    assert reader.node_count() == 2
+    assert graph.wal_path.stat().st_size == size
+    assert not graph_path.exists()
+
+
+def test_flushed_log_is_replayed_without_snapshot(tmp_path: Path) -> None:
+    graph_path = tmp_path / "graph.json"
+    graph = KnowledgeGraph(graph_path)
+    graph.add_nodes([_node("f"), _node("g")])
+    graph.add_relationship(_edge("a.py:f", "a.py:g"))
+    graph.remove_node("a.py:g")
+    graph.add_node(_node("g"))
+    graph.flush()
+
+    assert not graph_path.exists()
+    reloaded = KnowledgeGraph(graph_path)
+    assert {node.name for node in reloaded.iter_nodes()} == {"f", "g"}
+    assert reloaded.edge_count() == 0
+
+
+def test_crash_after_rotating_log_finishes_compaction(tmp_path: Path) -> None:
+    graph_path = tmp_path / "graph.json"
+    graph = KnowledgeGraph(graph_path)
+    graph.add_node(_node("f"))
+    graph.save()
+    graph.add_node(_node("g"))
+    graph.flush()
+    # The log is moved aside, then the process dies before the snapshot
+    graph._rotate_log()
+    graph.add_node(_node("h"))
+    graph.flush()
+
+    reloaded = KnowledgeGraph(graph_path)
+    assert {node.name for node in reloaded.iter_nodes()} == {"f", "g", "h"}
+    assert not reloaded._old_wal_path.exists()
+    assert {node.name for node in KnowledgeGraph(graph_path).iter_nodes()} == {"f", "g", "h"}
+
+
+def test_log_covered_by_snapshot_is_not_replayed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    graph_path = tmp_path / "graph.json"
+    graph = KnowledgeGraph(graph_path)
+    graph.add_node(_node("f"))
+    graph.flush()
+    log = graph.wal_path.read_bytes()
+    graph.save()
+    # The snapshot was written but the moved log was not deleted yet
+    graph._old_wal_path.write_bytes(log)
+
+    applied: list[list[object]] = []
+    apply = KnowledgeGraph._apply
+    monkeypatch.setattr(
+        KnowledgeGraph, "_apply", lambda self, record: (applied.append(record), apply(self, record))
+    )
+    reloaded = KnowledgeGraph(graph_path)
+    assert applied == []
+    assert reloaded.node_count() == 1
+    assert not reloaded._old_wal_path.exists()
+
+
+def test_background_compaction_keeps_concurrent_mutations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(knowledge_graph, "GRAPH_WAL_MAX_RECORDS", 5)
+    graph_path = tmp_path / "graph.json"
+    graph = KnowledgeGraph(graph_path)
+
+    def write(prefix: str) -> None:
+        for i in range(200):
+            graph.add_node(_node(f"{prefix}{i}"))
+            graph.flush()
+
+    threads = [threading.Thread(target=write, args=(prefix,)) for prefix in "abc"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    graph.close()
+
+    assert graph_path.exists()
+    reloaded = KnowledgeGraph(graph_path)
+    assert reloaded.node_count() == 600